@@ -15,17 +15,63 @@ Modules:
         operations with pseudo-random numbers generated by a modified
         Wichmann-Hill algorithm generator
     xor_scrambler: simple data scrambler using per-byte XORing with 0xFF (255d)
+
+The modules are not imported together with the package, thus 'import
+codecs_lib' is almost free. With Python 3.7+ (PEP 562) a module is imported
+on the first access as an attribute of the package, e.g. 'codecs_lib.cobs';
+with Python 3.6 the modules must be imported explicitly, e.g. 'import
+codecs_lib.cobs' or 'from codecs_lib import cobs'.
 """
 
 __project__ = 'Python data manipulation codecs'
-__version_info__= (1, 0, 1)
+__version_info__= (1, 1, 0)
 __version_suffix__= '-rc1'
 __version__= ''.join(['.'.join(map(str, __version_info__)), __version_suffix__])
-__date__ = '19-04-2023'
+__date__ = '18-10-2026'
 __status__ = 'Development'
 __author__ = 'Anton Azarov'
 __maintainer__ = 'a.azarov@diagnoptics.com'
 __license__ = 'Public Domain'
 __copyright__ = 'Diagnoptics Technologies B.V.'
 
-__all__ = ['cobs', 'vigenere', 'wichmann_hill', 'xor_scrambler']
\ No newline at end of file
+__all__ = ['cobs', 'vigenere', 'wichmann_hill', 'xor_scrambler']
+
+#functions
+
+def __getattr__(Name: str) -> object:
+    """
+    Imports a module of the library on the first access to it as an attribute
+    of the package (PEP 562). The module is cached as the package's attribute
+    by the import system, thus this function is called only once per module.
+
+    Signature:
+        str -> module
+    
+    Args:
+        Name: str; name of the attribute being looked up
+    
+    Returns:
+        module: the imported module of the library
+    
+    Raises:
+        AttributeError: not a module of the library
+    
+    Version 1.0.0.0
+    """
+    if Name in __all__:
+        import importlib
+        return importlib.import_module('.' + Name, __name__)
+    raise AttributeError('module {!r} has no attribute {!r}'.format(__name__,
+                                                                        Name))
+
+def __dir__() -> list:
+    """
+    Lists the attributes of the package including the not yet imported
+    modules of the library.
+
+    Signature:
+        None -> list(str)
+    
+    Version 1.0.0.0
+    """
+    return sorted(set(globals()) | set(__all__))
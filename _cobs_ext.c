@@ -0,0 +1,258 @@
+/*
+ * Module codecs_lib._cobs_ext
+ *
+ * Optional compiled core of the Consistent Overhead Byte Stuffing (COBS)
+ * encoding and decoding used by the module codecs_lib.cobs. Implements exactly
+ * the same semantics as the pure Python methods COBS_Coder._encode() and
+ * COBS_Coder._decode(); the input checks and the exceptions raised on an
+ * improper input are left to the Python wrapper.
+ *
+ * The global interpreter lock (GIL) is released while the buffers of at least
+ * GIL_THRESHOLD bytes are processed, so the calls from several threads run in
+ * parallel. The functions keep no state, thus they are thread-safe; the input
+ * buffer must not be modified by another thread during the call.
+ *
+ * Functions:
+ *     encode(Data):
+ *         buffer -> bytes
+ *     decode(Data):
+ *         buffer -> bytes
+ *     find_zero(Data):
+ *         buffer -> int >= -1
+ *
+ * Constants:
+ *     GIL_THRESHOLD: int > 0; minimal length of the data processed without
+ *         the GIL
+ *
+ * Version 1.2.0.0
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <string.h>
+
+/* minimal length of the data processed with the GIL released - on the shorter
+   data the overhead of the release / re-acquisition outweighs the gain */
+#define GIL_THRESHOLD 8192
+
+/* helper functions - the actual algorithms working on the raw memory */
+
+static Py_ssize_t
+encode_core(const unsigned char *Source, Py_ssize_t Length,
+            unsigned char *Target)
+{
+    /* Target must have room for Length + (Length + 253) / 254 + 1 bytes */
+    /* a virtual zero is assumed at Source[Length]; each block is found by
+       memchr() within the next 254 bytes and copied by memcpy() */
+    Py_ssize_t Index = 0;
+    Py_ssize_t Written = 0;
+    Py_ssize_t Limit;
+    Py_ssize_t Run;
+    const unsigned char *Zero;
+
+    while (Index <= Length) {
+        Limit = Length - Index;
+        if (Limit > 254) {
+            Limit = 254;
+        }
+        Zero = (const unsigned char *)memchr(Source + Index, 0, Limit);
+        if (Zero != NULL) {
+            Run = Zero - (Source + Index);
+        }
+        else if (Limit < 254) {
+            Run = Limit; /* terminated by the virtual zero */
+        }
+        else {
+            Target[Written] = 255;
+            memcpy(Target + Written + 1, Source + Index, 254);
+            Written += 255;
+            Index += 254;
+            if (Index == Length) {
+                /* packet ends with 254*(k>0) non-zero bytes - no trailing
+                   code */
+                return Written;
+            }
+            continue;
+        }
+        Target[Written] = (unsigned char)(Run + 1);
+        memcpy(Target + Written + 1, Source + Index, Run);
+        Written += Run + 1;
+        Index += Run + 1;
+    }
+    return Written;
+}
+
+static Py_ssize_t
+decode_core(const unsigned char *Source, Py_ssize_t Length,
+            unsigned char *Target)
+{
+    /* Target must have room for Length bytes */
+    Py_ssize_t Index = 0;
+    Py_ssize_t Written = 0;
+    Py_ssize_t BlockLength;
+    unsigned char Code;
+
+    while (Index < Length) {
+        Code = Source[Index++];
+        if (Code > 1) {
+            BlockLength = Code - 1;
+            if (BlockLength > Length - Index) {
+                BlockLength = Length - Index;
+            }
+            memcpy(Target + Written, Source + Index, BlockLength);
+            Written += BlockLength;
+            Index += Code - 1;
+        }
+        if ((Code < 255) && (Index < Length)) {
+            Target[Written++] = 0;
+        }
+    }
+    return Written;
+}
+
+/* public API */
+
+PyDoc_STRVAR(encode_doc,
+"encode(Data)\n"
+"--\n\n"
+"Encodes a buffer using COBS algorithm without input checks. Note that the\n"
+"frame delimiter b'\\x00' is not added!\n\n"
+"Signature:\n"
+"    buffer -> bytes");
+
+static PyObject *
+cobs_encode(PyObject *module, PyObject *Data)
+{
+    Py_buffer View;
+    PyObject *Result;
+    Py_ssize_t Written;
+
+    if (PyObject_GetBuffer(Data, &View, PyBUF_SIMPLE) < 0) {
+        return NULL;
+    }
+    Result = PyBytes_FromStringAndSize(NULL,
+                                        View.len + (View.len + 253) / 254 + 1);
+    if (Result == NULL) {
+        PyBuffer_Release(&View);
+        return NULL;
+    }
+    if (View.len >= GIL_THRESHOLD) {
+        Py_BEGIN_ALLOW_THREADS
+        Written = encode_core((const unsigned char *)View.buf, View.len,
+                              (unsigned char *)PyBytes_AS_STRING(Result));
+        Py_END_ALLOW_THREADS
+    }
+    else {
+        Written = encode_core((const unsigned char *)View.buf, View.len,
+                              (unsigned char *)PyBytes_AS_STRING(Result));
+    }
+    PyBuffer_Release(&View);
+    if (_PyBytes_Resize(&Result, Written) < 0) {
+        return NULL;
+    }
+    return Result;
+}
+
+PyDoc_STRVAR(decode_doc,
+"decode(Data)\n"
+"--\n\n"
+"Decodes a buffer using COBS algorithm. The data must be already stripped of\n"
+"the leading and tailing delimiters and checked for the absence of the zero\n"
+"characters.\n\n"
+"Signature:\n"
+"    buffer -> bytes");
+
+static PyObject *
+cobs_decode(PyObject *module, PyObject *Data)
+{
+    Py_buffer View;
+    PyObject *Result;
+    Py_ssize_t Written;
+
+    if (PyObject_GetBuffer(Data, &View, PyBUF_SIMPLE) < 0) {
+        return NULL;
+    }
+    Result = PyBytes_FromStringAndSize(NULL, View.len);
+    if (Result == NULL) {
+        PyBuffer_Release(&View);
+        return NULL;
+    }
+    if (View.len >= GIL_THRESHOLD) {
+        Py_BEGIN_ALLOW_THREADS
+        Written = decode_core((const unsigned char *)View.buf, View.len,
+                              (unsigned char *)PyBytes_AS_STRING(Result));
+        Py_END_ALLOW_THREADS
+    }
+    else {
+        Written = decode_core((const unsigned char *)View.buf, View.len,
+                              (unsigned char *)PyBytes_AS_STRING(Result));
+    }
+    PyBuffer_Release(&View);
+    if (_PyBytes_Resize(&Result, Written) < 0) {
+        return NULL;
+    }
+    return Result;
+}
+
+PyDoc_STRVAR(find_zero_doc,
+"find_zero(Data)\n"
+"--\n\n"
+"Finds the first zero character in a buffer. Returns its index, or -1 if\n"
+"there is no zero character in the buffer.\n\n"
+"Signature:\n"
+"    buffer -> int >= -1");
+
+static PyObject *
+cobs_find_zero(PyObject *module, PyObject *Data)
+{
+    Py_buffer View;
+    const unsigned char *Zero;
+    Py_ssize_t Result;
+
+    if (PyObject_GetBuffer(Data, &View, PyBUF_SIMPLE) < 0) {
+        return NULL;
+    }
+    if (View.len >= GIL_THRESHOLD) {
+        Py_BEGIN_ALLOW_THREADS
+        Zero = (const unsigned char *)memchr(View.buf, 0, View.len);
+        Py_END_ALLOW_THREADS
+    }
+    else {
+        Zero = (const unsigned char *)memchr(View.buf, 0, View.len);
+    }
+    Result = (Zero == NULL) ? -1 : Zero - (const unsigned char *)View.buf;
+    PyBuffer_Release(&View);
+    return PyLong_FromSsize_t(Result);
+}
+
+/* module definition */
+
+static PyMethodDef cobs_methods[] = {
+    {"encode", (PyCFunction)cobs_encode, METH_O, encode_doc},
+    {"decode", (PyCFunction)cobs_decode, METH_O, decode_doc},
+    {"find_zero", (PyCFunction)cobs_find_zero, METH_O, find_zero_doc},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef cobs_module = {
+    PyModuleDef_HEAD_INIT,
+    "_cobs_ext",
+    "Optional compiled core of the COBS encoding / decoding.",
+    -1,
+    cobs_methods
+};
+
+PyMODINIT_FUNC
+PyInit__cobs_ext(void)
+{
+    PyObject *Module = PyModule_Create(&cobs_module);
+
+    if (Module == NULL) {
+        return NULL;
+    }
+    if (PyModule_AddIntConstant(Module, "GIL_THRESHOLD", GIL_THRESHOLD) < 0) {
+        Py_DECREF(Module);
+        return NULL;
+    }
+    return Module;
+}
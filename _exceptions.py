@@ -0,0 +1,189 @@
+#usr/bin/python3
+"""
+Module codecs_lib._exceptions
+
+Selects the exception classes raised by the library modules. By default these
+are the classes from the module introspection_lib.base_exceptions, which
+analyze the call stack and provide the truncated traceback. If that library
+is not installed, or if the environment variable CODECS_LIB_FAST_EXCEPTIONS is
+set to a non-empty value other than '0' before the first import of any codec
+module, the lightweight classes defined here are used instead. They have the
+same call signatures (including the SkipFrames argument, which is ignored) and
+the same base built-in exception classes, but they skip the traceback
+analysis, and introspection_lib is not even imported.
+
+The lightweight classes are meant for the hot loops with the frequent invalid
+input, e.g. fuzzing or validation. The client code should catch the built-in
+TypeError or ValueError, which work in both modes.
+
+Classes:
+    UT_Exception
+    UT_TypeError
+    UT_ValueError
+"""
+
+__version__ = "1.0.0.0"
+__date__ = "18-10-2026"
+__status__ = "Production"
+
+#imports
+
+#+ standard libraries
+
+import os
+import reprlib
+
+from typing import Any
+
+#globals
+
+#+ flag if the lightweight exceptions are requested by the environment
+
+FAST_EXCEPTIONS = os.environ.get('CODECS_LIB_FAST_EXCEPTIONS', '') not in (
+                                                                    '', '0')
+
+#+ flag if the exceptions with the traceback analysis are actually used
+
+INTROSPECTION_USED = False
+
+if not FAST_EXCEPTIONS:
+    try:
+        from introspection_lib.base_exceptions import UT_Exception
+        from introspection_lib.base_exceptions import UT_TypeError
+        from introspection_lib.base_exceptions import UT_ValueError
+        INTROSPECTION_USED = True
+    except ImportError:
+        pass
+
+#+ truncated representation of the offending values in the messages
+
+_REPR = reprlib.Repr()
+
+_REPR.maxstring = 60
+
+_REPR.maxother = 60
+
+#functions
+
+def _getValueRepr(Value: Any) -> str:
+    """
+    Returns a short representation of an arbitrary value, which is computed
+    in constant time even for a large byte-string or bytes array.
+
+    Signature:
+        type A -> str
+
+    Version 1.0.0.0
+    """
+    if isinstance(Value, (bytes, bytearray)) and len(Value) > 40:
+        Result = '{!r}...'.format(bytes(Value[:40]))
+    else:
+        Result = _REPR.repr(Value)
+    return Result
+
+#classes
+
+if not INTROSPECTION_USED:
+    class UT_Exception(Exception):
+        """
+        Lightweight base class of the library exceptions without the traceback
+        analysis.
+
+        Methods:
+            appendMessage(Message):
+                str -> None
+
+        Version 1.0.0.0
+        """
+
+        def __init__(self, Message: str, *args, SkipFrames: int = 0,
+                                                            **kwargs) -> None:
+            """
+            Initialization. The extra arguments are ignored.
+
+            Signature:
+                str/, *args, *, int, **kwargs/ -> None
+
+            Args:
+                Message: str; the error message
+                *args: (optional) any; ignored
+                SkipFrames: (keyword) int; ignored, for the compatibility only
+                **kwargs: (keyword) any; ignored
+
+            Version 1.0.0.0
+            """
+            super().__init__(Message)
+
+        def appendMessage(self, Message: str) -> None:
+            """
+            Appends the additional information to the error message.
+
+            Signature:
+                str -> None
+
+            Args:
+                Message: str; the text to be appended
+
+            Version 1.0.0.0
+            """
+            self.args = ('{} {}'.format(self.args[0], Message), )
+
+    class UT_TypeError(UT_Exception, TypeError):
+        """
+        Lightweight sub-class of TypeError without the traceback analysis.
+
+        Version 1.0.0.0
+        """
+
+        def __init__(self, Value: Any, Types: Any, *args, SkipFrames: int = 0,
+                                                            **kwargs) -> None:
+            """
+            Initialization. Forms the error message from the offending value
+            and the expected type(s).
+
+            Signature:
+                type A, type OR tuple(type)/, *args, *, int, **kwargs/ -> None
+
+            Args:
+                Value: type A; the value of the wrong type
+                Types: type OR tuple(type); the expected type(s)
+                *args: (optional) any; ignored
+                SkipFrames: (keyword) int; ignored, for the compatibility only
+                **kwargs: (keyword) any; ignored
+
+            Version 1.0.0.0
+            """
+            if not isinstance(Types, tuple):
+                Types = (Types, )
+            Names = ' or '.join(getattr(Type, '__name__', str(Type))
+                                                            for Type in Types)
+            super().__init__('{} is not an instance of {}'.format(
+                                                _getValueRepr(Value), Names))
+
+    class UT_ValueError(UT_Exception, ValueError):
+        """
+        Lightweight sub-class of ValueError without the traceback analysis.
+
+        Version 1.0.0.0
+        """
+
+        def __init__(self, Value: Any, Message: str, *args,
+                                    SkipFrames: int = 0, **kwargs) -> None:
+            """
+            Initialization. Forms the error message from the offending value
+            and the description of the acceptable values.
+
+            Signature:
+                type A, str/, *args, *, int, **kwargs/ -> None
+
+            Args:
+                Value: type A; the wrong value
+                Message: str; the description of the acceptable values
+                *args: (optional) any; ignored
+                SkipFrames: (keyword) int; ignored, for the compatibility only
+                **kwargs: (keyword) any; ignored
+
+            Version 1.0.0.0
+            """
+            super().__init__('{} is wrong value, expected {}'.format(
+                                                _getValueRepr(Value), Message))
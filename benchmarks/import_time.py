@@ -0,0 +1,199 @@
+#usr/bin/python3
+"""
+Module codecs_lib.benchmarks.import_time
+
+Benchmark of the import time of the library package and of its modules. Each
+import is measured in a fresh Python interpreter (sub-process), only the import
+statement itself is timed, not the interpreter start-up. The results are
+written into a JSON file of the same structure as by the run_benchmarks.py
+script, thus they can be compared using the same comparison option.
+
+Attention: this module is designed to be executable.
+
+Usage:
+    python3 import_time.py [--output PATH] [--repeat N]
+        [--compare BASELINE] [--threshold FRACTION]
+
+Functions:
+    measureImport(Module, Repeat):
+        str, int > 0 -> dict
+    runImportBenchmarks(Repeat):
+        int > 0 -> dict
+"""
+
+__version__ = "1.0.0.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+
+#imports
+
+#+ standard libraries
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+
+from typing import List, Optional, Tuple
+
+#+ shared helpers of the benchmark suite
+
+from run_benchmarks import ROOT_FOLDER, FORMAT_VERSION, _getMetadata
+from run_benchmarks import _getDefaultPath, compareResults, _printComparison
+
+#globals
+
+MODULES = ('codecs_lib', 'codecs_lib.cobs', 'codecs_lib.vigenere',
+            'codecs_lib.wichmann_hill', 'codecs_lib.xor_scrambler')
+
+#+ executed by the sub-process: import time, number of the newly loaded
+#+ modules and (optionally) the peak memory allocation
+
+CHILD_CODE = '''
+import sys
+import time
+sys.path.insert(0, {Root!r})
+Loaded = len(sys.modules)
+if {Trace!r}:
+    import tracemalloc
+    tracemalloc.start()
+    Loaded = len(sys.modules)
+Start = time.perf_counter()
+__import__({Module!r})
+Elapsed = time.perf_counter() - Start
+Peak = tracemalloc.get_traced_memory()[1] if {Trace!r} else 0
+print(Elapsed, len(sys.modules) - Loaded, Peak)
+'''
+
+#functions
+
+def _runChild(Module: str, Trace: bool) -> Tuple[float, int, int]:
+    """
+    Imports the module in a fresh interpreter and returns the time of the
+    import, the number of the loaded modules and the peak allocation.
+
+    Signature:
+        str, bool -> tuple(float, int, int)
+
+    Raises:
+        subprocess.CalledProcessError: the import has failed
+
+    Version 1.0.0.0
+    """
+    strCode = CHILD_CODE.format(Root = ROOT_FOLDER, Module = Module,
+                                                                Trace = Trace)
+    strOutput = subprocess.run([sys.executable, '-c', strCode],
+                            stdout = subprocess.PIPE, check = True,
+                            universal_newlines = True).stdout.split()
+    return float(strOutput[0]), int(strOutput[1]), int(strOutput[2])
+
+def measureImport(Module: str, Repeat: int = 10) -> dict:
+    """
+    Measures the import time of a single module as the best of the repeated
+    imports in the fresh interpreters. The peak memory allocation is measured
+    in a separate run with tracemalloc enabled.
+
+    Signature:
+        str/, int > 0/ -> dict
+
+    Args:
+        Module: str; the fully qualified name of the module to import
+        Repeat: (optional) int > 0; number of the timed imports, defaults to
+            10
+
+    Returns:
+        dict: the result with the same keys as by run_benchmarks.measureCase(),
+            the number of the loaded modules is stored as 'items'
+
+    Version 1.0.0.0
+    """
+    lstTimes = []
+    for _ in range(Repeat):
+        fTime, iLoaded, _ = _runChild(Module, False)
+        lstTimes.append(fTime)
+    _, _, iPeak = _runChild(Module, True)
+    fBest = min(lstTimes)
+    Result = {'name' : 'import/{}'.format(Module), 'codec' : Module,
+                'operation' : 'import', 'mode' : None, 'input' : None,
+                'size' : None, 'items' : iLoaded, 'bytes' : None,
+                'loops' : 1, 'time' : fBest,
+                'mean' : sum(lstTimes) / len(lstTimes), 'mb_per_s' : None,
+                'items_per_s' : None, 'peak_alloc' : iPeak}
+    return Result
+
+def runImportBenchmarks(Repeat: int = 10) -> dict:
+    """
+    Measures the import time of the package and of each of its modules.
+
+    Signature:
+        /int > 0/ -> dict
+
+    Args:
+        Repeat: (optional) int > 0; number of the timed imports per module,
+            defaults to 10
+
+    Returns:
+        dict: with the keys 'format', 'metadata' and 'results', see
+            run_benchmarks.runBenchmarks()
+
+    Version 1.0.0.0
+    """
+    lstResults = []
+    for strModule in MODULES:
+        dictResult = measureImport(strModule, Repeat)
+        lstResults.append(dictResult)
+        print('{:<40} {:8.2f} ms {:4d} modules {:10d} B peak'.format(
+                    dictResult['name'], dictResult['time'] * 1000,
+                            dictResult['items'], dictResult['peak_alloc']))
+        sys.stdout.flush()
+    Result = {'format' : FORMAT_VERSION, 'metadata' : _getMetadata(),
+                                                    'results' : lstResults}
+    return Result
+
+def main(Arguments: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point, see the module docstring.
+
+    Signature:
+        /list(str) OR None/ -> int
+
+    Returns:
+        int: 0 - no regressions, 1 - a regression is found
+
+    Version 1.0.0.0
+    """
+    objParser = argparse.ArgumentParser(
+                            description = 'codecs_lib import time benchmark')
+    objParser.add_argument('--output', default = None,
+                                help = 'path of the JSON results file')
+    objParser.add_argument('--repeat', type = int, default = 10,
+                                help = 'number of the timed imports')
+    objParser.add_argument('--compare', default = None, metavar = 'BASELINE',
+                                help = 'baseline JSON results file')
+    objParser.add_argument('--threshold', type = float, default = 0.1,
+                                help = 'allowed relative slow-down')
+    objArgs = objParser.parse_args(Arguments)
+    dictResults = runImportBenchmarks(objArgs.repeat)
+    strPath = objArgs.output or _getDefaultPath(dictResults).replace('.json',
+                                                            '_import.json')
+    strFolder = os.path.dirname(os.path.abspath(strPath))
+    os.makedirs(strFolder, exist_ok = True)
+    with open(strPath, 'wt') as fFile:
+        json.dump(dictResults, fFile, indent = 1)
+    print('Results are written into {}'.format(strPath))
+    if objArgs.compare is None:
+        return 0
+    with open(objArgs.compare, 'rt') as fFile:
+        dictBaseline = json.load(fFile)
+    lstComparison = compareResults(dictBaseline, dictResults,
+                                                            objArgs.threshold)
+    _printComparison(lstComparison)
+    iRegressions = sum(1 for dictItem in lstComparison
+                                                    if dictItem['regression'])
+    print('{} cases compared, {} regressions'.format(len(lstComparison),
+                                                                iRegressions))
+    return 1 if iRegressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,728 @@
+#usr/bin/python3
+"""
+Module codecs_lib.benchmarks.run_benchmarks
+
+Standalone performance benchmark suite of the library codecs. Measures the
+throughput (MB/s and items/s) and the peak memory allocated per call of the
+encoding and decoding methods of the classes COBS_Coder, VigenereCoder,
+WH_Coder and XOR_Coder across the payload sizes and the input types, and
+writes the results into a JSON file, which can be compared with the results
+obtained on another commit in order to catch the performance regressions.
+
+Attention: this module is designed to be executable.
+
+Usage:
+    python3 run_benchmarks.py [--quick] [--filter TEXT] [--output PATH]
+        [--repeat N] [--min-time SECONDS] [--compare BASELINE [RESULTS]]
+        [--threshold FRACTION]
+
+    Without --compare the benchmarks are run and the results are written into
+    the output file (by default, into the sub-folder 'results' named after the
+    time and the git commit). With --compare BASELINE the benchmarks are run
+    and compared with the baseline results; with --compare BASELINE RESULTS
+    two existing results files are compared without running anything. The
+    exit code is 1 if any case is slower (or allocates more) than the
+    baseline by more than the threshold fraction (0.1 by default).
+
+Functions:
+    getCases(Quick, Filter):
+        bool, str OR None -> list(dict)
+    measureCase(Case, Repeat, MinTime):
+        dict, int > 0, float > 0 -> dict
+    runBenchmarks(Quick, Filter, Repeat, MinTime):
+        bool, str OR None, int > 0, float > 0 -> dict
+    compareResults(Baseline, Results, Threshold):
+        dict, dict, float >= 0 -> list(dict)
+"""
+
+__version__ = "1.0.0.0"
+__date__ = "18-10-2026"
+__status__ = "Development"
+
+#imports
+
+#+ standard libraries
+
+import os
+import sys
+import gc
+import json
+import time
+import random
+import platform
+import argparse
+import datetime
+import subprocess
+import tracemalloc
+
+from typing import Any, Callable, List, Optional
+
+#+ libraries to be benchmarked
+
+BENCH_FOLDER = os.path.dirname(os.path.realpath(__file__))
+LIB_FOLDER = os.path.dirname(BENCH_FOLDER)
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+import codecs_lib
+import codecs_lib.cobs as cobs
+from codecs_lib.cobs import COBS_Coder
+from codecs_lib.vigenere import VigenereCoder
+from codecs_lib.wichmann_hill import WH_Coder
+from codecs_lib.xor_scrambler import XOR_Coder
+
+#globals
+
+RESULTS_FOLDER = os.path.join(BENCH_FOLDER, 'results')
+
+FORMAT_VERSION = 1 #version of the JSON results structure
+
+SIZES = (64, 4096, 1048576) #payload sizes in bytes (items for WH_Coder)
+
+QUICK_SIZES = (64, 4096)
+
+WH_SIZES = (64, 4096, 65536)
+
+FRAMES_NUMBER = 1000 #number of the frames in the COBS batch cases
+
+ZERO_FREE_SIZES = (1024, 65536, 16777216) #COBS encoding without zeroes
+
+QUICK_ZERO_FREE_SIZES = (1024, 65536)
+
+#+ translation table setting the lowest bit, i.e. replacing zeroes
+
+NON_ZERO_TABLE = bytes(iCode | 1 for iCode in range(256))
+
+#classes
+
+class _COBS_Coder_Python(COBS_Coder):
+    """
+    Version of the COBS_Coder class forced to use the pure Python core.
+
+    Version 1.0.0.0
+    """
+
+    _Extension = None
+
+#functions
+
+#+ helpers
+
+def _getPayload(Size: int, ZeroFraction: float = 1 / 256) -> bytes:
+    """
+    Generates reproducible pseudo-random data with approximately the given
+    fraction of the zero characters.
+
+    Signature:
+        int >= 0/, float >= 0/ -> bytes
+
+    Version 1.1.0.0
+    """
+    objRandom = random.Random(Size)
+    iZeroes = int(Size * ZeroFraction)
+    if Size:
+        Result = bytearray(objRandom.getrandbits(8 * Size).to_bytes(Size,
+                                            'little').translate(NON_ZERO_TABLE))
+    else:
+        Result = bytearray()
+    for iIndex in objRandom.sample(range(Size), iZeroes):
+        Result[iIndex] = 0
+    return bytes(Result)
+
+def _getText(Size: int) -> str:
+    """
+    Generates reproducible pseudo-random ASCII text of the given length.
+
+    Signature:
+        int >= 0 -> str
+
+    Version 1.0.0.0
+    """
+    objRandom = random.Random(Size)
+    strAlphabet = ('abcdefghijklmnopqrstuvwxyz ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+                                                                '0123456789')
+    return ''.join(objRandom.choice(strAlphabet) for _ in range(Size))
+
+def _wrapInput(Data: bytes, InputType: str) -> Any:
+    """
+    Converts a byte-string into the requested input type.
+
+    Signature:
+        bytes, str -> bytes OR bytearray OR memoryview
+
+    Version 1.0.0.0
+    """
+    if InputType == 'bytearray':
+        Result = bytearray(Data)
+    elif InputType == 'memoryview':
+        Result = memoryview(Data)
+    else:
+        Result = Data
+    return Result
+
+def _makeCase(Codec: str, Operation: str, Mode: Optional[str],
+                InputType: str, Size: int, Items: int, Bytes: Optional[int],
+                                        Function: Callable[[], Any]) -> dict:
+    """
+    Packs the description of a benchmark case into a dictionary. The name of
+    the case, which is used for the comparison, is built from its other
+    properties.
+
+    Signature:
+        str, str, str OR None, str, int >= 0, int > 0, int >= 0 OR None,
+            (None -> type A) -> dict
+
+    Version 1.0.0.0
+    """
+    strName = '{}.{}{}/{}/{}'.format(Codec, Operation,
+                            '' if Mode is None else '[{}]'.format(Mode),
+                                                            InputType, Size)
+    Result = {'name' : strName, 'codec' : Codec, 'operation' : Operation,
+                'mode' : Mode, 'input' : InputType, 'size' : Size,
+                'items' : Items, 'bytes' : Bytes, 'function' : Function}
+    return Result
+
+def _getCommit() -> Optional[str]:
+    """
+    Returns the hash of the current git commit of the library, or None if it
+    cannot be determined.
+
+    Signature:
+        None -> str OR None
+
+    Version 1.0.0.0
+    """
+    try:
+        Result = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd = LIB_FOLDER,
+                            stdout = subprocess.PIPE, stderr = subprocess.PIPE,
+                            universal_newlines = True, timeout = 10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if Result.returncode:
+        return None
+    return Result.stdout.strip() or None
+
+def _getMetadata() -> dict:
+    """
+    Collects the description of the environment, in which the benchmarks are
+    run.
+
+    Signature:
+        None -> dict
+
+    Version 1.0.0.0
+    """
+    Result = {
+        'timestamp' : datetime.datetime.now().isoformat(timespec = 'seconds'),
+        'commit' : _getCommit(),
+        'library_version' : codecs_lib.__version__,
+        'python' : platform.python_version(),
+        'implementation' : platform.python_implementation(),
+        'platform' : platform.platform(),
+        'machine' : platform.machine(),
+        'cpu_count' : os.cpu_count(),
+        'cobs_extension' : not (cobs._cobs_ext is None),
+        'numpy' : cobs.NUMPY_AVAILABLE
+    }
+    return Result
+
+#+ cases definitions
+
+def _getCOBS_Cases(Sizes: List[int]) -> List[dict]:
+    """
+    Defines the benchmark cases of the COBS_Coder class: encoding and decoding
+    in each variant for each input type, and the batch and lazy splitting of
+    many frames.
+
+    Signature:
+        list(int > 0) -> list(dict)
+
+    Version 1.0.0.0
+    """
+    Result = []
+    for iSize in Sizes:
+        bsData = _getPayload(iSize)
+        for strMode in cobs.MODES:
+            bsEncoded = COBS_Coder.encode(bsData, Mode = strMode)
+            for strInput in ('bytes', 'bytearray', 'memoryview'):
+                gData = _wrapInput(bsData, strInput)
+                gEncoded = _wrapInput(bsEncoded, strInput)
+                Result.append(_makeCase('COBS_Coder', 'encode', strMode,
+                            strInput, iSize, 1, iSize,
+                            lambda gData = gData, strMode = strMode:
+                                    COBS_Coder.encode(gData, Mode = strMode)))
+                Result.append(_makeCase('COBS_Coder', 'decode', strMode,
+                            strInput, iSize, 1, iSize,
+                            lambda gData = gEncoded, strMode = strMode:
+                                    COBS_Coder.decode(gData, Mode = strMode)))
+    lstFrames = [_getPayload(64 + iIndex % 64) for iIndex in range(
+                                                                FRAMES_NUMBER)]
+    iBytes = sum(len(bsFrame) for bsFrame in lstFrames)
+    bsJoined = COBS_Coder.encodeMany(lstFrames, Join = True)
+    Result.append(_makeCase('COBS_Coder', 'encodeMany', None, 'list(bytes)',
+                        FRAMES_NUMBER, FRAMES_NUMBER, iBytes,
+                        lambda: COBS_Coder.encodeMany(lstFrames, Join = True)))
+    Result.append(_makeCase('COBS_Coder', 'decodeMany', None, 'bytes',
+                        FRAMES_NUMBER, FRAMES_NUMBER, iBytes,
+                        lambda: COBS_Coder.decodeMany(bsJoined)))
+    Result.append(_makeCase('COBS_Coder', 'iterFrames', None, 'bytearray',
+                        FRAMES_NUMBER, FRAMES_NUMBER, iBytes,
+                        lambda baData = bytearray(bsJoined):
+                                        list(COBS_Coder.iterFrames(baData))))
+    return Result
+
+def _getZeroFreeCases(Sizes: List[int]) -> List[dict]:
+    """
+    Defines the benchmark cases of the COBS_Coder encoding of the payloads
+    without any zero character (fast path), each followed by the same case
+    with the payload containing zeroes (1/256 fraction) for the comparison.
+    If the compiled core is loaded, the cases are repeated for the pure Python
+    core as the codec 'COBS_Coder(python)'.
+
+    Signature:
+        list(int > 0) -> list(dict)
+
+    Version 1.0.0.0
+    """
+    lstClasses = [('COBS_Coder', COBS_Coder)]
+    if not (COBS_Coder._Extension is None):
+        lstClasses.append(('COBS_Coder(python)', _COBS_Coder_Python))
+    Result = []
+    for strCodec, clsCoder in lstClasses:
+        for iSize in Sizes:
+            for strInput, fZeroes in (('bytes:zero-free', 0),
+                                                    ('bytes:zeroes', 1 / 256)):
+                bsData = _getPayload(iSize, fZeroes)
+                Result.append(_makeCase(strCodec, 'encode', 'COBS', strInput,
+                            iSize, 1, iSize,
+                            lambda bsData = bsData, clsCoder = clsCoder:
+                                                    clsCoder.encode(bsData)))
+    return Result
+
+def _getVigenereCases(Sizes: List[int]) -> List[dict]:
+    """
+    Defines the benchmark cases of the VigenereCoder class: encoding of the
+    text and decoding of the byte-strings and bytes arrays, as well as the
+    binary encoding and decoding of the buffers, also with a pass-phrase much
+    longer than the data (mode 'long key').
+
+    Signature:
+        list(int > 0) -> list(dict)
+
+    Version 1.1.0.0
+    """
+    Result = []
+    objCoder = VigenereCoder('benchmark pass-phrase')
+    objLongCoder = VigenereCoder(_getPayload(100000, 0.5))
+    for iSize in Sizes:
+        strText = _getText(iSize)
+        objCoder.resetIndex()
+        bsEncoded = objCoder.encode(strText)
+        Result.append(_makeCase('VigenereCoder', 'encode', None, 'str', iSize,
+                            1, iSize, lambda strText = strText:
+                                                    objCoder.encode(strText)))
+        for strInput in ('bytes', 'bytearray'):
+            gEncoded = _wrapInput(bsEncoded, strInput)
+            Result.append(_makeCase('VigenereCoder', 'decode', None, strInput,
+                            iSize, 1, iSize, lambda gEncoded = gEncoded:
+                        (objCoder.resetIndex(), objCoder.decode(gEncoded))))
+        bsData = _getPayload(iSize, 0.5)
+        for strInput in ('bytes', 'bytearray', 'memoryview'):
+            gData = _wrapInput(bsData, strInput)
+            Result.append(_makeCase('VigenereCoder', 'encodeBytes', None,
+                            strInput, iSize, 1, iSize, lambda gData = gData:
+                                                objCoder.encodeBytes(gData)))
+            Result.append(_makeCase('VigenereCoder', 'decodeBytes', None,
+                            strInput, iSize, 1, iSize, lambda gData = gData:
+                                                objCoder.decodeBytes(gData)))
+        Result.append(_makeCase('VigenereCoder', 'encodeBytes', 'long key',
+                            'bytes', iSize, 1, iSize, lambda bsData = bsData:
+                                            objLongCoder.encodeBytes(bsData)))
+        baOutput = bytearray(iSize)
+        Result.append(_makeCase('VigenereCoder', 'encodeBytesInto', None,
+                            'bytes', iSize, 1, iSize,
+                            lambda bsData = bsData, baOutput = baOutput:
+                                objCoder.encodeBytesInto(bsData, baOutput)))
+        Result.append(_makeCase('VigenereCoder', 'decodeRange', None,
+                            'bytes', iSize, 1, 64,
+                            lambda bsData = bsData, iStart = iSize - 64:
+                                objCoder.decodeRange(bsData, iStart, 64)))
+    return Result
+
+def _getWH_Cases(Sizes: List[int]) -> List[dict]:
+    """
+    Defines the benchmark cases of the WH_Coder class: encoding and decoding
+    of the lists of floating point numbers (the size is the number of items).
+
+    Signature:
+        list(int > 0) -> list(dict)
+
+    Version 1.0.0.0
+    """
+    Result = []
+    objCoder = WH_Coder(1, 2, 3)
+    for iSize in Sizes:
+        objRandom = random.Random(iSize)
+        lstData = [objRandom.uniform(-1000.0, 1000.0) for _ in range(iSize)]
+        Result.append(_makeCase('WH_Coder', 'encode', None, 'list(float)',
+                            iSize, iSize, None, lambda lstData = lstData:
+                                                    objCoder.encode(lstData)))
+        Result.append(_makeCase('WH_Coder', 'decode', None, 'list(float)',
+                            iSize, iSize, None, lambda lstData = lstData:
+                                                    objCoder.decode(lstData)))
+    return Result
+
+def _getXOR_Cases(Sizes: List[int]) -> List[dict]:
+    """
+    Defines the benchmark cases of the XOR_Coder class: encoding of the
+    byte-strings, bytes arrays and text, and decoding of the byte-strings and
+    bytes arrays.
+
+    Signature:
+        list(int > 0) -> list(dict)
+
+    Version 1.0.0.0
+    """
+    Result = []
+    for iSize in Sizes:
+        bsData = _getPayload(iSize, 0.5)
+        strText = _getText(iSize)
+        for strInput in ('bytes', 'bytearray'):
+            gData = _wrapInput(bsData, strInput)
+            Result.append(_makeCase('XOR_Coder', 'encode', None, strInput,
+                            iSize, 1, iSize, lambda gData = gData:
+                                                    XOR_Coder.encode(gData)))
+            Result.append(_makeCase('XOR_Coder', 'decode', None, strInput,
+                            iSize, 1, iSize, lambda gData = gData:
+                                                    XOR_Coder.decode(gData)))
+        Result.append(_makeCase('XOR_Coder', 'encode', None, 'str', iSize, 1,
+                            iSize, lambda strText = strText:
+                                                    XOR_Coder.encode(strText)))
+    return Result
+
+def _getErrorCases() -> List[dict]:
+    """
+    Defines the benchmark cases of the rejection of the invalid input, which
+    measure the cost of the exceptions (see the CODECS_LIB_FAST_EXCEPTIONS
+    environment variable), as in the fuzzing or validation loops.
+
+    Signature:
+        None -> list(dict)
+
+    Version 1.0.0.0
+    """
+    def _catch(Function: Callable[..., Any], *Args: Any) -> None:
+        try:
+            Function(*Args)
+        except (TypeError, ValueError):
+            pass
+    
+    bsMalformed = _getPayload(4096, 0)[:-2] + b'\x00\xfe'
+    Result = [
+        _makeCase('COBS_Coder', 'decode.error', 'COBS', 'bytes', 4096, 1, None,
+                        lambda: _catch(COBS_Coder.decode, bsMalformed)),
+        _makeCase('COBS_Coder', 'encode.error', 'COBS', 'str', 64, 1, None,
+                        lambda: _catch(COBS_Coder.encode, 'x' * 64)),
+        _makeCase('WH_Coder', 'init.error', None, 'int', 1, 1, None,
+                        lambda: _catch(WH_Coder, 1, 2, 0)),
+        _makeCase('XOR_Coder', 'decode.error', None, 'str', 64, 1, None,
+                        lambda: _catch(XOR_Coder.decode, 'x' * 64))
+    ]
+    return Result
+
+#+ public API
+
+def getCases(Quick: bool = False, Filter: Optional[str] = None) -> List[dict]:
+    """
+    Defines all benchmark cases. Each case is a dictionary with the keys
+    'name', 'codec', 'operation', 'mode', 'input', 'size', 'items', 'bytes'
+    (None if the throughput in MB/s is not applicable) and 'function' - the
+    callable without arguments to be measured.
+
+    Signature:
+        /bool, str OR None/ -> list(dict)
+
+    Args:
+        Quick: (optional) bool; if True, only the small payloads are used,
+            defaults to False
+        Filter: (optional) str OR None; only the cases with the names
+            containing this sub-string are returned, None (default) means all
+
+    Returns:
+        list(dict): the benchmark cases
+
+    Version 1.0.0.0
+    """
+    lstSizes = list(QUICK_SIZES if Quick else SIZES)
+    lstWH_Sizes = [iSize for iSize in WH_SIZES if (not Quick) or iSize <= 4096]
+    lstZeroFree = list(QUICK_ZERO_FREE_SIZES if Quick else ZERO_FREE_SIZES)
+    Result = (_getCOBS_Cases(lstSizes) + _getZeroFreeCases(lstZeroFree)
+                    + _getVigenereCases(lstSizes)
+                    + _getWH_Cases(lstWH_Sizes) + _getXOR_Cases(lstSizes)
+                    + _getErrorCases())
+    if Filter:
+        Result = [dictCase for dictCase in Result if Filter in dictCase['name']]
+    return Result
+
+def measureCase(Case: dict, Repeat: int = 5, MinTime: float = 0.2) -> dict:
+    """
+    Measures a single benchmark case. The number of calls per run is chosen
+    such that a run takes at least MinTime / Repeat seconds; the best run
+    defines the time per call. The peak memory allocated during a single call
+    is measured separately with tracemalloc.
+
+    Signature:
+        dict/, int > 0, float > 0/ -> dict
+
+    Args:
+        Case: dict; the benchmark case, see getCases()
+        Repeat: (optional) int > 0; number of the timed runs, defaults to 5
+        MinTime: (optional) float > 0; minimal total time of all runs in
+            seconds, defaults to 0.2
+
+    Returns:
+        dict: the description of the case (without the callable) with the
+            keys 'loops', 'time' (best, seconds per call), 'mean', 'mb_per_s'
+            (None if not applicable), 'items_per_s' and 'peak_alloc' (bytes)
+
+    Version 1.0.0.0
+    """
+    Function = Case['function']
+    Function() #warm-up
+    fRunTime = MinTime / Repeat
+    iLoops = 1
+    while True:
+        fStart = time.perf_counter()
+        for _ in range(iLoops):
+            Function()
+        fElapsed = time.perf_counter() - fStart
+        if fElapsed >= fRunTime or iLoops >= 1000000:
+            break
+        iLoops = max(iLoops * 2, int(iLoops * fRunTime / max(fElapsed, 1e-9)))
+    lstTimes = [fElapsed / iLoops]
+    bGC = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(Repeat - 1):
+            fStart = time.perf_counter()
+            for _ in range(iLoops):
+                Function()
+            lstTimes.append((time.perf_counter() - fStart) / iLoops)
+    finally:
+        if bGC:
+            gc.enable()
+    tracemalloc.start()
+    try:
+        Function()
+        _, iPeak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    fBest = min(lstTimes)
+    Result = {strKey : gValue for strKey, gValue in Case.items()
+                                                    if strKey != 'function'}
+    Result['loops'] = iLoops
+    Result['time'] = fBest
+    Result['mean'] = sum(lstTimes) / len(lstTimes)
+    if Case['bytes'] is None:
+        Result['mb_per_s'] = None
+    else:
+        Result['mb_per_s'] = Case['bytes'] / fBest / 1000000
+    Result['items_per_s'] = Case['items'] / fBest
+    Result['peak_alloc'] = iPeak
+    return Result
+
+def runBenchmarks(Quick: bool = False, Filter: Optional[str] = None,
+                    Repeat: int = 5, MinTime: float = 0.2, *,
+                    Verbose: bool = False) -> dict:
+    """
+    Runs all (selected) benchmark cases and returns the results together with
+    the description of the environment.
+
+    Signature:
+        /bool, str OR None, int > 0, float > 0, *, bool/ -> dict
+
+    Args:
+        Quick: (optional) bool; if True, only the small payloads are used,
+            defaults to False
+        Filter: (optional) str OR None; only the cases with the names
+            containing this sub-string are run, None (default) means all
+        Repeat: (optional) int > 0; number of the timed runs per case,
+            defaults to 5
+        MinTime: (optional) float > 0; minimal total time of the timed runs
+            per case in seconds, defaults to 0.2
+        Verbose: (keyword) bool; if True, the result of each case is printed
+            as soon as it is measured, defaults to False
+
+    Returns:
+        dict: with the keys 'format' (version of the structure), 'metadata'
+            (dict) and 'results' (list(dict)), see measureCase()
+
+    Version 1.0.0.0
+    """
+    lstResults = []
+    for dictCase in getCases(Quick, Filter):
+        dictResult = measureCase(dictCase, Repeat, MinTime)
+        lstResults.append(dictResult)
+        if Verbose:
+            _printResult(dictResult)
+    Result = {'format' : FORMAT_VERSION, 'metadata' : _getMetadata(),
+                                                    'results' : lstResults}
+    return Result
+
+def compareResults(Baseline: dict, Results: dict,
+                                    Threshold: float = 0.1) -> List[dict]:
+    """
+    Compares two sets of the benchmark results case by case (matched by name).
+    A case is marked as a regression if its time per call or its peak memory
+    allocation exceeds the baseline by more than the threshold fraction.
+
+    Signature:
+        dict, dict/, float >= 0/ -> list(dict)
+
+    Args:
+        Baseline: dict; the reference results, see runBenchmarks()
+        Results: dict; the results to be checked
+        Threshold: (optional) float >= 0; the allowed relative increase of the
+            time or memory, defaults to 0.1 (10%)
+
+    Returns:
+        list(dict): for each case present in both sets - the keys 'name',
+            'time_ratio' and 'alloc_ratio' (new / baseline, None if the
+            baseline value is zero) and 'regression' (bool)
+
+    Version 1.0.0.0
+    """
+    dictBaseline = {dictItem['name'] : dictItem
+                                        for dictItem in Baseline['results']}
+    Result = []
+    for dictItem in Results['results']:
+        dictBase = dictBaseline.get(dictItem['name'], None)
+        if dictBase is None:
+            continue
+        fTimeRatio = dictItem['time'] / dictBase['time']
+        if dictBase['peak_alloc']:
+            fAllocRatio = dictItem['peak_alloc'] / dictBase['peak_alloc']
+        else:
+            fAllocRatio = None
+        bRegression = (fTimeRatio > 1 + Threshold) or (
+                                            (not (fAllocRatio is None))
+                                            and (fAllocRatio > 1 + Threshold))
+        Result.append({'name' : dictItem['name'], 'time_ratio' : fTimeRatio,
+                        'alloc_ratio' : fAllocRatio,
+                        'regression' : bRegression})
+    return Result
+
+#+ console output
+
+def _printResult(Result: dict) -> None:
+    """
+    Prints a single benchmark result as a line of a table.
+
+    Signature:
+        dict -> None
+
+    Version 1.0.0.0
+    """
+    if Result['mb_per_s'] is None:
+        strThroughput = '{:>10}'.format('-')
+    else:
+        strThroughput = '{:10.1f}'.format(Result['mb_per_s'])
+    print('{:<60} {} MB/s {:12.0f} items/s {:10d} B peak'.format(
+                    Result['name'], strThroughput, Result['items_per_s'],
+                                                        Result['peak_alloc']))
+    sys.stdout.flush()
+
+def _printComparison(Comparison: List[dict]) -> None:
+    """
+    Prints the comparison of the benchmark results as a table.
+
+    Signature:
+        list(dict) -> None
+
+    Version 1.0.0.0
+    """
+    for dictItem in Comparison:
+        if dictItem['alloc_ratio'] is None:
+            strAlloc = '{:>7}'.format('-')
+        else:
+            strAlloc = '{:7.2f}'.format(dictItem['alloc_ratio'])
+        print('{:<60} time x{:6.2f} alloc x{} {}'.format(dictItem['name'],
+                        dictItem['time_ratio'], strAlloc,
+                        'REGRESSION' if dictItem['regression'] else 'ok'))
+
+def _getDefaultPath(Results: dict) -> str:
+    """
+    Builds the default path of the results file from the time stamp and the
+    commit hash.
+
+    Signature:
+        dict -> str
+
+    Version 1.0.0.0
+    """
+    dictMeta = Results['metadata']
+    strName = '{}_{}.json'.format(dictMeta['timestamp'].replace(':', '-'),
+                                        (dictMeta['commit'] or 'nogit')[:10])
+    return os.path.join(RESULTS_FOLDER, strName)
+
+def main(Arguments: Optional[List[str]] = None) -> int:
+    """
+    Command line entry point, see the module docstring.
+
+    Signature:
+        /list(str) OR None/ -> int
+
+    Returns:
+        int: 0 - no regressions, 1 - a regression is found
+
+    Version 1.0.0.0
+    """
+    objParser = argparse.ArgumentParser(
+                                description = 'codecs_lib benchmark suite')
+    objParser.add_argument('--quick', action = 'store_true',
+                                help = 'only the small payloads')
+    objParser.add_argument('--filter', default = None,
+                                help = 'only the cases containing this text')
+    objParser.add_argument('--output', default = None,
+                                help = 'path of the JSON results file')
+    objParser.add_argument('--repeat', type = int, default = 5,
+                                help = 'number of the timed runs per case')
+    objParser.add_argument('--min-time', type = float, default = 0.2,
+                                help = 'minimal measurement time per case, s')
+    objParser.add_argument('--compare', nargs = '+', default = None,
+                                metavar = 'PATH',
+                                help = 'BASELINE [RESULTS] JSON files')
+    objParser.add_argument('--threshold', type = float, default = 0.1,
+                                help = 'allowed relative slow-down')
+    objArgs = objParser.parse_args(Arguments)
+    if (not (objArgs.compare is None)) and len(objArgs.compare) > 2:
+        objParser.error('--compare accepts one or two paths')
+    if (objArgs.compare is None) or len(objArgs.compare) == 1:
+        dictResults = runBenchmarks(objArgs.quick, objArgs.filter,
+                        objArgs.repeat, objArgs.min_time, Verbose = True)
+        strPath = objArgs.output or _getDefaultPath(dictResults)
+        strFolder = os.path.dirname(os.path.abspath(strPath))
+        os.makedirs(strFolder, exist_ok = True)
+        with open(strPath, 'wt') as fFile:
+            json.dump(dictResults, fFile, indent = 1)
+        print('Results are written into {}'.format(strPath))
+    else:
+        with open(objArgs.compare[1], 'rt') as fFile:
+            dictResults = json.load(fFile)
+    if objArgs.compare is None:
+        return 0
+    with open(objArgs.compare[0], 'rt') as fFile:
+        dictBaseline = json.load(fFile)
+    lstComparison = compareResults(dictBaseline, dictResults,
+                                                            objArgs.threshold)
+    _printComparison(lstComparison)
+    iRegressions = sum(1 for dictItem in lstComparison
+                                                    if dictItem['regression'])
+    print('{} cases compared, {} regressions'.format(len(lstComparison),
+                                                                iRegressions))
+    return 1 if iRegressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
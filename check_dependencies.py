@@ -6,8 +6,8 @@ Performs the installation / dependencies checks. Attention: this module is
 designed to be executable. All tests are run automatically upon import.
 """
 
-__version__= '1.1.0.0'
-__date__ = '30-09-2020'
+__version__= '1.2.0.0'
+__date__ = '18-10-2026'
 __status__ = 'Production'
 
 #actual imports
@@ -65,12 +65,14 @@ if not (dictCheck is None):
 bOthers = False
 bDO = False
 
-for strKey in ['3rd_party', 'DO']:
+for strKey in ['3rd_party', 'DO', '3rd_party_optional', 'DO_optional']:
     bFault = False
+    bOptional = strKey.endswith('_optional')
     dictCheck = dictData.get(strKey, None)
     if not (dictCheck is None):
-        print('Checking the required {} libraries'.format(
-                                                    strKey.replace('_', ' ')))
+        strKind = strKey.replace('_optional', '').replace('_', ' ')
+        print('Checking the {} {} libraries'.format(
+                        'optional' if bOptional else 'required', strKind))
         for strModule, dictVersions in dictCheck.items():
             try:
                 modImport = import_module(strModule)
@@ -98,13 +100,15 @@ for strKey in ['3rd_party', 'DO']:
                 print('Library {} is not found'.format(strModule))
                 print('Install from {}'.format(dictVersions["path"]))
                 bFault = True
-            if strKey == 'DO':
+            if strKey.startswith('DO'):
                 try:
                     strCheckModule = '{}.check_dependencies'.format(strModule)
                     import_module(strCheckModule)
                 except ImportError:
                     pass
-        if bFault:
+        if bFault and bOptional:
+            print('Optional libraries are missing - reduced functionality')
+        elif bFault:
             if strKey == '3rd_party':
                 bOthers = True
             elif strKey == 'DO':
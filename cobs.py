@@ -5,6 +5,24 @@ Module codecs_lib.cobs
 Implementation of the Consistent Overhead Byte Stuffing (COBS) encoding and
 decoding algorithm disregaring the packet delimiting b'\x00' characters.
 
+If the optional compiled extension codecs_lib._cobs_ext is built (see setup.py)
+it is used automatically for the encoding and decoding, otherwise the pure
+Python implementation is used. If NumPy is installed, it is used for the
+decoding of the large data in the absence of the compiled extension.
+
+The class COBS_Coder is thread-safe. The compiled extension releases the global
+interpreter lock (GIL) while processing the large buffers, so the plain COBS
+encoding and decoding of the large frames in several threads run in parallel.
+The instances of the other classes keep the state of a stream, thus each one
+must be used by a single thread.
+
+The reduced COBS (COBS/R) [2] and the COBS with zero pair elimination
+(COBS/ZPE) [3] variants are also supported, as well as the COBS with 16-bit
+codes (COBS/16) for the large frames.
+
+The classes COBS_FrameReader and COBS_FrameWriter wrap the asyncio streams for
+the asynchronous reception and sending of the delimited frames.
+
 References:
     [1] Wikipedia:
         https://en.wikipedia.org/wiki/Consistent_Overhead_Byte_Stuffing
@@ -16,10 +34,14 @@ References:
 
 Classes:
     COBS_Coder
+    COBS_StreamDecoder
+    COBS_StreamEncoder
+    COBS_FrameReader
+    COBS_FrameWriter
 """
 
-__version__ = "1.0.0.1"
-__date__ = "19-04-2023"
+__version__ = "1.1.0.0"
+__date__ = "18-10-2026"
 __status__ = "Production"
 
 #imports
@@ -28,10 +50,20 @@ __status__ = "Production"
 
 import os
 import sys
+import re
+import collections.abc as c_abc
+import importlib.util
+import functools
+import mmap
+import collections
+import array
 
-from typing import Any, Union
+from typing import Any, Union, List, Sequence, Optional, Iterator, Tuple
+from typing import Callable, Generator
 
-#+ other DO libraries
+#+ asyncio and concurrent.futures - imported only on the first use (slow import)
+
+#+ other DO libraries (optional) - exceptions with the traceback analysis
 
 LIB_FOLDER = os.path.dirname(os.path.realpath(__file__))
 ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
@@ -39,12 +71,65 @@ ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
 if not (ROOT_FOLDER in sys.path):
     sys.path.append(ROOT_FOLDER)
 
-from introspection_lib.base_exceptions import UT_TypeError, UT_ValueError
+from codecs_lib._exceptions import UT_TypeError, UT_ValueError
+
+#+ optional compiled core
+
+try:
+    from codecs_lib import _cobs_ext
+except ImportError:
+    _cobs_ext = None
+
+#+ optional NumPy - imported only on the first use, only availability check
+
+NUMPY_AVAILABLE = not (importlib.util.find_spec('numpy') is None)
 
 #types
 
 TByteString = Union[bytes, bytearray]
 
+TBuffer = Any #any object supporting the buffer protocol
+
+TPath = Union[str, os.PathLike]
+
+#globals
+
+ZERO_SEARCH = re.compile(b'\x00') #works on any buffer without copying
+
+NON_ZERO_SEARCH = re.compile(b'[^\x00]') #first non-zero character in a buffer
+
+MODES = ('COBS', 'COBS/R', 'COBS/ZPE', 'COBS/16') #supported variants
+
+#functions
+
+def _decodeCaptureRange(Coder: type, Path: str, Start: int, End: int,
+                                                    Mode: str) -> List[bytes]:
+    """
+    Helper 'private' function to decode all delimited frames within a range of
+    a memory mapped capture file, executed by a worker process. Defined at the
+    module level in order to be picklable.
+
+    Signature:
+        type, str, int >= 0, int > 0, str -> list(bytes)
+    
+    Args:
+        Coder: type; COBS_Coder class or its sub-class to use
+        Path: str; path to the capture file
+        Start: int >= 0; index of the first byte of the range
+        End: int > 0; index after the last byte of the range
+        Mode: str; the variant of the algorithm
+    
+    Returns:
+        list(bytes): decoded frames
+    
+    Version 1.0.0.0
+    """
+    with open(Path, 'rb') as File:
+        with mmap.mmap(File.fileno(), 0, access = mmap.ACCESS_READ) as Mapped:
+            Data = Mapped[Start : End]
+    Result = Coder._decodeFrames(Data, Mode)
+    return Result
+
 #classes
 
 class COBS_Coder:
@@ -53,69 +138,317 @@ class COBS_Coder:
     encoding / decoding algorithm disregaring the packet delimiting b'\x00'
     characters. All methods are class methods, thus the instantiation is not
     required, although it is possible.
+
+    The methods keep no state and can be called from any number of threads
+    concurrently, as long as the input buffer is not modified by another thread
+    during the call. With the compiled core the plain COBS encoding and
+    decoding (including the search for the zero characters) of the data not
+    shorter than its GIL_THRESHOLD (8 KiB) release the global interpreter lock,
+    thus they run in parallel on several cores.
     
     Class methods:
-        decode(Data):
-            bytes OR bytearray -> bytes
-        encode(Data):
-            bytes OR bytearray -> bytes
+        decode(Data, *, Mode = None, Backend = None):
+            buffer/, *, str OR None, str OR None/ -> bytes
+        encode(Data, *, Mode = None):
+            buffer/, *, str OR None/ -> bytes
+        decodeInto(Data, Output):
+            buffer, writable buffer -> int >= 0
+        encodeInto(Data, Output):
+            buffer, writable buffer -> int > 0
+        maxEncodedLength(Length):
+            int >= 0 -> int > 0
+        decodeMany(Data):
+            buffer OR seq(buffer) -> list(bytes)
+        encodeMany(Frames, *, Join = False):
+            seq(buffer)/, *, bool/ -> list(bytes) OR bytes
+        iterFrames(Data, *, Mode = None):
+            buffer/, *, str OR None/
+                -> generator(tuple(bytes, int >= 0, int > 0)) -> int >= 0
+        decodeCapture(Path, *, Output = None, Mode = None, Workers = None,
+                                                        ChunkSize = 4194304):
+            str OR os.PathLike/, *, str OR os.PathLike OR None, str OR None,
+                int > 0 OR None, int > 0/ -> list(bytes) OR int >= 0
+        validate(Data, *, Mode = None):
+            buffer/, *, str OR None/ -> bool
+        decodedLength(Data, *, Mode = None):
+            buffer/, *, str OR None/ -> int >= 0
+        encodeFile(Source, Target):
+            str OR os.PathLike, str OR os.PathLike -> int > 0
+        decodeFile(Source, Target):
+            str OR os.PathLike, str OR os.PathLike -> int >= 0
     
-    Version 1.0.0.1
+    Version 1.1.0.0
     """
 
+    #private class attributes
+
+    _Extension = _cobs_ext #compiled core or None for the pure Python one
+
+    _Numpy = NUMPY_AVAILABLE #flag if the NumPy decoding can be used
+
+    _NumpyThreshold = 65536 #minimal data length for the automatic NumPy use
+
+    _FileChunkSize = 1048576 #length of a window of a file processed at once
+
     #private methods
 
     @classmethod
-    def _checkType(cls, Data: Any) -> None:
+    def _checkType(cls, Data: Any) -> TBuffer:
         """
         Helper 'private' method to check that the input for encoding or decoding
-        methods is a byte-string or a bytes array and raise a sub-class of
-        TypeError exception if the check fails.
+        methods supports the buffer protocol and is C-contiguous, and raise a
+        sub-class of TypeError exception if the check fails. The byte-strings
+        and bytes arrays are returned as they are, any other buffer (memoryview,
+        array, mmap, etc.) - as an unsigned bytes memoryview of its content,
+        thus the data is never copied.
 
         Class method.
 
         Signature:
-            type A -> None
+            type A -> bytes OR bytearray OR memoryview
         
         Args:
             Data: type A; the input of the encoding or decoding method to be
                 checked
         
+        Returns:
+            bytes OR bytearray: the input itself
+            memoryview: 1D view of the content of any other buffer as unsigned
+                bytes
+        
         Raises:
-            UT_TypeError: input is neither byte-string nor bytes array
+            UT_TypeError: input does not support the buffer protocol or is not
+                C-contiguous
         
-        Version 1.0.0.1
+        Version 1.2.0.0
         """
-        if not isinstance(Data, (bytes, bytearray)):
-            raise UT_TypeError(Data, (bytes, bytearray), SkipFrames = 2)
+        if isinstance(Data, (bytes, bytearray)):
+            return Data
+        return cls._getView(Data, SkipFrames = 3)
 
-    #public API
+    @classmethod
+    def _findZero(cls, Data: TBuffer, Start: int = 0,
+                                            Stop: Optional[int] = None) -> int:
+        """
+        Helper 'private' method to find the first zero character within the
+        given range of a byte-string, bytes array or unsigned bytes memoryview
+        without copying the data. The range not shorter than the GIL release
+        threshold is searched by the compiled core, if it is available, with
+        the GIL released.
+
+        Class method.
+
+        Signature:
+            bytes OR bytearray OR memoryview/, int >= 0, int >= 0 OR None/
+                -> int >= -1
+        
+        Args:
+            Data: bytes OR bytearray OR memoryview; data to be searched
+            Start: (optional) int >= 0; start of the range, defaults to 0
+            Stop: (optional) int >= 0 OR None; end of the range (exclusive),
+                None (default) means the end of the data
+        
+        Returns:
+            int >= 0: index of the first zero character within the range
+            int = -1: there is no zero character within the range
+        
+        Version 1.1.0.0
+        """
+        if Stop is None:
+            Stop = len(Data)
+        if ((not (cls._Extension is None))
+                        and (Stop - Start >= cls._Extension.GIL_THRESHOLD)):
+            Result = cls._Extension.find_zero(memoryview(Data)[Start : Stop])
+            if Result >= 0:
+                Result += Start
+            return Result
+        if isinstance(Data, (bytes, bytearray)):
+            return Data.find(0, Start, Stop)
+        Match = ZERO_SEARCH.search(Data, Start, Stop)
+        Result = -1 if Match is None else Match.start()
+        return Result
 
     @classmethod
-    def encode(cls, Data: TByteString) -> bytes:
+    def _rfindZero(cls, Data: TBuffer) -> int:
         """
-        Encodes a byte string using COBS algorithm. Note that the frame
-        delimiter b'\x00' is not added!
+        Helper 'private' method to find the last zero character in a
+        byte-string, bytes array or unsigned bytes memoryview without copying
+        the data. A memoryview is searched backwards in chunks of 4 KiB.
 
         Class method.
+
+        Signature:
+            bytes OR bytearray OR memoryview -> int >= -1
+        
+        Args:
+            Data: bytes OR bytearray OR memoryview; data to be searched
+        
+        Returns:
+            int >= 0: index of the last zero character
+            int = -1: there is no zero character in the data
         
+        Version 1.0.0.0
+        """
+        if isinstance(Data, (bytes, bytearray)):
+            return Data.rfind(0)
+        Result = -1
+        Stop = len(Data)
+        while (Result < 0) and (Stop > 0):
+            Start = max(0, Stop - 4096)
+            for Match in ZERO_SEARCH.finditer(Data, Start, Stop):
+                Result = Match.start()
+            Stop = Start
+        return Result
+
+    @classmethod
+    def _splitZeros(cls, Data: TBuffer) -> List[TBuffer]:
+        """
+        Helper 'private' method to split a byte-string, bytes array or unsigned
+        bytes memoryview by the zero characters. A memoryview is split into
+        the slices of itself, i.e. without copying the data.
+
+        Class method.
+
         Signature:
-            bytes OR bytearray -> bytes
+            bytes OR bytearray OR memoryview
+                -> list(bytes OR bytearray OR memoryview)
         
         Args:
-            Data: bytes or bytearray; data to be encoded
+            Data: bytes OR bytearray OR memoryview; data to be split
         
         Returns:
-            bytes: encoded byte-string
+            list(bytes OR bytearray OR memoryview): the pieces of the data of
+                the same type, possibly empty
+        
+        Version 1.0.0.0
+        """
+        if isinstance(Data, (bytes, bytearray)):
+            return Data.split(b'\x00')
+        Result = []
+        Start = 0
+        for Match in ZERO_SEARCH.finditer(Data):
+            Result.append(Data[Start : Match.start()])
+            Start = Match.end()
+        Result.append(Data[Start : ])
+        return Result
+
+    @classmethod
+    def _stripZeros(cls, Data: TBuffer) -> TBuffer:
+        """
+        Helper 'private' method to remove the leading and tailing zero
+        characters from a byte-string, bytes array or unsigned bytes memoryview
+        without copying the data.
+
+        Class method.
+
+        Signature:
+            bytes OR bytearray OR memoryview
+                -> bytes OR bytearray OR memoryview
+        
+        Args:
+            Data: bytes OR bytearray OR memoryview; data to be stripped
+        
+        Returns:
+            bytes OR bytearray OR memoryview: the input itself, if there is
+                nothing to remove, otherwise a memoryview slice of it
+        
+        Version 1.0.0.0
+        """
+        Match = NON_ZERO_SEARCH.search(Data)
+        End = len(Data)
+        Start = End if Match is None else Match.start()
+        while End > Start and not Data[End - 1]:
+            End -= 1
+        if Start or (End < len(Data)):
+            Data = memoryview(Data)[Start : End]
+        return Data
+
+    @classmethod
+    def _getView(cls, Data: Any, *, Writable: bool = False,
+                                        SkipFrames: int = 2) -> memoryview:
+        """
+        Helper 'private' method to obtain an unsigned bytes view of any object
+        supporting the buffer protocol (bytes, bytearray, memoryview, array,
+        mmap, etc.) without copying its content. Raises a sub-class of TypeError
+        exception if the object is not a suitable buffer. This is the single
+        place of the buffer checks, also used by the method _checkType().
+
+        Class method.
+
+        Signature:
+            type A/, *, bool, int > 0/ -> memoryview
+        
+        Args:
+            Data: type A; the object to be viewed
+            Writable: (keyword) bool; flag if the buffer must be writable,
+                defaults to False
+            SkipFrames: (keyword) int > 0; number of the helper frames to be
+                skipped in the traceback of the exception, defaults to 2, i.e.
+                the exception is reported for the caller of this method
+        
+        Returns:
+            memoryview: 1D view of the content as unsigned bytes
         
         Raises:
-            UT_TypeError: input is neither byte-string nor bytes array
+            UT_TypeError: input does not support the buffer protocol, is not
+                C-contiguous or is not writable when required
         
-        Version 1.0.1.0
+        Version 1.1.0.0
+        """
+        if Writable:
+            Types = (bytearray, memoryview)
+        else:
+            Types = (bytes, bytearray, memoryview)
+        try:
+            View = memoryview(Data)
+        except TypeError:
+            raise UT_TypeError(Data, Types, SkipFrames = SkipFrames) from None
+        if (not View.c_contiguous) or (Writable and View.readonly):
+            raise UT_TypeError(Data, Types, SkipFrames = SkipFrames)
+        if View.format != 'B' or View.ndim != 1:
+            View = View.cast('B')
+        return View
+
+    @classmethod
+    def _encode(cls, Data: TBuffer) -> bytes:
+        """
+        Helper 'private' method implementing the COBS encoding without any
+        input checks. Uses the compiled core if it is available.
+
+        The data without zero characters (e.g. text or base64) is detected by
+        a single search, and it is encoded as full blocks of 254 bytes (and the
+        last, shorter block) by joining the slices of a memoryview of the data
+        with the code bytes, i.e. with a single copy.
+
+        Class method.
+
+        Signature:
+            bytes OR bytearray OR memoryview -> bytes
+        
+        Args:
+            Data: bytes OR bytearray OR memoryview; data to be encoded
+        
+        Returns:
+            bytes: encoded byte-string
+        
+        Version 1.1.1.0
         """
+        if not (cls._Extension is None):
+            return cls._Extension.encode(Data)
         BlockLength = 254
-        cls._checkType(Data)
-        Segments = bytes(Data).split(b'\x00')
+        if cls._findZero(Data) < 0: #fast path - no zero characters
+            Length = len(Data)
+            FullLength = Length - Length % BlockLength
+            View = memoryview(Data)
+            Parts = []
+            for Offset in range(0, FullLength, BlockLength):
+                Parts.append(b'\xff')
+                Parts.append(View[Offset : Offset + BlockLength])
+            if (FullLength < Length) or (not Length):
+                Parts.append(bytes((Length - FullLength + 1, )))
+                Parts.append(View[FullLength : ])
+            return b''.join(Parts)
+        Segments = cls._splitZeros(Data)
         Accumulator = bytearray()
         StopIndex = len(Segments) - 1
         for Index, Segment in enumerate(Segments):
@@ -140,35 +473,26 @@ class COBS_Coder:
         return Result
 
     @classmethod
-    def decode(cls, Data: TByteString) -> bytes:
+    def _decodePython(cls, Input: TBuffer) -> bytes:
         """
-        Decodes a byte string using COBS algorithm. Note that the leading and
-        tailing delimiters b'\x00' are removed automatically!
-        
+        Helper 'private' method implementing the COBS decoding in pure Python
+        of the data already stripped of the leading and tailing delimiters and
+        checked for the absence of the zero characters.
+
         Class method.
-        
+
         Signature:
-            bytes OR bytearray -> bytes
+            bytes OR bytearray OR memoryview -> bytes
         
         Args:
-            Data: bytes OR bytearray; data to be decoded
+            Input: bytes OR bytearray OR memoryview; data to be decoded without
+                any zero characters
         
         Returns:
             bytes: decoded byte-string
         
-        Raises:
-            UT_ValueError: a zero character ('\x00') in the passed data not in
-                the leading or tailing position
-            UT_TypeError: input is neither byte-string nor bytes array
-        
-        Version 1.0.0.1
+        Version 1.0.1.0
         """
-        cls._checkType(Data)
-        Input = bytes(Data).strip(b'\x00')
-        if b'\x00' in Input:
-            ErrorMessage = 'Zero character in the encoded string'
-            raise UT_ValueError(Data, ErrorMessage, SkipFrames = 1)
-        Input = bytearray(Input)
         Index = 0
         Result = bytearray()
         DataLength = len(Input)
@@ -182,3 +506,1872 @@ class COBS_Coder:
                 Result.append(0)
         Result = bytes(Result)
         return Result
+
+    @classmethod
+    def _decodeNumpy(cls, Input: TBuffer) -> bytes:
+        """
+        Helper 'private' method implementing the vectorized COBS decoding using
+        NumPy of the data already stripped of the leading and tailing delimiters
+        and checked for the absence of the zero characters. Only the code chain
+        is walked in Python; the implied zero of a block (code < 255) replaces
+        the code byte of the next block, and all other code bytes are removed
+        in a single operation.
+
+        Class method.
+
+        Signature:
+            bytes OR bytearray OR memoryview -> bytes
+        
+        Args:
+            Input: bytes OR bytearray OR memoryview; data to be decoded without
+                any zero characters
+        
+        Returns:
+            bytes: decoded byte-string
+        
+        Version 1.0.1.0
+        """
+        import numpy as np
+        Positions = []
+        Index = 0
+        DataLength = len(Input)
+        while Index < DataLength:
+            Positions.append(Index)
+            Index += Input[Index]
+        if not Positions:
+            return b''
+        Array = np.frombuffer(Input, dtype = np.uint8).copy()
+        Positions = np.array(Positions, dtype = np.intp)
+        NextCodes = Positions[1:]
+        ZeroMask = Array[Positions[:-1]] < 255
+        Array[NextCodes[ZeroMask]] = 0
+        Overhead = np.concatenate((Positions[:1], NextCodes[~ZeroMask]))
+        Result = np.delete(Array, Overhead).tobytes()
+        return Result
+
+    @classmethod
+    def _decode(cls, Input: TBuffer, Backend: Optional[str] = None
+                                                                    ) -> bytes:
+        """
+        Helper 'private' method implementing the COBS decoding of the data
+        already stripped of the leading and tailing delimiters and checked for
+        the absence of the zero characters. Unless the backend is specified
+        explicitly, the compiled core is used if it is available, otherwise the
+        NumPy vectorized implementation is used for the data not shorter than
+        the threshold if NumPy is installed, and the pure Python implementation
+        in all other cases.
+
+        Class method.
+
+        Signature:
+            bytes OR bytearray OR memoryview/, str OR None/ -> bytes
+        
+        Args:
+            Input: bytes OR bytearray OR memoryview; data to be decoded without
+                any zero characters
+            Backend: (optional) str OR None; one of 'c', 'numpy' or 'python', or
+                None (default) for the automatic selection; availability of the
+                requested backend is not checked
+        
+        Returns:
+            bytes: decoded byte-string
+        
+        Version 1.1.1.0
+        """
+        if Backend is None:
+            if not (cls._Extension is None):
+                Backend = 'c'
+            elif cls._Numpy and len(Input) >= cls._NumpyThreshold:
+                Backend = 'numpy'
+            else:
+                Backend = 'python'
+        if Backend == 'c':
+            Result = cls._Extension.decode(Input)
+        elif Backend == 'numpy':
+            Result = cls._decodeNumpy(Input)
+        else:
+            Result = cls._decodePython(Input)
+        return Result
+
+    @classmethod
+    def _checkMode(cls, Mode: Any) -> str:
+        """
+        Helper 'private' method to check the requested variant of the algorithm
+        and raise a sub-class of TypeError or ValueError exception if the check
+        fails.
+
+        Class method.
+
+        Signature:
+            type A -> str
+        
+        Args:
+            Mode: type A; the requested variant, None means 'COBS'
+        
+        Returns:
+            str: the checked variant name
+        
+        Raises:
+            UT_TypeError: argument is neither a string nor None
+            UT_ValueError: argument is not a supported variant name
+        
+        Version 1.0.0.0
+        """
+        if Mode is None:
+            return 'COBS'
+        if not isinstance(Mode, str):
+            raise UT_TypeError(Mode, str, SkipFrames = 2)
+        if not (Mode in MODES):
+            raise UT_ValueError(Mode, 'one of {}'.format(MODES),
+                                                                SkipFrames = 2)
+        return Mode
+
+    @classmethod
+    def _checkPath(cls, Path: Any) -> str:
+        """
+        Helper 'private' method to check that a file path is a string or a
+        path-like object and raise a sub-class of TypeError exception if the
+        check fails.
+
+        Class method.
+
+        Signature:
+            type A -> str
+        
+        Args:
+            Path: type A; the file path to be checked
+        
+        Returns:
+            str: the file path as a string
+        
+        Raises:
+            UT_TypeError: the path is neither a string nor a path-like object
+        
+        Version 1.0.0.0
+        """
+        if not isinstance(Path, (str, os.PathLike)):
+            raise UT_TypeError(Path, (str, os.PathLike), SkipFrames = 2)
+        return os.fspath(Path)
+
+    @classmethod
+    def _encodeReduced(cls, Data: TBuffer) -> bytes:
+        """
+        Helper 'private' method implementing the COBS/R encoding without any
+        input checks. The plain COBS encoding is performed first; then, if the
+        value of the last byte of the data is not less than the code of the
+        last block, it replaces this code and is removed from the end.
+
+        Class method.
+
+        Signature:
+            bytes OR bytearray OR memoryview -> bytes
+        
+        Args:
+            Data: bytes OR bytearray OR memoryview; data to be encoded
+        
+        Returns:
+            bytes: encoded byte-string
+        
+        Version 1.0.1.0
+        """
+        Result = cls._encode(Data)
+        TailLength = len(Data) - 1 - cls._rfindZero(Data)
+        if TailLength:
+            BlockLength = TailLength % 254 or 254
+            LastByte = Data[-1]
+            if LastByte > BlockLength:
+                CodePosition = len(Result) - BlockLength - 1
+                Result = b''.join([Result[:CodePosition], bytes([LastByte]),
+                                                Result[CodePosition + 1 : -1]])
+        return Result
+
+    @classmethod
+    def _decodeReduced(cls, Input: TBuffer,
+                                        Backend: Optional[str] = None) -> bytes:
+        """
+        Helper 'private' method implementing the COBS/R decoding of the data
+        already stripped of the leading and tailing delimiters and checked for
+        the absence of the zero characters. The plain COBS decoding is
+        performed first; then, if the code of the last block points beyond the
+        end of the data, this code is appended as the last data byte.
+
+        Class method.
+
+        Signature:
+            bytes OR bytearray OR memoryview/, str OR None/ -> bytes
+        
+        Args:
+            Input: bytes OR bytearray OR memoryview; data to be decoded without
+                any zero characters
+            Backend: (optional) str OR None; backend of the plain COBS decoding,
+                see the method _decode()
+        
+        Returns:
+            bytes: decoded byte-string
+        
+        Version 1.0.1.0
+        """
+        Result = cls._decode(Input, Backend)
+        DataLength = len(Input)
+        Index = 0
+        Code = 0
+        while Index < DataLength:
+            Code = Input[Index]
+            Index += Code
+        if Index > DataLength:
+            Result += bytes([Code])
+        return Result
+
+    @classmethod
+    def _encodeZPE(cls, Data: TBuffer) -> bytes:
+        """
+        Helper 'private' method implementing the COBS/ZPE (zero pair
+        elimination) encoding without any input checks. A virtual zero is
+        appended to the data, which is split into the blocks, each encoded
+        with a single code byte followed by the non-zero data bytes:
+        0x01 to 0xDF - 0 to 222 bytes followed by a single zero, 0xE0 - 223
+        bytes without a zero, 0xE1 to 0xFF - 0 to 30 bytes followed by a pair
+        of zeroes.
+
+        Class method.
+
+        Signature:
+            bytes OR bytearray OR memoryview -> bytes
+        
+        Args:
+            Data: bytes OR bytearray OR memoryview; data to be encoded
+        
+        Returns:
+            bytes: encoded byte-string
+        
+        Version 1.0.1.0
+        """
+        BlockLength = 223
+        PairLength = 30
+        DataLength = len(Data)
+        Accumulator = bytearray()
+        Index = 0
+        while Index <= DataLength: #virtual zero at the index DataLength
+            Zero = cls._findZero(Data, Index, min(Index + BlockLength,
+                                                                DataLength))
+            if Zero < 0:
+                Zero = DataLength
+            Length = Zero - Index
+            if Length >= BlockLength:
+                Accumulator.append(0xE0)
+                Accumulator += Data[Index : Index + BlockLength]
+                Index += BlockLength
+            else:
+                if (Length <= PairLength) and ((Zero + 1 == DataLength) or (
+                        (Zero + 1 < DataLength) and not Data[Zero + 1])):
+                    Accumulator.append(0xE1 + Length)
+                    Index = Zero + 2
+                else:
+                    Accumulator.append(Length + 1)
+                    Index = Zero + 1
+                Accumulator += Data[Zero - Length : Zero]
+        Result = bytes(Accumulator)
+        return Result
+
+    @classmethod
+    def _decodeZPE(cls, Input: TBuffer) -> bytes:
+        """
+        Helper 'private' method implementing the COBS/ZPE (zero pair
+        elimination) decoding of the data already stripped of the leading and
+        tailing delimiters and checked for the absence of the zero characters.
+
+        Class method.
+
+        Signature:
+            bytes OR bytearray OR memoryview -> bytes
+        
+        Args:
+            Input: bytes OR bytearray OR memoryview; data to be decoded without
+                any zero characters
+        
+        Returns:
+            bytes: decoded byte-string
+        
+        Version 1.0.1.0
+        """
+        Index = 0
+        Result = bytearray()
+        DataLength = len(Input)
+        while Index < DataLength:
+            Code = Input[Index]
+            Index += 1
+            if Code == 0xE0:
+                Result += Input[Index : Index + 223]
+                Index += 223
+            elif Code > 0xE0:
+                Result += Input[Index : Index + Code - 0xE1]
+                Result += b'\x00\x00'
+                Index += Code - 0xE1
+            else:
+                Result += Input[Index : Index + Code - 1]
+                Result.append(0)
+                Index += Code - 1
+        if Result and not Result[-1]: #virtual zero
+            del Result[-1]
+        Result = bytes(Result)
+        return Result
+
+    @classmethod
+    def _encodeWide(cls, Data: TBuffer) -> bytes:
+        """
+        Helper 'private' method implementing the COBS/16 (2-bytes codes)
+        encoding without any input checks. Each code N (the number of the data
+        bytes in the block plus one) is stored as two non-zero base-255 digits,
+        the most significant first: (N - 1) // 255 + 1 and (N - 1) % 255 + 1.
+        Thus the largest code is 65025, i.e. a full block of 65024 non-zero
+        bytes not followed by a zero. The blocks are copied as slices of a
+        memoryview of the data.
+
+        Class method.
+
+        Signature:
+            bytes OR bytearray OR memoryview -> bytes
+        
+        Args:
+            Data: bytes OR bytearray OR memoryview; data to be encoded
+        
+        Returns:
+            bytes: encoded byte-string
+        
+        Version 1.0.1.0
+        """
+        BlockLength = 65024
+        View = memoryview(Data)
+        DataLength = len(Data)
+        Parts = []
+        Start = 0
+        while True:
+            Zero = cls._findZero(Data, Start)
+            End = DataLength if Zero < 0 else Zero
+            Position = Start
+            while End - Position >= BlockLength:
+                Parts.append(b'\xff\xff')
+                Parts.append(View[Position : Position + BlockLength])
+                Position += BlockLength
+            if (Zero >= 0) or (Position < End) or (Start == End):
+                #not a packet ending with 65024*(k>0) non-zero bytes
+                Length = End - Position
+                Parts.append(bytes((Length // 255 + 1, Length % 255 + 1)))
+                Parts.append(View[Position : End])
+            if Zero < 0:
+                break
+            Start = Zero + 1
+        Result = b''.join(Parts)
+        return Result
+
+    @classmethod
+    def _decodeWide(cls, Input: TBuffer) -> bytes:
+        """
+        Helper 'private' method implementing the COBS/16 (2-bytes codes)
+        decoding of the data already stripped of the leading and tailing
+        delimiters and checked for the absence of the zero characters. A single
+        byte left after the last block (incomplete code) is ignored.
+
+        Class method.
+
+        Signature:
+            bytes OR bytearray OR memoryview -> bytes
+        
+        Args:
+            Input: bytes OR bytearray OR memoryview; data to be decoded without
+                any zero characters
+        
+        Returns:
+            bytes: decoded byte-string
+        
+        Version 1.0.1.0
+        """
+        BlockLength = 65024
+        View = memoryview(Input)
+        DataLength = len(Input)
+        Parts = []
+        Index = 0
+        while Index + 1 < DataLength:
+            Length = (Input[Index] - 1) * 255 + Input[Index + 1] - 1
+            Index += 2
+            Parts.append(View[Index : Index + Length])
+            Index += Length
+            if (Length < BlockLength) and (Index < DataLength):
+                Parts.append(b'\x00')
+        Result = b''.join(Parts)
+        return Result
+
+    @classmethod
+    def _getDecoder(cls, Mode: str) -> Callable[[TBuffer], bytes]:
+        """
+        Helper 'private' method to select the decoding core of the given variant
+        of the algorithm, which accepts the data already stripped of the
+        delimiters and checked for the absence of the zero characters.
+
+        Class method.
+
+        Signature:
+            str -> (bytes OR bytearray OR memoryview -> bytes)
+        
+        Args:
+            Mode: str; the variant of the algorithm
+        
+        Returns:
+            bytes OR bytearray OR memoryview -> bytes: the decoding core
+        
+        Version 1.0.0.0
+        """
+        if Mode == 'COBS/R':
+            Result = cls._decodeReduced
+        elif Mode == 'COBS/ZPE':
+            Result = cls._decodeZPE
+        elif Mode == 'COBS/16':
+            Result = cls._decodeWide
+        else:
+            Result = cls._decode
+        return Result
+
+    @classmethod
+    def _decodeFrames(cls, Data: bytes, Mode: str) -> List[bytes]:
+        """
+        Helper 'private' method to decode all frames delimited by one or more
+        b'\x00' characters in a byte-string without any input checks. The
+        empty frames are ignored.
+
+        Class method.
+
+        Signature:
+            bytes, str -> list(bytes)
+        
+        Args:
+            Data: bytes; the delimited frames
+            Mode: str; the variant of the algorithm
+        
+        Returns:
+            list(bytes): decoded frames
+        
+        Version 1.0.1.0
+        """
+        _decode = cls._getDecoder(Mode)
+        Result = [_decode(Frame) for Frame in Data.split(b'\x00') if Frame]
+        return Result
+
+    @classmethod
+    def _iterFrames(cls, Data: TBuffer, Mode: str
+                        ) -> Generator[Tuple[bytes, int, int], None, int]:
+        """
+        Helper 'private' generator method implementing the method iterFrames()
+        without any input checks. The frames are located by the search of the
+        delimiters and decoded as slices of a memoryview of the data, which is
+        released when the generator is exhausted or closed.
+
+        Class method.
+
+        Signature:
+            bytes OR bytearray OR memoryview, str
+                -> generator(tuple(bytes, int >= 0, int > 0)) -> int >= 0
+        
+        Args:
+            Data: bytes OR bytearray OR memoryview; the delimited frames
+            Mode: str; the variant of the algorithm
+        
+        Yields:
+            tuple(bytes, int >= 0, int > 0): decoded frame, start and end of
+                the encoded frame within the data
+        
+        Returns:
+            int >= 0: start of the unconsumed tail of the data
+        
+        Version 1.0.0.0
+        """
+        _decode = cls._getDecoder(Mode)
+        Start = 0
+        with memoryview(Data) as View:
+            for Match in ZERO_SEARCH.finditer(View):
+                End = Match.start()
+                if End > Start:
+                    yield _decode(View[Start : End]), Start, End
+                Start = End + 1
+        return Start
+
+    @classmethod
+    def _iterCapture(cls, Path: str, Mode: str, Workers: int,
+                                ChunkSize: int) -> Iterator[List[bytes]]:
+        """
+        Helper 'private' generator method splitting a capture file into ranges
+        of approximately the given size on the frames boundaries and yielding
+        the lists of the decoded frames for each range in order. The ranges are
+        distributed across a pool of processes, with no more than twice as many
+        ranges being processed or held as the number of workers; a single
+        range, or a single worker, is processed in the current process.
+
+        Class method.
+
+        Signature:
+            str, str, int > 0, int > 0 -> iterator(list(bytes))
+        
+        Args:
+            Path: str; path to the capture file
+            Mode: str; the variant of the algorithm
+            Workers: int > 0; number of the worker processes
+            ChunkSize: int > 0; approximate length of a range in bytes
+        
+        Yields:
+            list(bytes): decoded frames within a range
+        
+        Version 1.0.1.0
+        """
+        Ranges = []
+        if os.path.getsize(Path):
+            with open(Path, 'rb') as File:
+                with mmap.mmap(File.fileno(), 0,
+                                        access = mmap.ACCESS_READ) as Mapped:
+                    Size = len(Mapped)
+                    Start = 0
+                    while Start < Size:
+                        End = Start + ChunkSize
+                        if End < Size:
+                            Zero = Mapped.find(b'\x00', End - 1)
+                            End = Size if Zero < 0 else Zero + 1
+                        else:
+                            End = Size
+                        Ranges.append((Start, End))
+                        Start = End
+        if (len(Ranges) < 2) or (Workers == 1):
+            for Start, End in Ranges:
+                yield _decodeCaptureRange(cls, Path, Start, End, Mode)
+        else:
+            import concurrent.futures
+            with concurrent.futures.ProcessPoolExecutor(
+                                                max_workers = Workers) as Pool:
+                Pending = collections.deque()
+                for Start, End in Ranges:
+                    Pending.append(Pool.submit(_decodeCaptureRange, cls, Path,
+                                                            Start, End, Mode))
+                    if len(Pending) >= 2 * Workers:
+                        yield Pending.popleft().result()
+                while Pending:
+                    yield Pending.popleft().result()
+
+    @classmethod
+    def _scanFrame(cls, View: memoryview, Mode: str) -> int:
+        """
+        Helper 'private' method walking the chain of the code bytes of a frame
+        in the given variant of the algorithm without building the decoded
+        data. Only the code bytes are visited, whereas the absence of the zero
+        characters is checked by a single search, thus the frame is scanned in
+        O(number of blocks) Python operations. The leading and tailing
+        delimiters are ignored.
+
+        Class method.
+
+        Signature:
+            memoryview, str -> int >= -1
+        
+        Args:
+            View: memoryview; 1D unsigned bytes view of the frame
+            Mode: str; the variant of the algorithm
+        
+        Returns:
+            int >= 0: the length of the decoded data, if the frame is
+                well-formed
+            int = -1: the frame is empty, contains a zero character not in the
+                leading or tailing position, or its last code block is
+                truncated
+        
+        Version 1.0.0.0
+        """
+        Start = 0
+        End = len(View)
+        while Start < End and not View[Start]:
+            Start += 1
+        while End > Start and not View[End - 1]:
+            End -= 1
+        if (Start == End) or not (ZERO_SEARCH.search(View, Start, End) is None):
+            return -1
+        Index = Start
+        Result = 0
+        if Mode == 'COBS/ZPE':
+            while Index < End:
+                Code = View[Index]
+                if Code == 0xE0:
+                    Index += 224
+                    Result += 223
+                elif Code > 0xE0:
+                    Index += Code - 0xE0
+                    Result += Code - 0xDF
+                else:
+                    Index += Code
+                    Result += Code
+            if Code != 0xE0:
+                Result -= 1 #virtual zero
+        elif Mode == 'COBS/16':
+            while Index + 1 < End:
+                Length = (View[Index] - 1) * 255 + View[Index + 1] - 1
+                Index += Length + 2
+                Result += Length
+                if (Length < 65024) and (Index < End):
+                    Result += 1
+        else:
+            while Index < End:
+                Code = View[Index]
+                Index += Code
+                Result += Code - 1
+                if (Code < 255) and (Index < End):
+                    Result += 1
+            if (Mode == 'COBS/R') and (Index > End):
+                Result -= Index - End - 1 #last code is the last data byte
+                Index = End
+        if Index != End:
+            Result = -1
+        return Result
+
+    #public API
+
+    @classmethod
+    def encode(cls, Data: TBuffer, *, Mode: Optional[str] = None) -> bytes:
+        """
+        Encodes a byte string using COBS algorithm. Note that the frame
+        delimiter b'\x00' is not added!
+
+        Any C-contiguous object supporting the buffer protocol is accepted as
+        the input, e.g. memoryview slices of a receive buffer, array or mmap,
+        and it is encoded in place, without copying.
+
+        The variant of the algorithm can be selected: 'COBS' - the plain COBS
+        (default), 'COBS/R' - the reduced COBS, which often saves one byte per
+        frame, 'COBS/ZPE' - COBS with zero pair elimination, which saves one
+        byte per each pair of consecutive zeroes in the data, or 'COBS/16' -
+        COBS with 2-bytes codes and the blocks of up to 65024 bytes, which
+        reduces the overhead on the large frames. The same variant must be used
+        for the decoding.
+
+        Class method.
+        
+        Signature:
+            buffer/, *, str OR None/ -> bytes
+        
+        Args:
+            Data: buffer; data to be encoded, e.g. bytes, bytearray, memoryview
+                or mmap
+            Mode: (keyword) str OR None; the variant of the algorithm - 'COBS',
+                'COBS/R', 'COBS/ZPE' or 'COBS/16', None (default) means 'COBS'
+        
+        Returns:
+            bytes: encoded byte-string
+        
+        Raises:
+            UT_TypeError: input does not support the buffer protocol or is not
+                C-contiguous, OR the mode is neither a string nor None
+            UT_ValueError: the mode is not a supported variant
+        
+        Version 1.4.0.0
+        """
+        Data = cls._checkType(Data)
+        Mode = cls._checkMode(Mode)
+        if Mode == 'COBS/R':
+            Result = cls._encodeReduced(Data)
+        elif Mode == 'COBS/ZPE':
+            Result = cls._encodeZPE(Data)
+        elif Mode == 'COBS/16':
+            Result = cls._encodeWide(Data)
+        else:
+            Result = cls._encode(Data)
+        return Result
+
+    @classmethod
+    def decode(cls, Data: TBuffer, *, Mode: Optional[str] = None,
+                                    Backend: Optional[str] = None) -> bytes:
+        """
+        Decodes a byte string using COBS algorithm. Note that the leading and
+        tailing delimiters b'\x00' are removed automatically!
+
+        The variant of the algorithm ('COBS', 'COBS/R', 'COBS/ZPE' or
+        'COBS/16') must be the same as used for the encoding, see the method
+        encode().
+
+        The implementation can be selected explicitly: 'c' - the compiled core,
+        'numpy' - the NumPy vectorized one (faster than pure Python on large
+        buffers) or 'python' - the pure Python one. By default, the compiled
+        core is used if available, otherwise the NumPy one for the data longer
+        than 64 KiB if NumPy is installed, otherwise the pure Python one.
+
+        Any C-contiguous object supporting the buffer protocol is accepted as
+        the input, e.g. memoryview slices of a receive buffer, array or mmap;
+        the delimiters are stripped and the frame is decoded in place, without
+        copying.
+        
+        Class method.
+        
+        Signature:
+            buffer/, *, str OR None/ -> bytes
+        
+        Args:
+            Data: buffer; data to be decoded, e.g. bytes, bytearray, memoryview
+                or mmap
+            Mode: (keyword) str OR None; the variant of the algorithm - 'COBS',
+                'COBS/R', 'COBS/ZPE' or 'COBS/16', None (default) means 'COBS'
+            Backend: (keyword) str OR None; implementation to use - 'c',
+                'numpy' or 'python', None (default) means automatic selection;
+                the 'COBS/ZPE' and 'COBS/16' variants are always decoded in
+                pure Python
+        
+        Returns:
+            bytes: decoded byte-string
+        
+        Raises:
+            UT_ValueError: a zero character ('\x00') in the passed data not in
+                the leading or tailing position, OR the requested backend is
+                unknown or not available, OR the mode is not a supported
+                variant
+            UT_TypeError: input does not support the buffer protocol or is not
+                C-contiguous, OR the backend or mode is neither a string nor
+                None
+        
+        Version 1.5.0.0
+        """
+        Input = cls._checkType(Data)
+        Mode = cls._checkMode(Mode)
+        if not (Backend is None):
+            if not isinstance(Backend, str):
+                raise UT_TypeError(Backend, str, SkipFrames = 1)
+            Available = [Name for Name, Flag in (
+                                    ('c', not (cls._Extension is None)),
+                                    ('numpy', cls._Numpy), ('python', True))
+                                                                    if Flag]
+            if not (Backend in Available):
+                ErrorMessage = 'an available backend in {}'.format(Available)
+                raise UT_ValueError(Backend, ErrorMessage, SkipFrames = 1)
+        Input = cls._stripZeros(Input)
+        if cls._findZero(Input) >= 0:
+            ErrorMessage = 'Zero character in the encoded string'
+            raise UT_ValueError(Data, ErrorMessage, SkipFrames = 1)
+        if Mode == 'COBS/R':
+            Result = cls._decodeReduced(Input, Backend)
+        elif Mode == 'COBS/ZPE':
+            Result = cls._decodeZPE(Input)
+        elif Mode == 'COBS/16':
+            Result = cls._decodeWide(Input)
+        else:
+            Result = cls._decode(Input, Backend)
+        return Result
+
+    @classmethod
+    def encodeMany(cls, Frames: Sequence[TBuffer], *,
+                            Join: bool = False) -> Union[bytes, List[bytes]]:
+        """
+        Encodes a sequence of frames using COBS algorithm in a single call,
+        checking the type of each frame only once. The encoded frames are
+        returned either as a list, or joined into a single byte-string with each
+        frame followed by the delimiter b'\x00'.
+
+        Class method.
+
+        Signature:
+            seq(buffer)/, *, bool/ -> list(bytes) OR bytes
+        
+        Args:
+            Frames: seq(buffer); frames to be encoded, e.g. bytes, bytearray,
+                memoryview slices
+            Join: (keyword) bool; if True, the encoded frames are returned as
+                a single delimited byte-string, otherwise (default) - as a list
+        
+        Returns:
+            list(bytes): encoded frames, if Join is False
+            bytes: encoded frames each followed by b'\x00', if Join is True
+        
+        Raises:
+            UT_TypeError: input is not a sequence of C-contiguous objects
+                supporting the buffer protocol
+        
+        Version 1.1.0.0
+        """
+        if (not isinstance(Frames, c_abc.Sequence) or isinstance(Frames,
+                            (str, bytes, bytearray, memoryview, array.array))):
+            raise UT_TypeError(Frames, (list, tuple), SkipFrames = 1)
+        Buffers = []
+        for Frame in Frames:
+            Buffers.append(cls._checkType(Frame))
+        _encode = cls._encode
+        Result = [_encode(Frame) for Frame in Buffers]
+        if Join:
+            Result.append(b'')
+            Result = b'\x00'.join(Result)
+        return Result
+
+    @classmethod
+    def decodeMany(cls, Data: Union[TBuffer, Sequence[TBuffer]]
+                                                            ) -> List[bytes]:
+        """
+        Decodes a batch of frames using COBS algorithm in a single call. The
+        frames can be passed either as a single buffer (byte-string, bytes
+        array, memoryview, mmap, etc.), where they are delimited by one or more
+        b'\x00' characters, or as a sequence of buffers, in which case the
+        leading and tailing delimiters of each frame are removed automatically.
+        The empty frames (consecutive delimiters) in a single buffer are
+        ignored. The frames are decoded in place, without copying.
+
+        Class method.
+
+        Signature:
+            buffer OR seq(buffer) -> list(bytes)
+        
+        Args:
+            Data: buffer OR seq(buffer); frames to be decoded
+        
+        Returns:
+            list(bytes): decoded frames
+        
+        Raises:
+            UT_TypeError: input is neither a C-contiguous object supporting the
+                buffer protocol nor a sequence of them
+            UT_ValueError: a zero character ('\x00') in any of the passed frames
+                not in the leading or tailing position, only if a sequence of
+                frames is passed
+        
+        Version 1.1.0.0
+        """
+        _decode = cls._decode
+        if (isinstance(Data, (bytes, bytearray, memoryview, array.array))
+                        or not isinstance(Data, (str, c_abc.Sequence))):
+            try:
+                Data = cls._checkType(Data)
+            except UT_TypeError:
+                raise UT_TypeError(Data, (bytes, bytearray, list, tuple),
+                                                    SkipFrames = 1) from None
+            Result = [_decode(Frame) for Frame in cls._splitZeros(Data)
+                                                                    if Frame]
+        elif not isinstance(Data, str):
+            Frames = []
+            for Frame in Data:
+                Frames.append(cls._stripZeros(cls._checkType(Frame)))
+            for Index, Frame in enumerate(Frames):
+                if cls._findZero(Frame) >= 0:
+                    ErrorMessage = 'Zero character in the encoded frame #{}'
+                    raise UT_ValueError(Data[Index],
+                                ErrorMessage.format(Index), SkipFrames = 1)
+            Result = [_decode(Frame) for Frame in Frames]
+        else:
+            raise UT_TypeError(Data, (bytes, bytearray, list, tuple),
+                                                                SkipFrames = 1)
+        return Result
+
+    @classmethod
+    def iterFrames(cls, Data: TBuffer, *, Mode: Optional[str] = None
+                        ) -> Generator[Tuple[bytes, int, int], None, int]:
+        """
+        Splits a (large) receive buffer into the frames delimited by one or
+        more b'\x00' characters and decodes them lazily, one by one. Each frame
+        is decoded directly from a memoryview slice of the buffer, i.e. without
+        copying. Only the frames terminated by a delimiter are yielded; the
+        empty frames (consecutive delimiters) are ignored. The start of the
+        unconsumed tail (an incomplete frame to be completed by the next read)
+        is the return value of the generator, i.e. the value of the
+        StopIteration exception, or the result of 'yield from'. It is also
+        equal to the end of the last yielded frame plus one, unless the frame
+        is followed by more delimiters.
+
+        Note that the buffer cannot be resized (e.g. a bytearray cannot be
+        trimmed) until the generator is exhausted or closed.
+
+        Class method.
+
+        Signature:
+            buffer/, *, str OR None/
+                -> generator(tuple(bytes, int >= 0, int > 0)) -> int >= 0
+        
+        Args:
+            Data: buffer; the delimited frames, e.g. bytes, bytearray,
+                memoryview or mmap
+            Mode: (keyword) str OR None; the variant of the algorithm - 'COBS',
+                'COBS/R', 'COBS/ZPE' or 'COBS/16', None (default) means 'COBS'
+        
+        Yields:
+            tuple(bytes, int >= 0, int > 0): the decoded frame, the start and
+                the end (exclusive) of the encoded frame within the buffer
+        
+        Returns:
+            int >= 0: start of the unconsumed tail of the buffer
+        
+        Raises:
+            UT_TypeError: input does not support the buffer protocol or is not
+                C-contiguous, OR the mode is neither a string nor None
+            UT_ValueError: the mode is not a supported variant
+        
+        Version 1.0.0.0
+        """
+        Data = cls._checkType(Data)
+        Mode = cls._checkMode(Mode)
+        Result = cls._iterFrames(Data, Mode)
+        return Result
+
+    @classmethod
+    def decodeCapture(cls, Path: TPath, *, Output: Optional[TPath] = None,
+                    Mode: Optional[str] = None, Workers: Optional[int] = None,
+                    ChunkSize: int = 4194304) -> Union[List[bytes], int]:
+        """
+        Decodes all frames delimited by one or more b'\x00' characters in a
+        (large) capture file using a pool of processes. The file is memory
+        mapped and split into ranges of approximately ChunkSize bytes on the
+        frames boundaries, which are decoded in parallel. The decoded frames
+        are either returned as a list in order, or written into the output file
+        one after another (without any delimiters). The result is the same as of
+        the method decodeMany() applied to the entire content of the file. The
+        empty frames (consecutive delimiters) are ignored.
+
+        Class method.
+
+        Signature:
+            str OR os.PathLike/, *, str OR os.PathLike OR None, str OR None,
+                int > 0 OR None, int > 0/ -> list(bytes) OR int >= 0
+        
+        Args:
+            Path: str OR os.PathLike; path to the capture file
+            Output: (keyword) str OR os.PathLike OR None; path to the output
+                file, None (default) means that the frames are returned
+            Mode: (keyword) str OR None; the variant of the algorithm - 'COBS',
+                'COBS/R', 'COBS/ZPE' or 'COBS/16', None (default) means 'COBS'
+            Workers: (keyword) int > 0 OR None; number of the worker processes,
+                None (default) means the number of CPUs
+            ChunkSize: (keyword) int > 0; approximate length of the file range
+                processed by a worker at once, 4 MiB by default
+        
+        Returns:
+            list(bytes): decoded frames, if the output file is not given
+            int >= 0: number of the decoded frames written into the output file
+        
+        Raises:
+            UT_TypeError: either of the paths is neither a string nor a
+                path-like object, OR the mode is neither a string nor None, OR
+                the number of workers or the chunk size is not an integer
+            UT_ValueError: the mode is not a supported variant, OR the number of
+                workers or the chunk size is not positive
+            OSError: the capture file cannot be read, OR the output file cannot
+                be written
+        
+        Version 1.0.0.0
+        """
+        Path = cls._checkPath(Path)
+        if not (Output is None):
+            Output = cls._checkPath(Output)
+        Mode = cls._checkMode(Mode)
+        if Workers is None:
+            Workers = os.cpu_count() or 1
+        for Value in (Workers, ChunkSize):
+            if (not isinstance(Value, int)) or isinstance(Value, bool):
+                raise UT_TypeError(Value, int, SkipFrames = 1)
+            if Value <= 0:
+                raise UT_ValueError(Value, 'positive integer', SkipFrames = 1)
+        Ranges = cls._iterCapture(Path, Mode, Workers, ChunkSize)
+        if Output is None:
+            Result = []
+            for Frames in Ranges:
+                Result.extend(Frames)
+        else:
+            Result = 0
+            with open(Output, 'wb') as File:
+                for Frames in Ranges:
+                    File.writelines(Frames)
+                    Result += len(Frames)
+        return Result
+
+    @classmethod
+    def encodeFile(cls, Source: TPath, Target: TPath) -> int:
+        """
+        Encodes the entire content of a file of arbitrary size as a single
+        packet using COBS algorithm and writes the result into another file.
+        The source file is memory mapped and encoded in windows of about 1 MiB
+        ending at a zero character or at a block boundary, each passed at once
+        to the encoding core (compiled, if available), thus the memory
+        consumption does not depend on the size of the file. The result is the
+        same as of the method encode() applied to the entire content of the
+        source file. Note that the frame delimiter b'\x00' is not added!
+
+        Class method.
+
+        Signature:
+            str OR os.PathLike, str OR os.PathLike -> int > 0
+        
+        Args:
+            Source: str OR os.PathLike; path to the file to be encoded
+            Target: str OR os.PathLike; path to the output file
+        
+        Returns:
+            int > 0: number of the encoded bytes written into the output file
+        
+        Raises:
+            UT_TypeError: either of the paths is neither a string nor a
+                path-like object
+            UT_ValueError: the source and target are the same file
+            OSError: the source file cannot be read, OR the output file cannot
+                be written
+        
+        Version 1.1.0.0
+        """
+        Source = cls._checkPath(Source)
+        Target = cls._checkPath(Target)
+        if os.path.exists(Target) and os.path.samefile(Source, Target):
+            raise UT_ValueError(Target, 'not the source file', SkipFrames = 1)
+        BlockLength = 254
+        Result = 0
+        with open(Source, 'rb') as Input, open(Target, 'wb') as Output:
+            if os.fstat(Input.fileno()).st_size:
+                Mapped = mmap.mmap(Input.fileno(), 0, access = mmap.ACCESS_READ)
+            else:
+                Mapped = b''
+            View = memoryview(Mapped)
+            try:
+                Start = 0
+                Length = len(Mapped)
+                while True:
+                    Stop = min(Start + max(cls._FileChunkSize, BlockLength),
+                                                                        Length)
+                    if Stop == Length: #the last window - virtual end zero
+                        Result += Output.write(cls._encode(View[Start : ]))
+                        break
+                    Zero = Mapped.rfind(b'\x00', Start, Stop)
+                    if Zero >= 0:
+                        #window up to a zero, the empty block encoding the
+                        #virtual end zero is dropped
+                        Encoded = cls._encode(View[Start : Zero + 1])
+                        Result += Output.write(memoryview(Encoded)[ : -1])
+                        Start = Zero + 1
+                    else:
+                        #window of the full blocks only
+                        Cut = Stop - (Stop - Start) % BlockLength
+                        Result += Output.write(cls._encode(View[Start : Cut]))
+                        Start = Cut
+            finally:
+                View.release()
+                if isinstance(Mapped, mmap.mmap):
+                    Mapped.close()
+        return Result
+
+    @classmethod
+    def decodeFile(cls, Source: TPath, Target: TPath) -> int:
+        """
+        Decodes the entire content of a file of arbitrary size as a single
+        packet using COBS algorithm and writes the result into another file.
+        The source file is memory mapped and decoded in windows of about 1 MiB
+        ending at a block boundary, each passed at once to the decoding core
+        (compiled, if available), thus the memory consumption does not depend
+        on the size of the file. The result is the same as of the method
+        decode() applied to the entire content of the source file. Note that
+        the leading and tailing delimiters b'\x00' are ignored!
+
+        Class method.
+
+        Signature:
+            str OR os.PathLike, str OR os.PathLike -> int >= 0
+        
+        Args:
+            Source: str OR os.PathLike; path to the file to be decoded
+            Target: str OR os.PathLike; path to the output file
+        
+        Returns:
+            int >= 0: number of the decoded bytes written into the output file
+        
+        Raises:
+            UT_TypeError: either of the paths is neither a string nor a
+                path-like object
+            UT_ValueError: the source and target are the same file, OR a zero
+                character ('\x00') in the source file not in the leading or
+                tailing position, in which case the output file is not created
+            OSError: the source file cannot be read, OR the output file cannot
+                be written
+        
+        Version 1.1.0.0
+        """
+        Source = cls._checkPath(Source)
+        Target = cls._checkPath(Target)
+        if os.path.exists(Target) and os.path.samefile(Source, Target):
+            raise UT_ValueError(Target, 'not the source file', SkipFrames = 1)
+        Result = 0
+        with open(Source, 'rb') as Input:
+            if os.fstat(Input.fileno()).st_size:
+                Mapped = mmap.mmap(Input.fileno(), 0, access = mmap.ACCESS_READ)
+            else:
+                Mapped = b''
+            Match = NON_ZERO_SEARCH.search(Mapped)
+            Start = Match.start() if Match else 0
+            End = len(Mapped)
+            while (End > Start) and not Mapped[End - 1]:
+                End -= 1
+            View = memoryview(Mapped)
+            try:
+                if Mapped.find(b'\x00', Start, End) >= 0:
+                    ErrorMessage = 'Zero character in the encoded file'
+                    raise UT_ValueError(Source, ErrorMessage, SkipFrames = 1)
+                with open(Target, 'wb') as Output:
+                    Index = Start
+                    while Index < End:
+                        #only the code bytes are visited to find the end of
+                        #the window at a block boundary
+                        WindowEnd = Index
+                        Limit = min(Index + cls._FileChunkSize, End)
+                        while WindowEnd < Limit:
+                            LastCode = Mapped[WindowEnd]
+                            WindowEnd += LastCode
+                        WindowEnd = min(WindowEnd, End)
+                        Result += Output.write(
+                                        cls._decode(View[Index : WindowEnd]))
+                        if (LastCode < 255) and (WindowEnd < End):
+                            Result += Output.write(b'\x00')
+                        Index = WindowEnd
+            finally:
+                View.release()
+                if isinstance(Mapped, mmap.mmap):
+                    Mapped.close()
+        return Result
+
+    @classmethod
+    def validate(cls, Data: TBuffer, *, Mode: Optional[str] = None) -> bool:
+        """
+        Checks if the data is a well-formed COBS encoded frame without decoding
+        it: not empty, without zero characters except the leading and tailing
+        delimiters (which are ignored), and with the chain of the code bytes
+        ending exactly at the end of the data, i.e. without a truncated last
+        block. Only the code bytes are visited.
+
+        Class method.
+
+        Signature:
+            buffer/, *, str OR None/ -> bool
+        
+        Args:
+            Data: buffer; data to be checked, e.g. bytes, bytearray, memoryview
+                or mmap
+            Mode: (keyword) str OR None; the variant of the algorithm - 'COBS',
+                'COBS/R', 'COBS/ZPE' or 'COBS/16', None (default) means 'COBS'
+        
+        Returns:
+            bool: True if the frame is well-formed, False otherwise
+        
+        Raises:
+            UT_TypeError: input does not support the buffer protocol, OR the
+                mode is neither a string nor None
+            UT_ValueError: the mode is not a supported variant
+        
+        Version 1.0.0.0
+        """
+        View = cls._getView(Data)
+        Mode = cls._checkMode(Mode)
+        Result = cls._scanFrame(View, Mode) >= 0
+        return Result
+
+    @classmethod
+    def decodedLength(cls, Data: TBuffer, *, Mode: Optional[str] = None) -> int:
+        """
+        Calculates the length of the decoded data of a COBS encoded frame
+        without decoding it, e.g. in order to allocate the output buffer for
+        the method decodeInto(). Only the code bytes are visited. The leading
+        and tailing delimiters are ignored.
+
+        Class method.
+
+        Signature:
+            buffer/, *, str OR None/ -> int >= 0
+        
+        Args:
+            Data: buffer; data to be checked, e.g. bytes, bytearray, memoryview
+                or mmap
+            Mode: (keyword) str OR None; the variant of the algorithm - 'COBS',
+                'COBS/R', 'COBS/ZPE' or 'COBS/16', None (default) means 'COBS'
+        
+        Returns:
+            int >= 0: the length of the decoded data
+        
+        Raises:
+            UT_TypeError: input does not support the buffer protocol, OR the
+                mode is neither a string nor None
+            UT_ValueError: the mode is not a supported variant, OR the frame is
+                not well-formed - see the method validate()
+        
+        Version 1.0.0.0
+        """
+        View = cls._getView(Data)
+        Mode = cls._checkMode(Mode)
+        Result = cls._scanFrame(View, Mode)
+        if Result < 0:
+            raise UT_ValueError(Data, 'well-formed {} frame'.format(Mode),
+                                                                SkipFrames = 1)
+        return Result
+
+    @classmethod
+    def maxEncodedLength(cls, Length: int) -> int:
+        """
+        Calculates the worst case length of the COBS encoded data of the given
+        length, i.e. the size of the output buffer sufficient for the encoding
+        of any data of this length.
+
+        Class method.
+
+        Signature:
+            int >= 0 -> int > 0
+        
+        Args:
+            Length: int >= 0; length of the data to be encoded
+        
+        Returns:
+            int > 0: maximum possible length of the encoded data
+        
+        Raises:
+            UT_TypeError: argument is not an integer
+            UT_ValueError: argument is a negative integer
+        
+        Version 1.0.0.0
+        """
+        if (not isinstance(Length, int)) or isinstance(Length, bool):
+            raise UT_TypeError(Length, int, SkipFrames = 1)
+        if Length < 0:
+            raise UT_ValueError(Length, 'non-negative integer', SkipFrames = 1)
+        Result = max(1, Length + (Length + 253) // 254)
+        return Result
+
+    @classmethod
+    def encodeInto(cls, Data: TBuffer, Output: TBuffer) -> int:
+        """
+        Encodes a byte string using COBS algorithm directly into a preallocated
+        writable buffer without creation of the intermediate objects, thus the
+        same buffer (or consecutive slices of a memoryview) can be re-used for
+        many frames. Any object supporting the buffer protocol is accepted as
+        the input, including memoryview and mmap. The sufficient size of the
+        output can be calculated with the method maxEncodedLength(). Note that
+        the frame delimiter b'\x00' is not added!
+
+        Class method.
+
+        Signature:
+            buffer, writable buffer -> int > 0
+        
+        Args:
+            Data: buffer; data to be encoded, e.g. bytes, bytearray, memoryview
+                or mmap
+            Output: writable buffer; the destination, e.g. bytearray, writable
+                memoryview or mmap, the encoded data is placed at its start
+        
+        Returns:
+            int > 0: number of the encoded bytes written into the output
+        
+        Raises:
+            UT_TypeError: input does not support the buffer protocol, OR the
+                output is not a writable buffer
+            UT_ValueError: the output buffer is too small, in which case its
+                content is partially overwritten
+        
+        Version 1.0.0.0
+        """
+        BlockLength = 254
+        View = cls._getView(Data)
+        Target = cls._getView(Output, Writable = True)
+        TargetLength = len(Target)
+        DataLength = len(View)
+        Index = 0
+        Written = 0
+        while True:
+            Stop = min(Index + BlockLength, DataLength)
+            Match = ZERO_SEARCH.search(View, Index, Stop)
+            End = Stop if Match is None else Match.start()
+            Code = End - Index + 1
+            if Written + Code > TargetLength:
+                raise UT_ValueError(Output, 'buffer of sufficient size',
+                                                                SkipFrames = 1)
+            Target[Written] = Code
+            Target[Written + 1 : Written + Code] = View[Index : End]
+            Written += Code
+            if Match is None:
+                Index = End
+                if Index >= DataLength: #no trailing code after the last block
+                    break
+            else:
+                Index = End + 1
+        return Written
+
+    @classmethod
+    def decodeInto(cls, Data: TBuffer, Output: TBuffer) -> int:
+        """
+        Decodes a byte string using COBS algorithm directly into a preallocated
+        writable buffer without creation of the intermediate objects, thus the
+        same buffer can be re-used for many frames. Any object supporting the
+        buffer protocol is accepted as the input, including memoryview and mmap.
+        Note that the leading and tailing delimiters b'\x00' are ignored!
+
+        Class method.
+
+        Signature:
+            buffer, writable buffer -> int >= 0
+        
+        Args:
+            Data: buffer; data to be decoded, e.g. bytes, bytearray, memoryview
+                or mmap
+            Output: writable buffer; the destination, e.g. bytearray, writable
+                memoryview or mmap, the decoded data is placed at its start
+        
+        Returns:
+            int >= 0: number of the decoded bytes written into the output
+        
+        Raises:
+            UT_TypeError: input does not support the buffer protocol, OR the
+                output is not a writable buffer
+            UT_ValueError: a zero character ('\x00') in the passed data not in
+                the leading or tailing position, OR the output buffer is too
+                small, in which case its content is partially overwritten
+        
+        Version 1.0.0.0
+        """
+        View = cls._getView(Data)
+        Target = cls._getView(Output, Writable = True)
+        Start = 0
+        End = len(View)
+        while Start < End and not View[Start]:
+            Start += 1
+        while End > Start and not View[End - 1]:
+            End -= 1
+        if not (ZERO_SEARCH.search(View, Start, End) is None):
+            ErrorMessage = 'Zero character in the encoded string'
+            raise UT_ValueError(Data, ErrorMessage, SkipFrames = 1)
+        TargetLength = len(Target)
+        ErrorMessage = 'buffer of sufficient size'
+        Index = Start
+        Written = 0
+        while Index < End:
+            Code = View[Index]
+            Index += 1
+            if Code > 1:
+                Length = min(Code - 1, End - Index)
+                if Written + Length > TargetLength:
+                    raise UT_ValueError(Output, ErrorMessage, SkipFrames = 1)
+                Target[Written : Written + Length] = View[Index :
+                                                            Index + Length]
+                Written += Length
+                Index += Code - 1
+            if (Code < 255) and (Index < End):
+                if Written >= TargetLength:
+                    raise UT_ValueError(Output, ErrorMessage, SkipFrames = 1)
+                Target[Written] = 0
+                Written += 1
+        return Written
+
+
+class COBS_StreamDecoder:
+    """
+    Incremental COBS decoder for a continuous data feed, e.g. a serial port or
+    a socket, where the b'\x00' characters are used as the packet delimiters.
+    The data can be fed in arbitrary chunks; the state of a partially received
+    frame is kept between the calls, and each chunk is scanned only once.
+
+    The frames returned are the same as obtained by splitting the entire feed
+    by b'\x00' and passing each non-empty piece into COBS_Coder.decode().
+
+    Methods:
+        feed(Data):
+            buffer -> list(bytes)
+        reset():
+            None -> None
+    
+    Version 1.0.0.0
+    """
+
+    #special methods
+
+    def __init__(self) -> None:
+        """
+        Initializer. Sets the decoder into the initial state - awaiting the
+        start of a frame.
+
+        Signature:
+            None -> None
+        
+        Version 1.0.0.0
+        """
+        self.reset()
+
+    #private methods
+
+    def _finishFrame(self) -> bytes:
+        """
+        Helper 'private' method to retrieve the decoded content of the current
+        frame and to return the decoder into the initial state.
+
+        Signature:
+            None -> bytes
+        
+        Returns:
+            bytes: the decoded frame
+        
+        Version 1.0.0.0
+        """
+        Result = bytes(self._Frame)
+        self.reset()
+        return Result
+
+    #public API
+
+    def reset(self) -> None:
+        """
+        Discards the partially received frame (if any) and sets the decoder
+        into the initial state - awaiting the start of a frame.
+
+        Signature:
+            None -> None
+        
+        Version 1.0.0.0
+        """
+        self._Frame = bytearray()
+        self._Remaining = 0
+        self._PendingZero = False
+        self._InFrame = False
+
+    def feed(self, Data: TBuffer) -> List[bytes]:
+        """
+        Processes the next chunk of the data feed and returns all frames
+        completed within this chunk (i.e. terminated by b'\x00') as decoded
+        byte-strings. The unterminated frame is kept for the next call. The
+        empty frames (consecutive delimiters) are ignored.
+
+        Signature:
+            buffer -> list(bytes)
+        
+        Args:
+            Data: buffer; the next chunk of the COBS encoded feed, e.g. bytes,
+                bytearray or memoryview slice of a receive buffer
+        
+        Returns:
+            list(bytes): decoded frames completed within this chunk, possibly
+                an empty list
+        
+        Raises:
+            UT_TypeError: input does not support the buffer protocol or is not
+                C-contiguous
+        
+        Version 1.1.0.0
+        """
+        Data = COBS_Coder._checkType(Data)
+        Frames = []
+        View = memoryview(Data)
+        Position = 0
+        DataLength = len(Data)
+        while Position < DataLength:
+            if self._Remaining:
+                Stop = min(Position + self._Remaining, DataLength)
+                Zero = COBS_Coder._findZero(Data, Position, Stop)
+                if Zero < 0:
+                    self._Frame += View[Position : Stop]
+                    self._Remaining -= Stop - Position
+                    Position = Stop
+                else: #truncated block - the delimiter ends the frame
+                    self._Frame += View[Position : Zero]
+                    Frames.append(self._finishFrame())
+                    Position = Zero + 1
+            else:
+                Code = Data[Position]
+                Position += 1
+                if not Code:
+                    if self._InFrame:
+                        Frames.append(self._finishFrame())
+                else:
+                    if self._PendingZero:
+                        self._Frame.append(0)
+                    self._InFrame = True
+                    self._Remaining = Code - 1
+                    self._PendingZero = Code < 255
+        View.release()
+        return Frames
+
+class COBS_StreamEncoder:
+    """
+    Incremental COBS encoder for a single packet passed in arbitrary chunks,
+    e.g. read from a large file. The encoded blocks are returned as soon as
+    either a zero character or the 254-th consecutive non-zero byte is
+    received, thus the internal buffer never exceeds one block. The encoding is
+    finished by the flush() method call, which returns the last block.
+
+    The concatenation of all returned data is the same as the result of
+    COBS_Coder.encode() applied to the concatenation of all chunks. Note that
+    the frame delimiter b'\x00' is not added!
+
+    Methods:
+        feed(Data):
+            buffer -> bytes
+        flush():
+            None -> bytes
+        reset():
+            None -> None
+    
+    Version 1.0.0.0
+    """
+
+    #special methods
+
+    def __init__(self) -> None:
+        """
+        Initializer. Sets the encoder into the initial state - awaiting the
+        start of a packet.
+
+        Signature:
+            None -> None
+        
+        Version 1.0.0.0
+        """
+        self.reset()
+
+    #public API
+
+    def reset(self) -> None:
+        """
+        Discards the buffered data (if any) and sets the encoder into the
+        initial state - awaiting the start of a packet.
+
+        Signature:
+            None -> None
+        
+        Version 1.0.0.0
+        """
+        self._Block = bytearray()
+        self._AfterFullBlock = False
+
+    def feed(self, Data: TBuffer) -> bytes:
+        """
+        Processes the next chunk of the packet and returns all blocks completed
+        within this chunk as encoded byte-string. The last incomplete block is
+        kept for the next call.
+
+        Signature:
+            buffer -> bytes
+        
+        Args:
+            Data: buffer; the next chunk of the data to be encoded, e.g. bytes,
+                bytearray, memoryview or mmap
+        
+        Returns:
+            bytes: encoded blocks completed within this chunk, possibly an
+                empty byte-string
+        
+        Raises:
+            UT_TypeError: input does not support the buffer protocol or is not
+                C-contiguous
+        
+        Version 1.1.0.0
+        """
+        BlockLength = 254
+        Data = COBS_Coder._checkType(Data)
+        Output = bytearray()
+        View = memoryview(Data)
+        Position = 0
+        DataLength = len(Data)
+        while Position < DataLength:
+            Stop = min(Position + BlockLength - len(self._Block), DataLength)
+            Zero = COBS_Coder._findZero(Data, Position, Stop)
+            if Zero < 0:
+                self._Block += View[Position : Stop]
+                Position = Stop
+                if len(self._Block) == BlockLength:
+                    Output.append(255)
+                    Output += self._Block
+                    self._Block.clear()
+                    self._AfterFullBlock = True
+            else:
+                self._Block += View[Position : Zero]
+                Output.append(len(self._Block) + 1)
+                Output += self._Block
+                self._Block.clear()
+                self._AfterFullBlock = False
+                Position = Zero + 1
+        View.release()
+        return bytes(Output)
+
+    def flush(self) -> bytes:
+        """
+        Finishes the encoding of the current packet, returns the last encoded
+        block and sets the encoder into the initial state, so the next packet
+        can be encoded.
+
+        Signature:
+            None -> bytes
+        
+        Returns:
+            bytes: the last encoded block, which can be an empty byte-string if
+                the packet ends with 254*k (k > 0) non-zero bytes
+        
+        Version 1.0.0.0
+        """
+        if self._Block or (not self._AfterFullBlock):
+            Result = bytes([len(self._Block) + 1]) + self._Block
+        else:
+            Result = b''
+        self.reset()
+        return Result
+
+class COBS_FrameReader:
+    """
+    Asynchronous reader of the COBS encoded frames delimited by b'\x00' from an
+    asyncio.StreamReader (e.g. socket, pipe or serial port stream). Each frame
+    is buffered by the stream reader itself up to the delimiter, thus the
+    transport is paused when the stream buffer limit is reached
+    (backpressure). The frames longer than the stream buffer limit are
+    received in parts and joined. The large frames are decoded in the default
+    executor in order not to block the event loop.
+
+    Supports the asynchronous iteration protocol: 'async for Frame in Reader'
+    yields the decoded frames until the end of the stream.
+
+    Methods:
+        readFrame():
+            None -> bytes OR None
+    
+    Version 1.0.0.0
+    """
+
+    #private class attributes
+
+    _ExecutorThreshold = 65536 #minimal frame length decoded in the executor
+
+    #special methods
+
+    def __init__(self, Reader: 'asyncio.StreamReader', *,
+                                            Mode: Optional[str] = None) -> None:
+        """
+        Initializer. Stores the reference to the stream reader and the variant
+        of the algorithm to be used for the decoding.
+
+        Signature:
+            asyncio.StreamReader/, *, str OR None/ -> None
+        
+        Args:
+            Reader: asyncio.StreamReader; the source of the encoded frames
+            Mode: (keyword) str OR None; the variant of the algorithm - 'COBS',
+                'COBS/R', 'COBS/ZPE' or 'COBS/16', None (default) means 'COBS'
+        
+        Raises:
+            UT_TypeError: the mode is neither a string nor None
+            UT_ValueError: the mode is not a supported variant
+        
+        Version 1.0.0.0
+        """
+        self._Mode = COBS_Coder._checkMode(Mode)
+        self._Reader = Reader
+
+    def __aiter__(self) -> 'COBS_FrameReader':
+        """
+        Returns the reader itself as the asynchronous iterator.
+
+        Signature:
+            None -> COBS_FrameReader
+        
+        Version 1.0.0.0
+        """
+        return self
+
+    async def __anext__(self) -> bytes:
+        """
+        Returns the next decoded frame during the asynchronous iteration.
+
+        Signature:
+            None -> bytes
+        
+        Raises:
+            StopAsyncIteration: the end of the stream is reached
+        
+        Version 1.0.0.0
+        """
+        Result = await self.readFrame()
+        if Result is None:
+            raise StopAsyncIteration
+        return Result
+
+    #public API
+
+    async def readFrame(self) -> Optional[bytes]:
+        """
+        Coroutine. Waits for the next complete frame, i.e. terminated by the
+        b'\x00' delimiter, and returns it decoded. The empty frames
+        (consecutive delimiters) are skipped. An unterminated frame at the end
+        of the stream is discarded.
+
+        Signature:
+            None -> bytes OR None
+        
+        Returns:
+            bytes: the decoded frame
+            None: the end of the stream is reached
+        
+        Version 1.0.1.0
+        """
+        import asyncio
+        Parts = []
+        Result = None
+        while True:
+            try:
+                Chunk = await self._Reader.readuntil(b'\x00')
+            except asyncio.IncompleteReadError:
+                break
+            except asyncio.LimitOverrunError as Error:
+                Parts.append(await self._Reader.readexactly(Error.consumed))
+                continue
+            if Parts:
+                Parts.append(Chunk)
+                Chunk = b''.join(Parts)
+                Parts = []
+            if len(Chunk) > 1:
+                if len(Chunk) < self._ExecutorThreshold:
+                    Result = COBS_Coder.decode(Chunk, Mode = self._Mode)
+                else:
+                    Loop = asyncio.get_event_loop()
+                    Result = await Loop.run_in_executor(None,
+                            functools.partial(COBS_Coder.decode, Chunk,
+                                                            Mode = self._Mode))
+                break
+        return Result
+
+class COBS_FrameWriter:
+    """
+    Asynchronous writer of the COBS encoded frames delimited by b'\x00' into an
+    asyncio.StreamWriter (e.g. socket, pipe or serial port stream). Each frame
+    is encoded and written together with its delimiter as a single chunk. The
+    backpressure is applied by the coroutines send() and drain(), which wait
+    until the write buffer of the transport is flushed below its high water
+    mark.
+
+    Methods:
+        write(Frame):
+            buffer -> None
+        writeMany(Frames):
+            seq(buffer) -> None
+        drain():
+            None -> None
+        send(Frame):
+            buffer -> None
+        close():
+            None -> None
+        waitClosed():
+            None -> None
+    
+    Version 1.0.0.0
+    """
+
+    #special methods
+
+    def __init__(self, Writer: 'asyncio.StreamWriter', *,
+                                            Mode: Optional[str] = None) -> None:
+        """
+        Initializer. Stores the reference to the stream writer and the variant
+        of the algorithm to be used for the encoding.
+
+        Signature:
+            asyncio.StreamWriter/, *, str OR None/ -> None
+        
+        Args:
+            Writer: asyncio.StreamWriter; the destination of the encoded frames
+            Mode: (keyword) str OR None; the variant of the algorithm - 'COBS',
+                'COBS/R', 'COBS/ZPE' or 'COBS/16', None (default) means 'COBS'
+        
+        Raises:
+            UT_TypeError: the mode is neither a string nor None
+            UT_ValueError: the mode is not a supported variant
+        
+        Version 1.0.0.0
+        """
+        self._Mode = COBS_Coder._checkMode(Mode)
+        self._Writer = Writer
+
+    #public API
+
+    def write(self, Frame: TBuffer) -> None:
+        """
+        Encodes a frame and writes it followed by the delimiter b'\x00' into the
+        stream without waiting. Should be followed by the coroutine drain().
+
+        Signature:
+            buffer -> None
+        
+        Args:
+            Frame: buffer; the frame to be sent
+        
+        Raises:
+            UT_TypeError: the frame does not support the buffer protocol
+        
+        Version 1.0.0.0
+        """
+        Encoded = COBS_Coder.encode(Frame, Mode = self._Mode)
+        self._Writer.write(b''.join([Encoded, b'\x00']))
+
+    def writeMany(self, Frames: Sequence[TBuffer]) -> None:
+        """
+        Encodes a sequence of frames and writes them each followed by the
+        delimiter b'\x00' into the stream as a single chunk without waiting.
+        Should be followed by the coroutine drain().
+
+        Signature:
+            seq(buffer) -> None
+        
+        Args:
+            Frames: seq(buffer); the frames to be sent
+        
+        Raises:
+            UT_TypeError: the input is not a sequence of objects supporting the
+                buffer protocol
+        
+        Version 1.0.0.0
+        """
+        if not isinstance(Frames, c_abc.Sequence):
+            raise UT_TypeError(Frames, c_abc.Sequence, SkipFrames = 1)
+        Parts = []
+        for Frame in Frames:
+            Parts.append(COBS_Coder.encode(Frame, Mode = self._Mode))
+            Parts.append(b'\x00')
+        self._Writer.write(b''.join(Parts))
+
+    async def drain(self) -> None:
+        """
+        Coroutine. Waits until the write buffer of the underlying transport is
+        flushed below its high water mark.
+
+        Signature:
+            None -> None
+        
+        Version 1.0.0.0
+        """
+        await self._Writer.drain()
+
+    async def send(self, Frame: TBuffer) -> None:
+        """
+        Coroutine. Encodes and writes a frame followed by the delimiter, and
+        waits until the write buffer is flushed below its high water mark.
+
+        Signature:
+            buffer -> None
+        
+        Args:
+            Frame: buffer; the frame to be sent
+        
+        Raises:
+            UT_TypeError: the frame does not support the buffer protocol
+        
+        Version 1.0.0.0
+        """
+        self.write(Frame)
+        await self._Writer.drain()
+
+    def close(self) -> None:
+        """
+        Closes the underlying stream writer.
+
+        Signature:
+            None -> None
+        
+        Version 1.0.0.0
+        """
+        self._Writer.close()
+
+    async def waitClosed(self) -> None:
+        """
+        Coroutine. Waits until the underlying stream is closed. Does nothing
+        with Python 3.6, where this functionality is not available.
+
+        Signature:
+            None -> None
+        
+        Version 1.0.0.0
+        """
+        if hasattr(self._Writer, 'wait_closed'):
+            await self._Writer.wait_closed()
@@ -1,3 +1,8 @@
-from setuptools import setup
+from setuptools import setup, Extension
 
-setup()
\ No newline at end of file
+setup(
+    ext_modules = [
+        Extension('codecs_lib._cobs_ext', sources = ['_cobs_ext.c'],
+                                                                optional = True)
+    ]
+)
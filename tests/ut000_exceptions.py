@@ -0,0 +1,170 @@
+#usr/bin/python3
+"""
+Unit tests for the module codecs_lib._exceptions
+
+Covered classes:
+    UT_Exception
+    UT_TypeError
+    UT_ValueError
+"""
+
+__version__ = "1.0.0.0"
+__date__ = "18-10-2026"
+__status__ = "Testing"
+
+#imports
+
+#+ standard libraries
+
+import os
+import sys
+import unittest
+import importlib.util
+import subprocess
+
+#+ my libraries
+
+TEST_FOLDER = os.path.dirname(os.path.realpath(__file__))
+LIB_FOLDER = os.path.dirname(TEST_FOLDER)
+ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
+
+if not (ROOT_FOLDER in sys.path):
+    sys.path.append(ROOT_FOLDER)
+
+#globals
+
+MODULE_PATH = os.path.join(LIB_FOLDER, '_exceptions.py')
+
+#+ test case executed by a fresh interpreter with the lightweight exceptions
+
+CHILD_CODE = '''
+import sys
+import unittest
+sys.path.insert(0, {Root!r})
+from codecs_lib.cobs import COBS_Coder
+from codecs_lib.wichmann_hill import WH_Coder
+from codecs_lib import _exceptions
+
+class Test_Child(unittest.TestCase):
+    def test_Raised(self):
+        self.assertTrue(_exceptions.UT_TypeError.__module__.endswith(
+                                                                '_exceptions'))
+        for Function, Arguments, ErrorClass in [
+                (COBS_Coder.encode, (1, ), _exceptions.UT_TypeError),
+                (COBS_Coder.decode, (b"\\x01\\x00\\x01", ),
+                                                    _exceptions.UT_ValueError),
+                (WH_Coder, (1, 2, 0), _exceptions.UT_ValueError)]:
+            with self.subTest(Function = Function.__qualname__):
+                with self.assertRaises(ErrorClass):
+                    Function(*Arguments)
+        self.assertFalse([Name for Name in sys.modules
+                                    if Name.startswith("introspection_lib")])
+
+unittest.main()
+'''
+
+#functions
+
+def loadFastModule():
+    """
+    Loads a separate instance of the tested module with the lightweight
+    exceptions requested via the environment variable.
+
+    Version 1.0.0.0
+    """
+    Previous = os.environ.get('CODECS_LIB_FAST_EXCEPTIONS', None)
+    os.environ['CODECS_LIB_FAST_EXCEPTIONS'] = '1'
+    try:
+        Spec = importlib.util.spec_from_file_location('fast_exceptions',
+                                                                MODULE_PATH)
+        Module = importlib.util.module_from_spec(Spec)
+        Spec.loader.exec_module(Module)
+    finally:
+        if Previous is None:
+            del os.environ['CODECS_LIB_FAST_EXCEPTIONS']
+        else:
+            os.environ['CODECS_LIB_FAST_EXCEPTIONS'] = Previous
+    return Module
+
+#classes
+
+#+ test cases
+
+class Test_FastExceptions(unittest.TestCase):
+    """
+    Test cases for the lightweight exception classes of the module
+    codecs_lib._exceptions.
+
+    Test ids TEST-T-000 and TEST-T-001. Covers the requirement REQ-FUN-005.
+
+    Version 1.0.0.0
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+
+        Version: 1.0.0.0
+        """
+        cls.TestModule = loadFastModule()
+
+    def test_Classes(self):
+        """
+        Checks that the lightweight classes are selected by the environment
+        variable, they are the sub-classes of the built-in exceptions, accept
+        the same arguments as the introspection_lib classes and form short
+        messages even for the large values.
+
+        Test id TEST-T-000. Covers the requirement REQ-FUN-005.
+
+        Version 1.0.0.0
+        """
+        Module = self.TestModule
+        self.assertTrue(Module.FAST_EXCEPTIONS)
+        self.assertFalse(Module.INTROSPECTION_USED)
+        self.assertTrue(issubclass(Module.UT_TypeError, TypeError))
+        self.assertTrue(issubclass(Module.UT_ValueError, ValueError))
+        self.assertTrue(issubclass(Module.UT_TypeError, Module.UT_Exception))
+        self.assertTrue(issubclass(Module.UT_ValueError, Module.UT_Exception))
+        with self.assertRaises(TypeError) as Context:
+            raise Module.UT_TypeError(1, (str, bytes), SkipFrames = 2)
+        self.assertIn('str or bytes', str(Context.exception))
+        Error = Module.UT_ValueError(b'\x01' * 1000000, 'frame',
+                                                                SkipFrames = 1)
+        self.assertLess(len(str(Error)), 300)
+        Error.appendMessage('- the first argument')
+        self.assertTrue(str(Error).endswith('- the first argument'))
+        Error = Module.UT_Exception('not set', SkipFrames = 1)
+        self.assertEqual(str(Error), 'not set')
+
+    def test_Codecs(self):
+        """
+        Checks that in a fresh interpreter with the lightweight exceptions
+        requested the codec modules raise the lightweight sub-classes of the
+        built-in exceptions and do not import introspection_lib at all.
+
+        Test id TEST-T-001. Covers the requirement REQ-FUN-005.
+
+        Version 1.0.1.0
+        """
+        Code = CHILD_CODE.format(Root = ROOT_FOLDER)
+        Environment = dict(os.environ, CODECS_LIB_FAST_EXCEPTIONS = '1')
+        Process = subprocess.run([sys.executable, '-c', Code],
+                                    stdout = subprocess.PIPE,
+                                    stderr = subprocess.PIPE,
+                                    env = Environment,
+                                    universal_newlines = True)
+        self.assertEqual(Process.returncode, 0, Process.stderr)
+
+#+ test suites
+
+TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_FastExceptions)
+
+TestSuite = unittest.TestSuite()
+TestSuite.addTests([TestSuite1,])
+
+if __name__ == "__main__":
+    sys.stdout.write("Testing codecs_lib._exceptions module...\n")
+    sys.stdout.flush()
+    unittest.TextTestRunner(verbosity = 2).run(TestSuite)
@@ -3,11 +3,15 @@
 Unit tests for the module codecs_lib.cobs
 
 Covered classes:
-    COBS_Coder
+    COBS_Coder - with and without the optional compiled core
+    COBS_StreamDecoder
+    COBS_StreamEncoder
+    COBS_FrameReader
+    COBS_FrameWriter
 """
 
-__version__ = "1.0.0.0"
-__date__ = "16-06-2021"
+__version__ = "1.1.0.0"
+__date__ = "18-10-2026"
 __status__ = "Testing"
 
 #imports
@@ -18,6 +22,15 @@ import os
 import sys
 import unittest
 import random
+import array
+import mmap
+import asyncio
+import socket
+import tempfile
+import pathlib
+import concurrent.futures
+import threading
+import time
 
 #+ modules to be tested
 
@@ -30,7 +43,10 @@ ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
 if not (ROOT_FOLDER in sys.path):
     sys.path.append(ROOT_FOLDER)
 
-from codecs_lib.cobs import COBS_Coder
+from codecs_lib.cobs import COBS_Coder, COBS_StreamDecoder
+from codecs_lib.cobs import COBS_StreamEncoder
+from codecs_lib.cobs import COBS_FrameReader, COBS_FrameWriter
+import codecs_lib.cobs as cobs
 
 #constants
 
@@ -39,15 +55,26 @@ TEST_BYTE_STRING = bytes(bytearray(i for i in range(1, 255)))
 
 #classes
 
+#+ helpers
+
+class COBS_Coder_Python(COBS_Coder):
+    """
+    Version of the COBS_Coder class forced to use the pure Python core.
+    """
+    
+    _Extension = None
+    
+    _Numpy = False
+
 #+ test cases
 
 class Test_COBS_Coder(unittest.TestCase):
     """
     Test cases for the the codecs_lib.cobs.COBS_Coder class.
     
-    Test ids TEST-T-100, TEST-T-101, TEST-T-102, TEST-T-120 and TEST-T-121.
-    Covers the requirements REQ-FUN-101, REQ-FUN-110, REQ-FUN-120, REQ-AWM-100
-    and REQ-AWM-120.
+    Test ids TEST-T-100 to TEST-T-104, TEST-T-120 and TEST-T-121. Covers the
+    requirements REQ-FUN-101, REQ-FUN-102, REQ-FUN-110, REQ-FUN-120,
+    REQ-AWM-100 and REQ-AWM-120.
     
     Version 1.0.0.0
     """
@@ -136,6 +163,97 @@ class Test_COBS_Coder(unittest.TestCase):
             self.assertEqual(bsTest, bsControl)
             self.assertIsInstance(bsTest, bytes)
     
+    def test_COBS_Coder_encode_ZeroFree(self):
+        """
+        Tests the encoding of the data without zero characters of different
+        lengths around the block boundaries against the reference
+        byte-by-byte implementation of the algorithm.
+        
+        Test id TEST-T-103. Covers the requirements REQ-FUN-110.
+        
+        Version 1.0.0.0
+        """
+        def Reference(bsData):
+            Result = bytearray([1])
+            iCode = 0
+            for iByte in bsData:
+                Result.append(iByte)
+                Result[iCode] += 1
+                if Result[iCode] == 255:
+                    iCode = len(Result)
+                    Result.append(1)
+            if len(Result) > 1 and iCode == len(Result) - 1:
+                del Result[-1] #ends with a full block
+            return bytes(Result)
+        lstLengths = list(range(0, 1100)) + [65535, 65536, 254 * 300]
+        for iLength in lstLengths:
+            bsSample = bytes(random.randint(1, 255) for _ in range(iLength))
+            bsControl = Reference(bsSample)
+            for gData in (bsSample, bytearray(bsSample)):
+                bsTest = self.TestClass.encode(gData)
+                self.assertIsInstance(bsTest, bytes)
+                self.assertEqual(bsTest, bsControl)
+    
+    def test_COBS_Coder_Buffers(self):
+        """
+        Tests that any C-contiguous object supporting the buffer protocol
+        (memoryview, including slices, array and mmap) is accepted by the
+        encoding and decoding in all variants of the algorithm as well as by
+        the stream classes with the same result as the byte-string, whereas a
+        non-contiguous memoryview is rejected.
+        
+        Test id TEST-T-104. Covers the requirements REQ-FUN-102.
+        
+        Version 1.0.0.0
+        """
+        lstSamples = list(self.lstDecoded)
+        lstSamples.extend(bytes(random.choice((0, 0, 1, 17, 255))
+                                    for _ in range(random.randint(0, 2000)))
+                                                            for _ in range(20))
+        for strMode in cobs.MODES:
+            for bsSample in lstSamples:
+                bsControl = self.TestClass.encode(bsSample, Mode = strMode)
+                bsPadded = b''.join([b'\x33\x00', bsSample, b'\x00\x44'])
+                for gData in (memoryview(bsSample), array.array('B', bsSample),
+                                memoryview(bytearray(bsPadded))[2 : -2]):
+                    bsTest = self.TestClass.encode(gData, Mode = strMode)
+                    self.assertIsInstance(bsTest, bytes)
+                    self.assertEqual(bsTest, bsControl)
+                bsPadded = b''.join([b'\x33\x00\x00', bsControl, b'\x00\x44'])
+                for gData in (memoryview(bsControl),
+                                array.array('B', bsControl),
+                                memoryview(bsPadded)[2 : -1],
+                                memoryview(bsPadded)[3 : -2]):
+                    bsTest = self.TestClass.decode(gData, Mode = strMode)
+                    self.assertIsInstance(bsTest, bytes)
+                    self.assertEqual(bsTest, bsSample)
+        bsSample = lstSamples[-1]
+        bsControl = self.TestClass.encode(bsSample)
+        with mmap.mmap(-1, len(bsControl) + 2) as objMap:
+            objMap[1 : -1] = bsControl
+            self.assertEqual(self.TestClass.decode(objMap), bsSample)
+            objMap[ : len(bsSample)] = bsSample
+            bsTest = self.TestClass.encode(memoryview(objMap)[ : len(bsSample)])
+            self.assertEqual(bsTest, bsControl)
+        #multi-byte items are viewed as unsigned bytes
+        arrSample = array.array('H', [0x1100, 0x0022, 0x3344])
+        bsTest = self.TestClass.encode(arrSample)
+        self.assertEqual(bsTest, self.TestClass.encode(arrSample.tobytes()))
+        #stream classes
+        objEncoder = COBS_StreamEncoder()
+        bsTest = objEncoder.feed(memoryview(bsSample)) + objEncoder.flush()
+        self.assertEqual(bsTest, bsControl)
+        objDecoder = COBS_StreamDecoder()
+        lstTest = objDecoder.feed(memoryview(b''.join([bsControl, b'\x00'])))
+        self.assertListEqual(lstTest, [bsSample])
+        #non-contiguous buffer
+        for gData in (memoryview(b'\x11\x22\x33\x44')[::2],
+                                        memoryview(b'\x02\x11\x02\x22')[::-1]):
+            with self.assertRaises(TypeError):
+                self.TestClass.encode(gData)
+            with self.assertRaises(TypeError):
+                self.TestClass.decode(gData)
+    
     def test_COBS_Coder_decode_Strip(self):
         """
         Tests the correctness of the implementation of the decoding,
@@ -212,12 +330,1870 @@ class Test_COBS_Coder(unittest.TestCase):
             with self.assertRaises(TypeError):
                 self.TestClass.encode(gInput)
 
+class Test_COBS_StreamDecoder(unittest.TestCase):
+    """
+    Test cases for the the codecs_lib.cobs.COBS_StreamDecoder class.
+    
+    Test ids TEST-T-130, TEST-T-131 and TEST-T-132. Covers the requirements
+    REQ-FUN-130, REQ-FUN-131 and REQ-AWM-130.
+    
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version: 1.0.0.0
+        """
+        Test_COBS_Coder.setUpClass()
+        cls.TestClass = COBS_StreamDecoder
+        cls.lstDecoded = Test_COBS_Coder.lstDecoded
+        cls.lstEncoded = Test_COBS_Coder.lstEncoded
+        cls.lstBadInput = Test_COBS_Coder.lstBadInput
+        cls.bsFeed = b''.join(b''.join([b'\x00' * random.randint(1, 3), Item])
+                                        for Item in cls.lstEncoded) + b'\x00'
+    
+    def test_feed_whole(self):
+        """
+        Tests that all frames fed in a single chunk are properly decoded.
+        
+        Test id TEST-T-130. Covers the requirements REQ-FUN-130.
+        
+        Version 1.0.0.0
+        """
+        objTest = self.TestClass()
+        lstTest = objTest.feed(self.bsFeed)
+        self.assertListEqual(lstTest, self.lstDecoded)
+        for bsTest in lstTest:
+            self.assertIsInstance(bsTest, bytes)
+        objTest = self.TestClass()
+        lstTest = objTest.feed(bytearray(self.bsFeed))
+        self.assertListEqual(lstTest, self.lstDecoded)
+    
+    def test_feed_chunks(self):
+        """
+        Tests that the frames split across the arbitrary chunks are properly
+        decoded, and that the unterminated frame is kept until its delimiter
+        is received or the decoder is reset.
+        
+        Test id TEST-T-131. Covers the requirements REQ-FUN-130 and
+        REQ-FUN-131.
+        
+        Version 1.0.0.0
+        """
+        for iChunkSize in (1, 2, 3, 7, 100, 255, 256, 1000):
+            objTest = self.TestClass()
+            lstTest = []
+            for iStart in range(0, len(self.bsFeed), iChunkSize):
+                lstTest.extend(
+                        objTest.feed(self.bsFeed[iStart : iStart + iChunkSize]))
+            self.assertListEqual(lstTest, self.lstDecoded)
+        objTest = self.TestClass()
+        self.assertListEqual(objTest.feed(b'\x03\x11\x22\x02'), [])
+        self.assertListEqual(objTest.feed(b'\x33\x00\x02'), [b'\x11\x22\x003'])
+        objTest.reset()
+        self.assertListEqual(objTest.feed(b'\x02\x11\x00'), [b'\x11'])
+        #truncated frame - same result as decode() on the delimited piece
+        self.assertListEqual(objTest.feed(b'\x05\x11\x22\x00'),
+                                        [COBS_Coder.decode(b'\x05\x11\x22')])
+    
+    def test_feed_Raises_TypeError(self):
+        """
+        Tests the decoder raises TypeError if the input is anything but an
+        instance of bytearray or bytestring.
+        
+        Test id TEST-T-132. Covers the requirements REQ-AWM-130.
+        
+        Version 1.0.0.0
+        """
+        objTest = self.TestClass()
+        for gInput in self.lstBadInput:
+            with self.assertRaises(TypeError):
+                objTest.feed(gInput)
+
+class Test_COBS_StreamEncoder(unittest.TestCase):
+    """
+    Test cases for the the codecs_lib.cobs.COBS_StreamEncoder class.
+    
+    Test ids TEST-T-140, TEST-T-141 and TEST-T-142. Covers the requirements
+    REQ-FUN-140, REQ-FUN-141 and REQ-AWM-140.
+    
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version: 1.0.0.0
+        """
+        Test_COBS_Coder.setUpClass()
+        cls.TestClass = COBS_StreamEncoder
+        cls.lstDecoded = Test_COBS_Coder.lstDecoded + [b'',
+                            b''.join([TEST_BYTE_STRING, b'\x00']) * 3,
+                            bytes(random.randint(0, 255) for _ in range(5000))]
+        cls.lstBadInput = Test_COBS_Coder.lstBadInput
+    
+    def test_feed_flush(self):
+        """
+        Tests that the packets fed in arbitrary chunks are encoded exactly as
+        by the COBS_Coder.encode() method, and the encoder is ready for the next
+        packet after the flush.
+        
+        Test id TEST-T-140. Covers the requirements REQ-FUN-140.
+        
+        Version 1.0.0.0
+        """
+        objTest = self.TestClass()
+        for bsSample in self.lstDecoded:
+            bsControl = COBS_Coder.encode(bsSample)
+            for iChunkSize in (1, 2, 3, 7, 100, 253, 254, 255, 1000):
+                lstResult = []
+                for iStart in range(0, len(bsSample), iChunkSize):
+                    bsChunk = bsSample[iStart : iStart + iChunkSize]
+                    bsTest = objTest.feed(bsChunk)
+                    self.assertIsInstance(bsTest, bytes)
+                    self.assertLessEqual(len(bsTest), len(bsChunk) + 255)
+                    lstResult.append(bsTest)
+                bsTest = objTest.flush()
+                self.assertIsInstance(bsTest, bytes)
+                lstResult.append(bsTest)
+                self.assertEqual(b''.join(lstResult), bsControl)
+            bsTest = objTest.feed(bytearray(bsSample)) + objTest.flush()
+            self.assertEqual(bsTest, bsControl)
+    
+    def test_reset(self):
+        """
+        Tests that the reset method discards the buffered data.
+        
+        Test id TEST-T-141. Covers the requirements REQ-FUN-141.
+        
+        Version 1.0.0.0
+        """
+        objTest = self.TestClass()
+        self.assertEqual(objTest.feed(b'\x11\x22'), b'')
+        objTest.reset()
+        bsTest = objTest.feed(b'\x33\x00\x44') + objTest.flush()
+        self.assertEqual(bsTest, COBS_Coder.encode(b'\x33\x00\x44'))
+    
+    def test_feed_Raises_TypeError(self):
+        """
+        Tests the encoder raises TypeError if the input is anything but an
+        instance of bytearray or bytestring.
+        
+        Test id TEST-T-142. Covers the requirements REQ-AWM-140.
+        
+        Version 1.0.0.0
+        """
+        objTest = self.TestClass()
+        for gInput in self.lstBadInput:
+            with self.assertRaises(TypeError):
+                objTest.feed(gInput)
+
+class Test_COBS_Coder_Into(unittest.TestCase):
+    """
+    Test cases for the the zero-copy methods of the codecs_lib.cobs.COBS_Coder
+    class.
+    
+    Test ids TEST-T-150 to TEST-T-153 and TEST-T-160 to TEST-T-165. Covers
+    the requirements REQ-FUN-150, REQ-FUN-160, REQ-FUN-161, REQ-AWM-150,
+    REQ-AWM-151, REQ-AWM-160 and REQ-AWM-161.
+    
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version: 1.0.0.0
+        """
+        Test_COBS_Coder.setUpClass()
+        cls.TestClass = COBS_Coder
+        cls.lstDecoded = Test_COBS_Coder.lstDecoded
+        cls.lstEncoded = Test_COBS_Coder.lstEncoded
+        cls.lstBadInput = Test_COBS_Coder.lstBadInput
+        cls.lstRandom = [bytes(random.choice((0, 1, 255))
+                                    for _ in range(random.randint(0, 2000)))
+                                                            for _ in range(20)]
+    
+    def test_encodeInto(self):
+        """
+        Tests the correctness of the implementation of the encoding into a
+        preallocated buffer from the different buffer types.
+        
+        Test id TEST-T-160. Covers the requirements REQ-FUN-160.
+        
+        Version 1.0.0.0
+        """
+        baOutput = bytearray(5000)
+        mmOutput = mmap.mmap(-1, 5000)
+        for bsSample in self.lstDecoded + self.lstRandom:
+            bsControl = self.TestClass.encode(bsSample)
+            mmInput = mmap.mmap(-1, max(1, len(bsSample)))
+            mmInput.write(bsSample)
+            mvInput = memoryview(mmInput)[:len(bsSample)]
+            for gInput in (bsSample, bytearray(bsSample), mvInput,
+                                                array.array('B', bsSample)):
+                iTest = self.TestClass.encodeInto(gInput, baOutput)
+                self.assertIsInstance(iTest, int)
+                self.assertEqual(bytes(baOutput[:iTest]), bsControl)
+                mvOutput = memoryview(baOutput)[10:]
+                iTest = self.TestClass.encodeInto(gInput, mvOutput)
+                self.assertEqual(bytes(baOutput[10 : 10 + iTest]), bsControl)
+                iTest = self.TestClass.encodeInto(gInput, mmOutput)
+                self.assertEqual(mmOutput[:iTest], bsControl)
+                del mvOutput
+            del mvInput
+            mmInput.close()
+            iTest = self.TestClass.encodeInto(bsSample,
+                                                    bytearray(len(bsControl)))
+            self.assertEqual(iTest, len(bsControl))
+        mmOutput.close()
+    
+    def test_maxEncodedLength(self):
+        """
+        Tests that the calculated worst case length of the encoded data is
+        sufficient, and it is reached for the long non-zero sequences.
+        
+        Test id TEST-T-161. Covers the requirements REQ-FUN-161.
+        
+        Version 1.0.0.0
+        """
+        for bsSample in self.lstDecoded + self.lstRandom:
+            iTest = self.TestClass.maxEncodedLength(len(bsSample))
+            self.assertIsInstance(iTest, int)
+            self.assertGreaterEqual(iTest, len(self.TestClass.encode(bsSample)))
+        for iLength in (0, 1, 253, 254, 255, 508, 509, 1000):
+            bsSample = b'\x01' * iLength
+            iTest = self.TestClass.maxEncodedLength(iLength)
+            self.assertEqual(iTest, len(self.TestClass.encode(bsSample)))
+    
+    def test_encodeInto_Raises_TypeError(self):
+        """
+        Tests the encoding into a buffer raises TypeError if the input does not
+        support the buffer protocol or the output is not a writable buffer.
+        
+        Test id TEST-T-162. Covers the requirements REQ-AWM-160.
+        
+        Version 1.0.0.0
+        """
+        for gInput in self.lstBadInput:
+            with self.assertRaises(TypeError):
+                self.TestClass.encodeInto(gInput, bytearray(10))
+            with self.assertRaises(TypeError):
+                self.TestClass.encodeInto(b'\x02\x11', gInput)
+        for gOutput in (b'\x00' * 10, memoryview(b'\x00' * 10)):
+            with self.assertRaises(TypeError):
+                self.TestClass.encodeInto(b'\x02\x11', gOutput)
+    
+    def test_encodeInto_Raises_ValueError(self):
+        """
+        Tests the encoding into a buffer raises ValueError if the output buffer
+        is too small.
+        
+        Test id TEST-T-163. Covers the requirements REQ-AWM-161.
+        
+        Version 1.0.0.0
+        """
+        for bsSample in self.lstDecoded + self.lstRandom:
+            iLength = len(self.TestClass.encode(bsSample))
+            with self.assertRaises(ValueError):
+                self.TestClass.encodeInto(bsSample, bytearray(iLength - 1))
+    
+    def test_maxEncodedLength_Raises_TypeError(self):
+        """
+        Tests the worst case length calculation raises TypeError if the argument
+        is not an integer.
+        
+        Test id TEST-T-164. Covers the requirements REQ-AWM-160.
+        
+        Version 1.0.0.0
+        """
+        for gInput in ['asd', int, 1.0, [1], (1, ), {1 : 1}, True, b'\x01',
+                                                                        None]:
+            with self.assertRaises(TypeError):
+                self.TestClass.maxEncodedLength(gInput)
+    
+    def test_maxEncodedLength_Raises_ValueError(self):
+        """
+        Tests the worst case length calculation raises ValueError if the
+        argument is a negative integer.
+        
+        Test id TEST-T-165. Covers the requirements REQ-AWM-161.
+        
+        Version 1.0.0.0
+        """
+        for gInput in (-1, -254, -1000):
+            with self.assertRaises(ValueError):
+                self.TestClass.maxEncodedLength(gInput)
+    
+    def test_decodeInto(self):
+        """
+        Tests the correctness of the implementation of the decoding into a
+        preallocated buffer from the different buffer types.
+        
+        Test id TEST-T-150. Covers the requirements REQ-FUN-150.
+        
+        Version 1.0.0.0
+        """
+        baOutput = bytearray(1000)
+        mmOutput = mmap.mmap(-1, 1000)
+        for iIndex, bsSample in enumerate(self.lstEncoded):
+            bsControl = self.lstDecoded[iIndex]
+            bsInput = b''.join([b'\x00', bsSample, b'\x00\x00'])
+            mmInput = mmap.mmap(-1, len(bsInput))
+            mmInput.write(bsInput)
+            for gInput in (bsSample, bytearray(bsSample), memoryview(bsInput),
+                                array.array('B', bsSample), mmInput):
+                iTest = self.TestClass.decodeInto(gInput, baOutput)
+                self.assertIsInstance(iTest, int)
+                self.assertEqual(bytes(baOutput[:iTest]), bsControl)
+                mvOutput = memoryview(baOutput)[10:]
+                iTest = self.TestClass.decodeInto(gInput, mvOutput)
+                self.assertEqual(bytes(baOutput[10 : 10 + iTest]), bsControl)
+                iTest = self.TestClass.decodeInto(gInput, mmOutput)
+                self.assertEqual(mmOutput[:iTest], bsControl)
+                del mvOutput
+            mmInput.close()
+            iTest = self.TestClass.decodeInto(bsSample,
+                                                    bytearray(len(bsControl)))
+            self.assertEqual(iTest, len(bsControl))
+        mmOutput.close()
+    
+    def test_decodeInto_Raises_TypeError(self):
+        """
+        Tests the decoding into a buffer raises TypeError if the input does not
+        support the buffer protocol or the output is not a writable buffer.
+        
+        Test id TEST-T-151. Covers the requirements REQ-AWM-150.
+        
+        Version 1.0.0.0
+        """
+        for gInput in self.lstBadInput:
+            with self.assertRaises(TypeError):
+                self.TestClass.decodeInto(gInput, bytearray(10))
+            with self.assertRaises(TypeError):
+                self.TestClass.decodeInto(b'\x02\x11', gInput)
+        for gOutput in (b'\x00' * 10, memoryview(b'\x00' * 10)):
+            with self.assertRaises(TypeError):
+                self.TestClass.decodeInto(b'\x02\x11', gOutput)
+    
+    def test_decodeInto_Raises_ValueError(self):
+        """
+        Tests the decoding into a buffer raises ValueError if there is a zero
+        character not in the leading or tailing position in the input, or the
+        output buffer is too small.
+        
+        Test ids TEST-T-152 and TEST-T-153. Covers the requirements REQ-AWM-151.
+        
+        Version 1.0.0.0
+        """
+        baOutput = bytearray(1000)
+        for iIndex, bsSample in enumerate(self.lstEncoded):
+            iNPosition = random.randint(1, len(bsSample) - 1)
+            bsInput = b''.join([bsSample[:iNPosition], b'\x00',
+                                                        bsSample[iNPosition:]])
+            with self.assertRaises(ValueError):
+                self.TestClass.decodeInto(bsInput, baOutput)
+            with self.assertRaises(ValueError):
+                self.TestClass.decodeInto(memoryview(bsInput), baOutput)
+            iLength = len(self.lstDecoded[iIndex])
+            with self.assertRaises(ValueError):
+                self.TestClass.decodeInto(bsSample, bytearray(iLength - 1))
+
+class Test_COBS_Coder_Many(unittest.TestCase):
+    """
+    Test cases for the batch methods of the codecs_lib.cobs.COBS_Coder class.
+    
+    Test ids TEST-T-170 to TEST-T-175. Covers the requirements REQ-FUN-102,
+    REQ-FUN-170, REQ-FUN-171, REQ-AWM-170 and REQ-AWM-171.
+    
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version: 1.0.0.0
+        """
+        Test_COBS_Coder.setUpClass()
+        cls.TestClass = COBS_Coder
+        cls.lstDecoded = Test_COBS_Coder.lstDecoded
+        cls.lstEncoded = Test_COBS_Coder.lstEncoded
+        cls.lstBadInput = Test_COBS_Coder.lstBadInput
+    
+    def test_encodeMany(self):
+        """
+        Tests the correctness of the implementation of the batch encoding.
+        
+        Test id TEST-T-170. Covers the requirements REQ-FUN-170.
+        
+        Version 1.0.0.0
+        """
+        for gInput in (self.lstDecoded, tuple(self.lstDecoded),
+                                [bytearray(Item) for Item in self.lstDecoded]):
+            lstTest = self.TestClass.encodeMany(gInput)
+            self.assertIsInstance(lstTest, list)
+            self.assertListEqual(lstTest, self.lstEncoded)
+            bsTest = self.TestClass.encodeMany(gInput, Join = True)
+            self.assertIsInstance(bsTest, bytes)
+            bsControl = b''.join(Item + b'\x00' for Item in self.lstEncoded)
+            self.assertEqual(bsTest, bsControl)
+        self.assertListEqual(self.TestClass.encodeMany([]), [])
+        self.assertEqual(self.TestClass.encodeMany([], Join = True), b'')
+    
+    def test_Many_Buffers(self):
+        """
+        Tests that the batch encoding and decoding accept the frames as any
+        objects supporting the buffer protocol (memoryview slices of a single
+        buffer, arrays, mmap), as well as a single delimited buffer.
+        
+        Test id TEST-T-175. Covers the requirements REQ-FUN-102.
+        
+        Version 1.0.0.0
+        """
+        bsJoined = b''.join(self.lstDecoded)
+        objView = memoryview(bsJoined)
+        lstInput = []
+        iStart = 0
+        for bsItem in self.lstDecoded:
+            lstInput.append(objView[iStart : iStart + len(bsItem)])
+            iStart += len(bsItem)
+        lstTest = self.TestClass.encodeMany(lstInput)
+        self.assertListEqual(lstTest, self.lstEncoded)
+        lstInput = [array.array('B', bsItem) for bsItem in self.lstEncoded]
+        self.assertListEqual(self.TestClass.decodeMany(lstInput),
+                                                            self.lstDecoded)
+        bsInput = self.TestClass.encodeMany(self.lstDecoded, Join = True)
+        lstInput = [bytearray(b'\x00' + bsInput), array.array('B', bsInput)]
+        for gInput in (memoryview(lstInput[0])[1 : ], lstInput[1]):
+            lstTest = self.TestClass.decodeMany(gInput)
+            self.assertListEqual(lstTest, self.lstDecoded)
+            for bsTest in lstTest:
+                self.assertIsInstance(bsTest, bytes)
+        with mmap.mmap(-1, len(bsInput)) as objMap:
+            objMap[:] = bsInput
+            self.assertListEqual(self.TestClass.decodeMany(objMap),
+                                                            self.lstDecoded)
+    
+    def test_decodeMany(self):
+        """
+        Tests the correctness of the implementation of the batch decoding of a
+        sequence of frames or a single delimited byte-string.
+        
+        Test id TEST-T-171. Covers the requirements REQ-FUN-171.
+        
+        Version 1.0.0.0
+        """
+        lstInput = [b''.join([b'\x00' * random.randint(0, 2), Item,
+                                            b'\x00' * random.randint(1, 2)])
+                                                for Item in self.lstEncoded]
+        for gInput in (self.lstEncoded, tuple(lstInput),
+                                [bytearray(Item) for Item in lstInput]):
+            lstTest = self.TestClass.decodeMany(gInput)
+            self.assertIsInstance(lstTest, list)
+            self.assertListEqual(lstTest, self.lstDecoded)
+        bsInput = self.TestClass.encodeMany(self.lstDecoded, Join = True)
+        for gInput in (bsInput, bytearray(bsInput), b''.join(lstInput)):
+            lstTest = self.TestClass.decodeMany(gInput)
+            self.assertIsInstance(lstTest, list)
+            self.assertListEqual(lstTest, self.lstDecoded)
+            for bsTest in lstTest:
+                self.assertIsInstance(bsTest, bytes)
+        for gInput in ([], b'', b'\x00\x00'):
+            self.assertListEqual(self.TestClass.decodeMany(gInput), [])
+    
+    def test_encodeMany_Raises_TypeError(self):
+        """
+        Tests the batch encoding raises TypeError if the input is not a sequence
+        of byte-strings or bytes arrays.
+        
+        Test id TEST-T-172. Covers the requirements REQ-AWM-170.
+        
+        Version 1.0.0.0
+        """
+        for gInput in self.lstBadInput + [b'\x01', bytearray(b'\x01')]:
+            if gInput != [b'\x03']:
+                with self.assertRaises(TypeError):
+                    self.TestClass.encodeMany(gInput)
+            if not isinstance(gInput, (bytes, bytearray)):
+                with self.assertRaises(TypeError):
+                    self.TestClass.encodeMany([b'\x01', gInput])
+    
+    def test_decodeMany_Raises_TypeError(self):
+        """
+        Tests the batch decoding raises TypeError if the input is neither a
+        byte-string, nor a bytes array, nor a sequence of them.
+        
+        Test id TEST-T-173. Covers the requirements REQ-AWM-170.
+        
+        Version 1.0.0.0
+        """
+        for gInput in self.lstBadInput:
+            if not isinstance(gInput, (list, tuple)):
+                with self.assertRaises(TypeError):
+                    self.TestClass.decodeMany(gInput)
+            with self.assertRaises(TypeError):
+                self.TestClass.decodeMany([b'\x01', gInput])
+    
+    def test_decodeMany_Raises_ValueError(self):
+        """
+        Tests the batch decoding raises ValueError if any frame in the passed
+        sequence contains a zero character not in the leading or tailing
+        position.
+        
+        Test id TEST-T-174. Covers the requirements REQ-AWM-171.
+        
+        Version 1.0.0.0
+        """
+        for bsSample in self.lstEncoded:
+            iNPosition = random.randint(1, len(bsSample) - 1)
+            bsInput = b''.join([bsSample[:iNPosition], b'\x00',
+                                                        bsSample[iNPosition:]])
+            with self.assertRaises(ValueError):
+                self.TestClass.decodeMany([b'\x01', bsInput])
+            with self.assertRaises(ValueError):
+                self.TestClass.decodeMany((bytearray(bsInput), ))
+
+class Test_COBS_Coder_Python(Test_COBS_Coder):
+    """
+    Test cases for the the codecs_lib.cobs.COBS_Coder class forced to use the
+    pure Python core, regardless of the availability of the compiled core.
+    
+    Test ids TEST-T-100 to TEST-T-104, TEST-T-120 and TEST-T-121. Covers the
+    requirements REQ-FUN-101, REQ-FUN-102, REQ-FUN-110, REQ-FUN-120,
+    REQ-FUN-180, REQ-AWM-100 and REQ-AWM-120.
+    
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version: 1.0.0.0
+        """
+        super().setUpClass()
+        cls.TestClass = COBS_Coder_Python
+
+class Test_COBS_Coder_Many_Python(Test_COBS_Coder_Many):
+    """
+    Test cases for the batch methods of the codecs_lib.cobs.COBS_Coder class
+    forced to use the pure Python core, regardless of the availability of the
+    compiled core.
+    
+    Test ids TEST-T-170 to TEST-T-174. Covers the requirements REQ-FUN-170,
+    REQ-FUN-171, REQ-FUN-180, REQ-AWM-170 and REQ-AWM-171.
+    
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version: 1.0.0.0
+        """
+        super().setUpClass()
+        cls.TestClass = COBS_Coder_Python
+
+@unittest.skipIf(cobs._cobs_ext is None, 'compiled core is not built')
+class Test_COBS_Extension(unittest.TestCase):
+    """
+    Test cases for the optional compiled core of the codecs_lib.cobs.COBS_Coder
+    class.
+    
+    Test ids TEST-T-180 to TEST-T-182. Covers the requirements REQ-FUN-180
+    and REQ-FUN-181.
+    
+    Version 1.1.0.0
+    """
+    
+    def test_same_results(self):
+        """
+        Tests that the compiled and the pure Python cores produce the same
+        results on random data.
+        
+        Test id TEST-T-180. Covers the requirements REQ-FUN-180.
+        
+        Version 1.0.0.0
+        """
+        self.assertIs(COBS_Coder._Extension, cobs._cobs_ext)
+        for _ in range(200):
+            iLength = random.randint(0, 2000)
+            bsSample = bytes(random.choice((0, 1, 2, 255))
+                                                    for _ in range(iLength))
+            bsControl = COBS_Coder_Python.encode(bsSample)
+            bsTest = COBS_Coder.encode(bsSample)
+            self.assertIsInstance(bsTest, bytes)
+            self.assertEqual(bsTest, bsControl)
+            bsTest = COBS_Coder.decode(bsControl)
+            self.assertIsInstance(bsTest, bytes)
+            self.assertEqual(bsTest, bsSample)
+            bsSample = bsSample.replace(b'\x00', b'')
+            self.assertEqual(COBS_Coder.decode(bsSample),
+                                            COBS_Coder_Python.decode(bsSample))
+    
+    def test_release_GIL(self):
+        """
+        Tests that the compiled core defines the GIL release threshold, and
+        that the data around and above the threshold, which is processed
+        without the GIL, is encoded and decoded as by the pure Python core,
+        including the search for the inner zero characters.
+        
+        Test id TEST-T-181. Covers the requirements REQ-FUN-181.
+        
+        Version 1.0.0.0
+        """
+        iThreshold = cobs._cobs_ext.GIL_THRESHOLD
+        self.assertIsInstance(iThreshold, int)
+        self.assertGreater(iThreshold, 0)
+        for iLength in (iThreshold - 1, iThreshold, iThreshold + 1,
+                                                    10 * iThreshold + 17):
+            bsSample = bytes(random.choice((0, 1, 2, 255))
+                                                    for _ in range(iLength))
+            bsControl = COBS_Coder_Python.encode(bsSample)
+            self.assertEqual(COBS_Coder.encode(bsSample), bsControl)
+            self.assertEqual(COBS_Coder.decode(bsControl), bsSample)
+            bsSample = bsSample.replace(b'\x00', b'\x03')
+            self.assertEqual(cobs._cobs_ext.find_zero(bsSample), -1)
+            for iPosition in (0, iLength // 2, iLength - 1):
+                baSample = bytearray(bsSample)
+                baSample[iPosition] = 0
+                self.assertEqual(cobs._cobs_ext.find_zero(baSample), iPosition)
+                with self.assertRaises(ValueError):
+                    COBS_Coder.decode(b''.join([b'\x01', baSample, b'\x01']))
+
+    def _countDuring(self, Function, Data, Duration = 0.05) -> int:
+        """
+        Helper method, which calls the function on the data back to back for
+        the given duration (seconds), while a second Python thread increments
+        a counter, and returns the number of the increments made during the
+        calls. The thread switch interval is set very long, so the second
+        thread runs only when the calling thread releases the GIL. Many short
+        calls are used instead of a single call on large data, because the
+        thread may not be scheduled within a short call, especially on a
+        single CPU.
+        
+        Version 1.1.0.0
+        """
+        dictState = {'count' : 0, 'stop' : False}
+        objStarted = threading.Event()
+        
+        def Count():
+            objStarted.set()
+            while not dictState['stop']:
+                dictState['count'] += 1
+                time.sleep(0) #releases the GIL, lets the caller re-acquire it
+        
+        fInterval = sys.getswitchinterval()
+        sys.setswitchinterval(100.0)
+        objThread = threading.Thread(target = Count, daemon = True)
+        try:
+            objThread.start()
+            objStarted.wait()
+            iBefore = dictState['count']
+            fEnd = time.perf_counter() + Duration
+            while time.perf_counter() < fEnd:
+                Function(Data)
+            iAfter = dictState['count']
+        finally:
+            dictState['stop'] = True
+            sys.setswitchinterval(fInterval)
+            objThread.join()
+        return iAfter - iBefore
+    
+    def test_GIL_released(self):
+        """
+        Tests that another Python thread makes progress while the compiled core
+        encodes, decodes or searches the data of at least the threshold length,
+        and does not - while the data is shorter than the threshold.
+        
+        Test id TEST-T-182. Covers the requirements REQ-FUN-181.
+        
+        Version 1.1.0.0
+        """
+        iThreshold = cobs._cobs_ext.GIL_THRESHOLD
+        bsLarge = os.urandom(128 * iThreshold) #1 MiB
+        bsEncoded = cobs._cobs_ext.encode(bsLarge)
+        bsSmall = os.urandom(iThreshold - 1)
+        bsNoZero = bsLarge.replace(b'\x00', b'\x01')
+        for Function, Large, Small in (
+                (cobs._cobs_ext.encode, bsLarge, bsSmall),
+                (cobs._cobs_ext.decode, bsEncoded,
+                        cobs._cobs_ext.encode(bsSmall)[ : iThreshold - 1]),
+                (cobs._cobs_ext.find_zero, bsNoZero,
+                                            bsSmall.replace(b'\x00', b'\x01'))):
+            with self.subTest(Function = Function.__name__):
+                self.assertEqual(self._countDuring(Function, Small), 0)
+                self.assertGreater(self._countDuring(Function, Large), 0)
+
+class Test_COBS_Coder_Backend(unittest.TestCase):
+    """
+    Test cases for the selection of the decoding backend of the
+    codecs_lib.cobs.COBS_Coder class.
+    
+    Test ids TEST-T-190, TEST-T-191 and TEST-T-192. Covers the requirements
+    REQ-FUN-190, REQ-AWM-190 and REQ-AWM-191.
+    
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version: 1.0.0.0
+        """
+        Test_COBS_Coder.setUpClass()
+        cls.TestClass = COBS_Coder
+        cls.lstDecoded = Test_COBS_Coder.lstDecoded
+        cls.lstEncoded = Test_COBS_Coder.lstEncoded
+        cls.lstBackends = ['python']
+        if not (cobs._cobs_ext is None):
+            cls.lstBackends.append('c')
+        if cobs.NUMPY_AVAILABLE:
+            cls.lstBackends.append('numpy')
+        cls.bsLarge = bytes(random.choice((0, 1, 2, 255))
+                                                for _ in range(100000))
+    
+    def test_decode_Backend(self):
+        """
+        Tests that all available backends produce the same decoding results,
+        including the data longer than the automatic NumPy threshold.
+        
+        Test id TEST-T-190. Covers the requirements REQ-FUN-190.
+        
+        Version 1.0.0.0
+        """
+        bsLargeEncoded = self.TestClass.encode(self.bsLarge)
+        for strBackend in self.lstBackends + [None]:
+            for iIndex, bsSample in enumerate(self.lstEncoded):
+                bsTest = self.TestClass.decode(b''.join([b'\x00', bsSample]),
+                                                        Backend = strBackend)
+                self.assertIsInstance(bsTest, bytes)
+                self.assertEqual(bsTest, self.lstDecoded[iIndex])
+                bsTest = self.TestClass.decode(bytearray(bsSample),
+                                                        Backend = strBackend)
+                self.assertEqual(bsTest, self.lstDecoded[iIndex])
+            bsTest = self.TestClass.decode(bsLargeEncoded, Backend = strBackend)
+            self.assertEqual(bsTest, self.bsLarge)
+        for strBackend in ('python', None):
+            bsTest = COBS_Coder_Python.decode(bsLargeEncoded,
+                                                        Backend = strBackend)
+            self.assertEqual(bsTest, self.bsLarge)
+    
+    def test_decode_Backend_Raises_TypeError(self):
+        """
+        Tests the decoding raises TypeError if the backend is neither a string
+        nor None.
+        
+        Test id TEST-T-191. Covers the requirements REQ-AWM-190.
+        
+        Version 1.0.0.0
+        """
+        for gBackend in (1, 1.0, b'c', ['c'], ('python', ), str):
+            with self.assertRaises(TypeError):
+                self.TestClass.decode(b'\x02\x11', Backend = gBackend)
+    
+    def test_decode_Backend_Raises_ValueError(self):
+        """
+        Tests the decoding raises ValueError if the requested backend is
+        unknown or not available.
+        
+        Test id TEST-T-192. Covers the requirements REQ-AWM-191.
+        
+        Version 1.0.0.0
+        """
+        for strBackend in ('', 'C', 'Python', 'cython', 'numba'):
+            with self.assertRaises(ValueError):
+                self.TestClass.decode(b'\x02\x11', Backend = strBackend)
+        for strBackend in ('c', 'numpy'):
+            with self.assertRaises(ValueError):
+                COBS_Coder_Python.decode(b'\x02\x11', Backend = strBackend)
+
+class Test_COBS_Coder_Mode(unittest.TestCase):
+    """
+    Test cases for the COBS/R, COBS/ZPE and COBS/16 variants of the encoding /
+    decoding of the codecs_lib.cobs.COBS_Coder class.
+    
+    Test ids TEST-T-1A0 to TEST-T-1A5. Covers the requirements REQ-FUN-1A0,
+    REQ-FUN-1A1, REQ-FUN-1A2, REQ-AWM-1A0 and REQ-AWM-1A1.
+    
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version: 1.0.0.0
+        """
+        cls.TestClass = COBS_Coder
+        cls.lstReduced = [
+            (b'', b'\x01'), (b'1', b'1'), (b'\x01', b'\x02\x01'),
+            (b'\x00', b'\x01\x01'), (b'12345', b'51234'),
+            (b'\x05\x02', b'\x03\x05\x02'), (b'\x05\x04', b'\x04\x05'),
+            (b'12345\x006789', b'\x0612345' b'9678'),
+            (b'12345\x00\x04', b'\x0612345\x04')]
+        cls.lstZPE = [
+            (b'', b'\x01'), (b'\x00', b'\xe1'), (b'\x00\x00', b'\xe1\x01'),
+            (b'\x11', b'\x02\x11'), (b'\x11\x00\x00\x22',
+                                                    b'\xe2\x11\x02\x22'),
+            (b'\x11' * 223, b''.join([b'\xe0', b'\x11' * 223, b'\x01'])),
+            (b'\x11' * 30 + b'\x00\x00',
+                                b''.join([b'\xff', b'\x11' * 30, b'\x01']))]
+        cls.lstWide = [
+            (b'', b'\x01\x01'), (b'\x00', b'\x01\x01\x01\x01'),
+            (b'\x11\x22\x00\x33', b'\x01\x03\x11\x22\x01\x02\x33'),
+            (b'\x11' * 254, b''.join([b'\x01\xff', b'\x11' * 254])),
+            (b'\x11' * 255, b''.join([b'\x02\x01', b'\x11' * 255])),
+            (b'\x11' * 65024, b''.join([b'\xff\xff', b'\x11' * 65024])),
+            (b'\x11' * 65025, b''.join([b'\xff\xff', b'\x11' * 65024,
+                                                        b'\x01\x02\x11'])),
+            (b'\x11' * 65024 + b'\x00', b''.join([b'\xff\xff',
+                                b'\x11' * 65024, b'\x01\x01\x01\x01']))]
+        cls.lstBackends = [None, 'python']
+        if not (cobs._cobs_ext is None):
+            cls.lstBackends.append('c')
+        if cobs.NUMPY_AVAILABLE:
+            cls.lstBackends.append('numpy')
+        cls.lstRandom = []
+        for _ in range(300):
+            iLength = random.choice((0, 1, 30, 31, 222, 223, 224, 253, 254,
+                                        255, 508, 509, random.randint(2, 1000)))
+            if random.random() < 0.3:
+                bsSample = bytes(random.randint(1, 255)
+                                                    for _ in range(iLength))
+            else:
+                bsSample = bytes(random.choice((0, 0, 1, 2, 200, 254, 255))
+                                                    for _ in range(iLength))
+            cls.lstRandom.append(bsSample)
+    
+    def test_known_vectors(self):
+        """
+        Tests the COBS/R, COBS/ZPE and COBS/16 encoding / decoding against the
+        known pairs of the decoded and encoded data.
+        
+        Test id TEST-T-1A0. Covers the requirements REQ-FUN-1A0, REQ-FUN-1A1,
+        REQ-FUN-1A2.
+        
+        Version 1.0.0.0
+        """
+        for strMode, lstPairs in (('COBS/R', self.lstReduced),
+                                                    ('COBS/ZPE', self.lstZPE),
+                                                    ('COBS/16', self.lstWide)):
+            for bsDecoded, bsEncoded in lstPairs:
+                bsTest = self.TestClass.encode(bsDecoded, Mode = strMode)
+                self.assertIsInstance(bsTest, bytes)
+                self.assertEqual(bsTest, bsEncoded)
+                for strBackend in self.lstBackends:
+                    bsTest = self.TestClass.decode(
+                                b''.join([b'\x00', bsEncoded, b'\x00']),
+                                        Mode = strMode, Backend = strBackend)
+                    self.assertIsInstance(bsTest, bytes)
+                    self.assertEqual(bsTest, bsDecoded)
+    
+    def test_round_trip(self):
+        """
+        Tests that the random data survive the encoding and decoding in each
+        mode with each available backend, and that the encoded data never
+        contain zero characters.
+        
+        Test id TEST-T-1A1. Covers the requirements REQ-FUN-1A0, REQ-FUN-1A1,
+        REQ-FUN-1A2.
+        
+        Version 1.0.0.0
+        """
+        for strMode in cobs.MODES + (None, ):
+            for bsSample in self.lstRandom:
+                bsEncoded = self.TestClass.encode(bytearray(bsSample),
+                                                                Mode = strMode)
+                self.assertNotIn(0, bsEncoded)
+                for strBackend in self.lstBackends:
+                    bsTest = self.TestClass.decode(bsEncoded, Mode = strMode,
+                                                        Backend = strBackend)
+                    self.assertEqual(bsTest, bsSample)
+    
+    def test_overhead(self):
+        """
+        Tests that COBS/R encoding is never longer than the plain COBS, and
+        that COBS/ZPE encoding is shorter than the plain COBS for the data
+        containing pairs of zeroes.
+        
+        Test id TEST-T-1A2. Covers the requirements REQ-FUN-1A0, REQ-FUN-1A1.
+        
+        Version 1.0.0.0
+        """
+        for bsSample in self.lstRandom:
+            self.assertLessEqual(
+                        len(self.TestClass.encode(bsSample, Mode = 'COBS/R')),
+                        len(self.TestClass.encode(bsSample)))
+        bsSample = b'\x11\x22\x00\x00' * 100
+        self.assertLess(
+                        len(self.TestClass.encode(bsSample, Mode = 'COBS/ZPE')),
+                        len(self.TestClass.encode(bsSample)))
+    
+    def test_wide_blocks(self):
+        """
+        Tests the COBS/16 encoding / decoding of the large data around the
+        block boundaries, and that its overhead is lower than of the plain
+        COBS for the large data without zero characters.
+        
+        Test id TEST-T-1A5. Covers the requirements REQ-FUN-1A2.
+        
+        Version 1.0.0.0
+        """
+        bsTable = bytes((0, 1, 2, 255)) * 64
+        for iLength in (65023, 65024, 65025, 130048, 130049, 200000):
+            for bsSample in (os.urandom(iLength).replace(b'\x00', b'\x01'),
+                                        os.urandom(iLength).translate(bsTable)):
+                for bsTail in (b'', b'\x00', b'\x00\x00'):
+                    bsData = b''.join([bsSample, bsTail])
+                    bsEncoded = self.TestClass.encode(bsData, Mode = 'COBS/16')
+                    self.assertNotIn(0, bsEncoded)
+                    bsTest = self.TestClass.decode(bsEncoded, Mode = 'COBS/16')
+                    self.assertEqual(bsTest, bsData)
+        bsSample = os.urandom(1000000).replace(b'\x00', b'\x01')
+        iLength = len(self.TestClass.encode(bsSample, Mode = 'COBS/16'))
+        self.assertEqual(iLength, 1000000 + 2 * 16)
+        self.assertLess(iLength, len(self.TestClass.encode(bsSample)))
+    
+    def test_Mode_Raises_TypeError(self):
+        """
+        Tests the encoding / decoding raises TypeError if the mode is neither a
+        string nor None.
+        
+        Test id TEST-T-1A3. Covers the requirements REQ-AWM-1A0.
+        
+        Version 1.0.0.0
+        """
+        for gMode in (1, 1.0, b'COBS', ['COBS'], ('COBS/R', ), str):
+            with self.assertRaises(TypeError):
+                self.TestClass.encode(b'\x11', Mode = gMode)
+            with self.assertRaises(TypeError):
+                self.TestClass.decode(b'\x02\x11', Mode = gMode)
+    
+    def test_Mode_Raises_ValueError(self):
+        """
+        Tests the encoding / decoding raises ValueError if the mode is unknown.
+        
+        Test id TEST-T-1A4. Covers the requirements REQ-AWM-1A1.
+        
+        Version 1.0.0.0
+        """
+        for strMode in ('', 'cobs', 'COBS/r', 'COBS-R', 'ZPE', 'COBS/32'):
+            with self.assertRaises(ValueError):
+                self.TestClass.encode(b'\x11', Mode = strMode)
+            with self.assertRaises(ValueError):
+                self.TestClass.decode(b'\x02\x11', Mode = strMode)
+
+class Test_COBS_FrameReader(unittest.TestCase):
+    """
+    Test cases for the the codecs_lib.cobs.COBS_FrameReader class.
+    
+    Test ids TEST-T-1B0, TEST-T-1B1 and TEST-T-1B2. Covers the requirements
+    REQ-FUN-1B0 and REQ-AWM-1B0.
+    
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version: 1.0.0.0
+        """
+        Test_COBS_Coder.setUpClass()
+        cls.TestClass = COBS_FrameReader
+        cls.lstDecoded = list(Test_COBS_Coder.lstDecoded)
+        cls.lstDecoded.append(bytes(random.choice((0, 1, 2, 255))
+                                                    for _ in range(70000)))
+        cls.lstDecoded.append(b'')
+    
+    def setUp(self):
+        """
+        Preparation for each test case - a new event loop.
+        
+        Version: 1.0.0.0
+        """
+        self.Loop = asyncio.new_event_loop()
+    
+    def tearDown(self):
+        """
+        Clean-up after each test case - closing of the event loop.
+        
+        Version: 1.0.0.0
+        """
+        self.Loop.close()
+    
+    async def _readAll(self, bsFeed, strMode = None, iLimit = 2**16):
+        """
+        Helper coroutine feeding the data into a stream reader and reading all
+        frames with an async for loop.
+        
+        Version: 1.0.0.0
+        """
+        objStream = asyncio.StreamReader(limit = iLimit)
+        objStream.feed_data(bsFeed)
+        objStream.feed_eof()
+        objReader = self.TestClass(objStream, Mode = strMode)
+        lstResult = [bsFrame async for bsFrame in objReader]
+        self.assertIsNone(await objReader.readFrame())
+        return lstResult
+    
+    def test_readFrame(self):
+        """
+        Tests that the delimited frames are read from a stream and decoded,
+        including the frames longer than the stream buffer limit, with the
+        empty frames skipped, for each mode.
+        
+        Test id TEST-T-1B0. Covers the requirements REQ-FUN-1B0.
+        
+        Version 1.0.0.0
+        """
+        for strMode in cobs.MODES:
+            bsFeed = b''.join(b''.join([b'\x00' * random.randint(0, 2),
+                                    COBS_Coder.encode(bsItem, Mode = strMode),
+                                    b'\x00']) for bsItem in self.lstDecoded)
+            for iLimit in (16, 2**16):
+                lstResult = self.Loop.run_until_complete(
+                                        self._readAll(bsFeed, strMode, iLimit))
+                self.assertListEqual(lstResult, self.lstDecoded)
+    
+    def test_unterminated(self):
+        """
+        Tests that an unterminated frame at the end of the stream is discarded
+        and the end of the stream is reported.
+        
+        Test id TEST-T-1B1. Covers the requirements REQ-FUN-1B0.
+        
+        Version 1.0.0.0
+        """
+        for bsFeed, lstFrames in ((b'', []), (b'\x00\x00', []),
+                                    (b'\x02\x11', []),
+                                    (b'\x02\x11\x00\x03\x22', [b'\x11'])):
+            lstResult = self.Loop.run_until_complete(self._readAll(bsFeed))
+            self.assertListEqual(lstResult, lstFrames)
+    
+    def test_init_Raises(self):
+        """
+        Tests that the initialization raises TypeError or ValueError if the
+        mode is not a string / None, or not a supported variant.
+        
+        Test id TEST-T-1B2. Covers the requirements REQ-AWM-1B0.
+        
+        Version 1.0.0.0
+        """
+        objStream = asyncio.StreamReader(loop = self.Loop)
+        for gMode in (1, b'COBS', ['COBS'], str):
+            with self.assertRaises(TypeError):
+                self.TestClass(objStream, Mode = gMode)
+        for strMode in ('', 'cobs', 'COBS/32'):
+            with self.assertRaises(ValueError):
+                self.TestClass(objStream, Mode = strMode)
+
+class Test_COBS_FrameWriter(unittest.TestCase):
+    """
+    Test cases for the the codecs_lib.cobs.COBS_FrameWriter class.
+    
+    Test ids TEST-T-1B3, TEST-T-1B4 and TEST-T-1B5. Covers the requirements
+    REQ-FUN-1B1, REQ-AWM-1B0 and REQ-AWM-1B1.
+    
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version: 1.0.0.0
+        """
+        Test_COBS_Coder.setUpClass()
+        cls.TestClass = COBS_FrameWriter
+        cls.lstDecoded = list(Test_COBS_Coder.lstDecoded)
+        cls.lstDecoded.append(bytes(random.choice((0, 1, 2, 255))
+                                                    for _ in range(300000)))
+        cls.lstBadInput = Test_COBS_Coder.lstBadInput
+    
+    def setUp(self):
+        """
+        Preparation for each test case - a new event loop.
+        
+        Version: 1.0.0.0
+        """
+        self.Loop = asyncio.new_event_loop()
+    
+    def tearDown(self):
+        """
+        Clean-up after each test case - closing of the event loop.
+        
+        Version: 1.0.0.0
+        """
+        self.Loop.close()
+    
+    async def _exchange(self, strMode):
+        """
+        Helper coroutine sending all frames via a connected pair of sockets,
+        using all sending methods, and receiving them concurrently.
+        
+        Version: 1.0.0.0
+        """
+        sockA, sockB = socket.socketpair()
+        objStreamA, objStreamW = await asyncio.open_connection(sock = sockA)
+        objStreamR, objStreamB = await asyncio.open_connection(sock = sockB)
+        objWriter = self.TestClass(objStreamW, Mode = strMode)
+        objReader = COBS_FrameReader(objStreamR, Mode = strMode)
+        async def _send():
+            for bsFrame in self.lstDecoded:
+                await objWriter.send(bsFrame)
+            objWriter.write(self.lstDecoded[0])
+            objWriter.writeMany(self.lstDecoded[1:3])
+            objWriter.writeMany([])
+            await objWriter.drain()
+            objWriter.close()
+            await objWriter.waitClosed()
+        objTask = asyncio.ensure_future(_send())
+        lstResult = [bsFrame async for bsFrame in objReader]
+        await objTask
+        objStreamB.close()
+        return lstResult
+    
+    def test_send(self):
+        """
+        Tests that the frames sent by the writer via a stream are received
+        and decoded by the reader, for each mode.
+        
+        Test id TEST-T-1B3. Covers the requirements REQ-FUN-1B1.
+        
+        Version 1.0.0.0
+        """
+        for strMode in cobs.MODES:
+            lstResult = self.Loop.run_until_complete(self._exchange(strMode))
+            self.assertListEqual(lstResult,
+                                        self.lstDecoded + self.lstDecoded[:3])
+    
+    def test_init_Raises(self):
+        """
+        Tests that the initialization raises TypeError or ValueError if the
+        mode is not a string / None, or not a supported variant.
+        
+        Test id TEST-T-1B4. Covers the requirements REQ-AWM-1B0.
+        
+        Version 1.0.0.0
+        """
+        for gMode in (1, b'COBS', ['COBS'], str):
+            with self.assertRaises(TypeError):
+                self.TestClass(None, Mode = gMode)
+        for strMode in ('', 'cobs', 'COBS/32'):
+            with self.assertRaises(ValueError):
+                self.TestClass(None, Mode = strMode)
+    
+    def test_write_Raises_TypeError(self):
+        """
+        Tests that writing of the frames raises TypeError if a frame is not a
+        byte-string or bytes array, or the frames are not passed as a
+        sequence, without anything written into the stream.
+        
+        Test id TEST-T-1B5. Covers the requirements REQ-AWM-1B1.
+        
+        Version 1.0.0.0
+        """
+        objWriter = self.TestClass(None)
+        for gItem in self.lstBadInput:
+            with self.assertRaises(TypeError):
+                objWriter.write(gItem)
+            with self.assertRaises(TypeError):
+                self.Loop.run_until_complete(objWriter.send(gItem))
+            with self.assertRaises(TypeError):
+                objWriter.writeMany([b'\x11', gItem])
+        for gItem in (1, 1.0, None, {b'\x11'}, (bsItem for bsItem in [b'1'])):
+            with self.assertRaises(TypeError):
+                objWriter.writeMany(gItem)
+
+class Test_COBS_Coder_Capture(unittest.TestCase):
+    """
+    Test cases for the parallel decoding of the capture files by the
+    codecs_lib.cobs.COBS_Coder class.
+    
+    Test ids TEST-T-1C0 to TEST-T-1C3. Covers the requirements REQ-FUN-1C0,
+    REQ-AWM-1C0 and REQ-AWM-1C1.
+    
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version: 1.0.0.0
+        """
+        Test_COBS_Coder.setUpClass()
+        cls.TestClass = COBS_Coder
+        cls.lstDecoded = list(Test_COBS_Coder.lstDecoded)
+        for _ in range(200):
+            cls.lstDecoded.append(bytes(random.choice((0, 1, 2, 255))
+                                    for _ in range(random.randint(0, 300))))
+        cls.objFolder = tempfile.TemporaryDirectory()
+        cls.strInput = os.path.join(cls.objFolder.name, 'capture.bin')
+        cls.strOutput = os.path.join(cls.objFolder.name, 'output.bin')
+    
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Clean-up after the test cases, done only once.
+        
+        Version: 1.0.0.0
+        """
+        cls.objFolder.cleanup()
+    
+    def _writeCapture(self, strMode, bTerminated = True):
+        """
+        Helper method to create a capture file with the random number of the
+        delimiters between the frames.
+        
+        Version: 1.0.0.0
+        """
+        bsData = b''.join(b''.join([b'\x00' * random.randint(0, 2),
+                                self.TestClass.encode(bsItem, Mode = strMode),
+                                b'\x00']) for bsItem in self.lstDecoded)
+        if not bTerminated:
+            bsData = bsData.rstrip(b'\x00')
+        with open(self.strInput, 'wb') as fFile:
+            fFile.write(bsData)
+        return bsData
+    
+    def test_decodeCapture(self):
+        """
+        Tests the decoding of a capture file into a list of frames, in the
+        current process and with a pool of processes, in each mode.
+        
+        Test id TEST-T-1C0. Covers the requirements REQ-FUN-1C0.
+        
+        Version 1.0.1.0
+        """
+        for strMode in cobs.MODES:
+            for bTerminated in (True, False):
+                bsData = self._writeCapture(strMode, bTerminated)
+                for iWorkers, iChunk in ((1, 1000), (2, 10**7), (2, 1000),
+                                                                    (3, 1)):
+                    lstResult = self.TestClass.decodeCapture(self.strInput,
+                                            Mode = strMode, Workers = iWorkers,
+                                                        ChunkSize = iChunk)
+                    self.assertIsInstance(lstResult, list)
+                    self.assertListEqual(lstResult, self.lstDecoded)
+                    if strMode == 'COBS':
+                        self.assertListEqual(lstResult,
+                                            self.TestClass.decodeMany(bsData))
+        self._writeCapture('COBS')
+        lstResult = COBS_Coder_Python.decodeCapture(
+                                    pathlib.Path(self.strInput), Workers = 2,
+                                    Mode = 'COBS', ChunkSize = 5000)
+        self.assertListEqual(lstResult, self.lstDecoded)
+        with open(self.strInput, 'wb') as fFile:
+            pass
+        self.assertListEqual(self.TestClass.decodeCapture(self.strInput), [])
+    
+    def test_decodeCapture_Output(self):
+        """
+        Tests the decoding of a capture file into an output file.
+        
+        Test id TEST-T-1C1. Covers the requirements REQ-FUN-1C0.
+        
+        Version 1.0.0.0
+        """
+        self._writeCapture('COBS')
+        for iWorkers, iChunk in ((1, 1000), (2, 1000)):
+            iResult = self.TestClass.decodeCapture(self.strInput,
+                                Output = pathlib.Path(self.strOutput),
+                                Workers = iWorkers, ChunkSize = iChunk)
+            self.assertEqual(iResult, len(self.lstDecoded))
+            with open(self.strOutput, 'rb') as fFile:
+                self.assertEqual(fFile.read(), b''.join(self.lstDecoded))
+    
+    def test_decodeCapture_Raises_TypeError(self):
+        """
+        Tests that the decoding of a capture file raises TypeError if any of
+        the arguments is of an improper type.
+        
+        Test id TEST-T-1C2. Covers the requirements REQ-AWM-1C0.
+        
+        Version 1.0.0.0
+        """
+        self._writeCapture('COBS')
+        for gItem in (1, 1.0, None, b'capture.bin', ['capture.bin']):
+            with self.assertRaises(TypeError):
+                self.TestClass.decodeCapture(gItem)
+        for gItem in (1, 1.0, b'output.bin', ['output.bin']):
+            with self.assertRaises(TypeError):
+                self.TestClass.decodeCapture(self.strInput, Output = gItem)
+        for gItem in (1, b'COBS', str):
+            with self.assertRaises(TypeError):
+                self.TestClass.decodeCapture(self.strInput, Mode = gItem)
+        for gItem in (1.0, '2', True, [2]):
+            with self.assertRaises(TypeError):
+                self.TestClass.decodeCapture(self.strInput, Workers = gItem)
+            with self.assertRaises(TypeError):
+                self.TestClass.decodeCapture(self.strInput, ChunkSize = gItem)
+        with self.assertRaises(TypeError):
+            self.TestClass.decodeCapture(self.strInput, ChunkSize = None)
+    
+    def test_decodeCapture_Raises_ValueError(self):
+        """
+        Tests that the decoding of a capture file raises ValueError if the mode
+        is not supported, or the number of workers or the chunk size is not
+        positive.
+        
+        Test id TEST-T-1C3. Covers the requirements REQ-AWM-1C1.
+        
+        Version 1.0.0.0
+        """
+        self._writeCapture('COBS')
+        with self.assertRaises(ValueError):
+            self.TestClass.decodeCapture(self.strInput, Mode = 'cobs')
+        for iItem in (0, -1):
+            with self.assertRaises(ValueError):
+                self.TestClass.decodeCapture(self.strInput, Workers = iItem)
+            with self.assertRaises(ValueError):
+                self.TestClass.decodeCapture(self.strInput, ChunkSize = iItem)
+
+class Test_COBS_Coder_File(unittest.TestCase):
+    """
+    Test cases for the encoding and decoding of the files by the
+    codecs_lib.cobs.COBS_Coder class.
+    
+    Test ids TEST-T-1D0 to TEST-T-1D3. Covers the requirements REQ-FUN-1D0,
+    REQ-FUN-1D1, REQ-AWM-1D0 and REQ-AWM-1D1.
+    
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version: 1.0.0.0
+        """
+        Test_COBS_Coder.setUpClass()
+        cls.TestClass = COBS_Coder
+        cls.lstDecoded = list(Test_COBS_Coder.lstDecoded)
+        bsTable = bytes((0, 1, 2, 255)) * 64
+        cls.lstDecoded.append(os.urandom(1200000).translate(bsTable))
+        cls.lstDecoded.append(os.urandom(254 * 5000).replace(b'\x00', b'\x01'))
+        #the data around the block and window boundaries
+        bsFull = b'\x01' * 254
+        cls.lstBoundary = [bsFull, bsFull + b'\x00', bsFull * 2 + b'\x00\x00',
+                            b'\x00' * 300, b'\x02' * 253 + b'\x00' + bsFull,
+                            (bsFull + b'\x00') * 3 + bsFull,
+                            os.urandom(5000).translate(bsTable),
+                            os.urandom(5000).replace(b'\x00', b'\x01')]
+        cls.objFolder = tempfile.TemporaryDirectory()
+        cls.strInput = os.path.join(cls.objFolder.name, 'input.bin')
+        cls.strOutput = os.path.join(cls.objFolder.name, 'output.bin')
+    
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Clean-up after the test cases, done only once.
+        
+        Version: 1.0.0.0
+        """
+        cls.objFolder.cleanup()
+    
+    def _getSmallWindowClasses(self):
+        """
+        Helper method returning the sub-classes of the tested class (and of
+        the class using the pure Python core) with the small file windows.
+        
+        Version: 1.0.0.0
+        """
+        Result = []
+        for clsBase in (self.TestClass, COBS_Coder_Python):
+            for iWindow in (1, 254, 255, 300, 1000):
+                Result.append(type('COBS_SmallWindow', (clsBase, ),
+                                                {'_FileChunkSize' : iWindow}))
+        return Result
+    
+    def _readBack(self, bsData, fnMethod, strPrefix = b'', strSuffix = b''):
+        """
+        Helper method to write the data into the input file, process it by
+        the tested method and read back the content of the output file.
+        
+        Version: 1.0.0.0
+        """
+        with open(self.strInput, 'wb') as fFile:
+            fFile.write(b''.join([strPrefix, bsData, strSuffix]))
+        iResult = fnMethod(self.strInput, pathlib.Path(self.strOutput))
+        with open(self.strOutput, 'rb') as fFile:
+            bsResult = fFile.read()
+        self.assertEqual(iResult, len(bsResult))
+        return bsResult
+    
+    def test_encodeFile(self):
+        """
+        Tests the encoding of files, including an empty file and the files
+        larger than the processed window, also with the small windows and the
+        pure Python core.
+        
+        Test id TEST-T-1D0. Covers the requirements REQ-FUN-1D0.
+        
+        Version 1.1.0.0
+        """
+        for bsSample in self.lstDecoded:
+            bsTest = self._readBack(bsSample, self.TestClass.encodeFile)
+            self.assertEqual(bsTest, self.TestClass.encode(bsSample))
+        for clsTest in self._getSmallWindowClasses():
+            for bsSample in self.lstBoundary:
+                bsTest = self._readBack(bsSample, clsTest.encodeFile)
+                self.assertEqual(bsTest, self.TestClass.encode(bsSample))
+    
+    def test_decodeFile(self):
+        """
+        Tests the decoding of files, with and without the leading and tailing
+        delimiters, including an empty file and the files larger than the
+        processed window, also with the small windows and the pure Python
+        core.
+        
+        Test id TEST-T-1D1. Covers the requirements REQ-FUN-1D1.
+        
+        Version 1.1.0.0
+        """
+        for bsSample in self.lstDecoded:
+            bsEncoded = self.TestClass.encode(bsSample)
+            for bsPrefix, bsSuffix in ((b'', b''), (b'\x00', b'\x00\x00')):
+                bsTest = self._readBack(bsEncoded, self.TestClass.decodeFile,
+                                                        bsPrefix, bsSuffix)
+                self.assertEqual(bsTest, bsSample)
+        for clsTest in self._getSmallWindowClasses():
+            for bsSample in self.lstBoundary:
+                bsEncoded = self.TestClass.encode(bsSample)
+                bsTest = self._readBack(bsEncoded, clsTest.decodeFile,
+                                                            b'\x00', b'\x00')
+                self.assertEqual(bsTest, bsSample)
+        for bsSample in (b'', b'\x00', b'\x00\x00\x00'):
+            bsTest = self._readBack(bsSample, self.TestClass.decodeFile)
+            self.assertEqual(bsTest, b'')
+    
+    def test_File_Raises_TypeError(self):
+        """
+        Tests that the encoding and decoding of files raise TypeError if either
+        of the paths is neither a string nor a path-like object.
+        
+        Test id TEST-T-1D2. Covers the requirements REQ-AWM-1D0.
+        
+        Version 1.0.0.0
+        """
+        with open(self.strInput, 'wb') as fFile:
+            fFile.write(b'\x02\x11')
+        for fnMethod in (self.TestClass.encodeFile,
+                                                self.TestClass.decodeFile):
+            for gItem in (1, 1.0, None, b'input.bin', ['input.bin']):
+                with self.assertRaises(TypeError):
+                    fnMethod(gItem, self.strOutput)
+                with self.assertRaises(TypeError):
+                    fnMethod(self.strInput, gItem)
+    
+    def test_File_Raises_ValueError(self):
+        """
+        Tests that the encoding and decoding of files raise ValueError if the
+        source and target are the same file, and the decoding - if the file
+        contains a zero character not in the leading or tailing position, in
+        which case the output file is not created.
+        
+        Test id TEST-T-1D3. Covers the requirements REQ-AWM-1D1.
+        
+        Version 1.0.0.0
+        """
+        with open(self.strInput, 'wb') as fFile:
+            fFile.write(b'\x02\x11\x00\x02\x11')
+        for fnMethod in (self.TestClass.encodeFile,
+                                                self.TestClass.decodeFile):
+            with self.assertRaises(ValueError):
+                fnMethod(self.strInput, self.strInput)
+        if os.path.exists(self.strOutput):
+            os.remove(self.strOutput)
+        with self.assertRaises(ValueError):
+            self.TestClass.decodeFile(self.strInput, self.strOutput)
+        self.assertFalse(os.path.exists(self.strOutput))
+
+class Test_COBS_Coder_Validate(unittest.TestCase):
+    """
+    Test cases for the validation and the decoded length calculation of the
+    encoded frames by the codecs_lib.cobs.COBS_Coder class.
+    
+    Test ids TEST-T-1E0 to TEST-T-1E4. Covers the requirements REQ-FUN-1E0,
+    REQ-FUN-1E1, REQ-AWM-1E0 and REQ-AWM-1E1.
+    
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version: 1.0.0.0
+        """
+        Test_COBS_Coder.setUpClass()
+        Test_COBS_Coder_Mode.setUpClass()
+        cls.TestClass = COBS_Coder
+        cls.lstDecoded = (list(Test_COBS_Coder.lstDecoded)
+                                        + Test_COBS_Coder_Mode.lstRandom)
+        cls.lstMalformed = [b'', b'\x00', b'\x00\x00', b'\x03\x11',
+                            b'\x02\x11\x00\x02\x11', b'\x05\x11\x02\x33',
+                            b''.join([b'\xff', b'\x11' * 253]),
+                            b''.join([b'\x02\x11\x03', b'\x11' * 253])]
+        cls.lstBadInput = ['asd', 1, 1.2, [b'\x02\x11'], None, bytes]
+    
+    def test_validate(self):
+        """
+        Tests that the encoded data in any variant are recognized as
+        well-formed frames, with and without the delimiters, as any buffer.
+        
+        Test id TEST-T-1E0. Covers the requirements REQ-FUN-1E0.
+        
+        Version 1.0.0.0
+        """
+        for strMode in cobs.MODES:
+            for bsSample in self.lstDecoded:
+                bsEncoded = self.TestClass.encode(bsSample, Mode = strMode)
+                for gData in (bsEncoded, bytearray(bsEncoded),
+                                memoryview(b''.join([b'\x00', bsEncoded,
+                                                                b'\x00']))):
+                    bResult = self.TestClass.validate(gData, Mode = strMode)
+                    self.assertIs(bResult, True)
+    
+    def test_validate_malformed(self):
+        """
+        Tests that the empty frames, the frames with zero characters inside
+        and the frames with the truncated last block are recognized as
+        malformed.
+        
+        Test id TEST-T-1E1. Covers the requirements REQ-FUN-1E0.
+        
+        Version 1.0.0.0
+        """
+        for bsSample in self.lstMalformed:
+            self.assertIs(self.TestClass.validate(bsSample), False)
+        for bsSample in self.lstDecoded:
+            if bsSample and bsSample[-1]: #encoded data ends with a data byte
+                bsEncoded = self.TestClass.encode(bsSample)
+                self.assertIs(self.TestClass.validate(bsEncoded[:-1]), False)
+        for bsSample in (b'', b'\x00\x00', b'\x02\x11\x00\x02\x11'):
+            for strMode in cobs.MODES:
+                self.assertIs(self.TestClass.validate(bsSample,
+                                                    Mode = strMode), False)
+        self.assertIs(self.TestClass.validate(b'\xe3\x11',
+                                                Mode = 'COBS/ZPE'), False)
+        self.assertIs(self.TestClass.validate(b'\x03\x11',
+                                                Mode = 'COBS/R'), True)
+    
+    def test_decodedLength(self):
+        """
+        Tests that the calculated length of the decoded data equals the length
+        of the actually decoded data, for each variant of the algorithm.
+        
+        Test id TEST-T-1E2. Covers the requirements REQ-FUN-1E1.
+        
+        Version 1.0.0.0
+        """
+        for strMode in cobs.MODES:
+            for bsSample in self.lstDecoded:
+                bsEncoded = self.TestClass.encode(bsSample, Mode = strMode)
+                for gData in (bsEncoded, memoryview(b''.join([b'\x00',
+                                                    bsEncoded, b'\x00']))):
+                    iResult = self.TestClass.decodedLength(gData,
+                                                            Mode = strMode)
+                    self.assertIsInstance(iResult, int)
+                    self.assertEqual(iResult, len(bsSample))
+    
+    def test_Raises_TypeError(self):
+        """
+        Tests that the validation and the decoded length calculation raise
+        TypeError if the data is not a buffer, or the mode is neither a string
+        nor None.
+        
+        Test id TEST-T-1E3. Covers the requirements REQ-AWM-1E0.
+        
+        Version 1.0.0.0
+        """
+        for fnMethod in (self.TestClass.validate,
+                                            self.TestClass.decodedLength):
+            for gItem in self.lstBadInput:
+                with self.assertRaises(TypeError):
+                    fnMethod(gItem)
+            for gItem in (1, b'COBS', ['COBS'], str):
+                with self.assertRaises(TypeError):
+                    fnMethod(b'\x02\x11', Mode = gItem)
+    
+    def test_Raises_ValueError(self):
+        """
+        Tests that the validation and the decoded length calculation raise
+        ValueError if the mode is not supported, and that the decoded length
+        calculation raises ValueError on the malformed frames.
+        
+        Test id TEST-T-1E4. Covers the requirements REQ-AWM-1E1.
+        
+        Version 1.0.0.0
+        """
+        for fnMethod in (self.TestClass.validate,
+                                            self.TestClass.decodedLength):
+            for strMode in ('', 'cobs', 'COBS/32'):
+                with self.assertRaises(ValueError):
+                    fnMethod(b'\x02\x11', Mode = strMode)
+        for bsSample in self.lstMalformed:
+            with self.assertRaises(ValueError):
+                self.TestClass.decodedLength(bsSample)
+
+class Test_COBS_Coder_Frames(unittest.TestCase):
+    """
+    Test cases for the lazy splitting and decoding of the frames in a receive
+    buffer by the codecs_lib.cobs.COBS_Coder class.
+    
+    Test ids TEST-T-1F0 to TEST-T-1F2. Covers the requirements REQ-FUN-1F0
+    and REQ-AWM-1F0.
+    
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version: 1.0.0.0
+        """
+        Test_COBS_Coder.setUpClass()
+        Test_COBS_Coder_Mode.setUpClass()
+        cls.TestClass = COBS_Coder
+        cls.lstDecoded = (list(Test_COBS_Coder.lstDecoded)
+                                        + Test_COBS_Coder_Mode.lstRandom)
+        cls.lstBadInput = Test_COBS_Coder.lstBadInput
+    
+    def test_iterFrames(self):
+        """
+        Tests that the frames in a buffer of any type are decoded in any
+        variant of the algorithm, with their positions and the start of the
+        unconsumed tail reported correctly.
+        
+        Test id TEST-T-1F0. Covers the requirements REQ-FUN-1F0.
+        
+        Version 1.0.0.0
+        """
+        def Collect(gData, **kwargs):
+            lstFrames = []
+            objIterator = self.TestClass.iterFrames(gData, **kwargs)
+            while True:
+                try:
+                    lstFrames.append(next(objIterator))
+                except StopIteration as objError:
+                    return lstFrames, objError.value
+        for strMode in cobs.MODES:
+            lstEncoded = [self.TestClass.encode(bsItem, Mode = strMode)
+                                                for bsItem in self.lstDecoded]
+            lstParts = [b'\x00' * random.randint(0, 2)]
+            lstPositions = []
+            iPosition = len(lstParts[0])
+            for bsItem in lstEncoded:
+                bsDelimiter = b'\x00' * random.randint(1, 3)
+                lstParts.extend([bsItem, bsDelimiter])
+                lstPositions.append((iPosition, iPosition + len(bsItem)))
+                iPosition += len(bsItem) + len(bsDelimiter)
+            bsTail = lstEncoded[3][:-1]
+            bsInput = b''.join(lstParts + [bsTail])
+            for gInput in (bsInput, bytearray(bsInput), memoryview(bsInput),
+                                                array.array('B', bsInput)):
+                lstTest, iTail = Collect(gInput, Mode = strMode)
+                self.assertEqual(iTail, len(bsInput) - len(bsTail))
+                self.assertEqual(len(lstTest), len(self.lstDecoded))
+                for tupTest, bsItem, tupPosition in zip(lstTest,
+                                            self.lstDecoded, lstPositions):
+                    self.assertIsInstance(tupTest[0], bytes)
+                    self.assertEqual(tupTest[0], bsItem)
+                    self.assertTupleEqual(tupTest[1:], tupPosition)
+        #no complete frames
+        for bsInput in (b'', b'\x00\x00', b'\x02\x11'):
+            lstTest, iTail = Collect(bsInput)
+            self.assertListEqual(lstTest, [])
+            self.assertEqual(iTail, len(bsInput.rstrip(b'\x11\x02')))
+        #compatibility with the splitting approach
+        bsInput = self.TestClass.encodeMany(self.lstDecoded, Join = True)
+        lstTest = [tupItem[0] for tupItem in self.TestClass.iterFrames(bsInput)]
+        self.assertListEqual(lstTest, self.TestClass.decodeMany(bsInput))
+    
+    def test_iterFrames_Buffer(self):
+        """
+        Tests the typical receive loop - the frames are consumed from a
+        bytearray buffer filled in arbitrary chunks, and the consumed part is
+        removed after each pass, which is possible once the generator is
+        exhausted or closed.
+        
+        Test id TEST-T-1F1. Covers the requirements REQ-FUN-1F0.
+        
+        Version 1.0.0.0
+        """
+        bsFeed = self.TestClass.encodeMany(self.lstDecoded, Join = True)
+        baBuffer = bytearray()
+        lstTest = []
+        iPosition = 0
+        while iPosition < len(bsFeed):
+            iChunk = random.randint(1, 700)
+            baBuffer += bsFeed[iPosition : iPosition + iChunk]
+            iPosition += iChunk
+            objIterator = self.TestClass.iterFrames(baBuffer)
+            while True:
+                try:
+                    lstTest.append(next(objIterator)[0])
+                except StopIteration as objError:
+                    del baBuffer[ : objError.value]
+                    break
+        self.assertListEqual(lstTest, self.lstDecoded)
+        self.assertEqual(len(baBuffer), 0)
+        #closed before exhaustion
+        baBuffer = bytearray(bsFeed)
+        objIterator = self.TestClass.iterFrames(baBuffer)
+        self.assertEqual(next(objIterator)[0], self.lstDecoded[0])
+        objIterator.close()
+        del baBuffer[:1]
+    
+    def test_iterFrames_Raises(self):
+        """
+        Tests that the lazy splitting raises TypeError or ValueError upon the
+        call, not upon the iteration, if the input does not support the buffer
+        protocol, or the mode is not a string or is not a supported variant.
+        
+        Test id TEST-T-1F2. Covers the requirements REQ-AWM-1F0.
+        
+        Version 1.0.0.0
+        """
+        for gInput in self.lstBadInput + [memoryview(b'\x11\x22\x33')[::2]]:
+            with self.assertRaises(TypeError):
+                self.TestClass.iterFrames(gInput)
+        for gMode in (1, b'COBS', ['COBS']):
+            with self.assertRaises(TypeError):
+                self.TestClass.iterFrames(b'\x02\x11\x00', Mode = gMode)
+        for strMode in ('cobs', 'COBS/32', ''):
+            with self.assertRaises(ValueError):
+                self.TestClass.iterFrames(b'\x02\x11\x00', Mode = strMode)
+
+class Test_COBS_Coder_Threads(unittest.TestCase):
+    """
+    Test cases for the concurrent use of the codecs_lib.cobs.COBS_Coder class
+    by several threads, with and without the compiled core.
+    
+    Test id TEST-T-1G0. Covers the requirements REQ-FUN-1G0.
+    
+    Version 1.0.0.0
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        
+        Version: 1.0.0.0
+        """
+        cls.lstDecoded = [os.urandom(iLength).translate(
+                                    bytes(random.choice((0, 1, 2, 255, iByte))
+                                                    for iByte in range(256)))
+                                    for iLength in (0, 1, 254, 255, 8191, 8192,
+                                                    65536, 100000, 1000000)]
+    
+    def test_threads(self):
+        """
+        Tests that the encoding and decoding of the small and large frames in
+        all variants of the algorithm by several threads concurrently produce
+        the same results as in a single thread, including the decoding of the
+        slices of a single shared buffer.
+        
+        Test id TEST-T-1G0. Covers the requirements REQ-FUN-1G0.
+        
+        Version 1.0.0.0
+        """
+        lstTasks = []
+        for clsCoder in (COBS_Coder, COBS_Coder_Python):
+            for strMode in cobs.MODES:
+                for bsSample in self.lstDecoded:
+                    #large frames - only with the compiled core, if available
+                    if ((len(bsSample) <= 65536) or ((strMode == 'COBS')
+                                            and (clsCoder is COBS_Coder))):
+                        lstTasks.append((clsCoder, strMode, bsSample))
+        lstTasks *= 2
+        random.shuffle(lstTasks)
+        def Roundtrip(tupTask):
+            clsCoder, strMode, bsSample = tupTask
+            bsEncoded = clsCoder.encode(bsSample, Mode = strMode)
+            bsDecoded = clsCoder.decode(bsEncoded, Mode = strMode)
+            return bsEncoded, bsDecoded
+        with concurrent.futures.ThreadPoolExecutor(max_workers = 4) as objPool:
+            lstResults = list(objPool.map(Roundtrip, lstTasks))
+        for tupTask, tupResult in zip(lstTasks, lstResults):
+            clsCoder, strMode, bsSample = tupTask
+            self.assertEqual(tupResult[0],
+                                    COBS_Coder.encode(bsSample, Mode = strMode))
+            self.assertEqual(tupResult[1], bsSample)
+        #slices of a single shared buffer
+        bsFeed = COBS_Coder.encodeMany(self.lstDecoded, Join = True)
+        objView = memoryview(bytearray(bsFeed))
+        lstSlices = []
+        iStart = 0
+        for bsItem in COBS_Coder.encodeMany(self.lstDecoded):
+            lstSlices.append(objView[iStart : iStart + len(bsItem) + 1])
+            iStart += len(bsItem) + 1
+        with concurrent.futures.ThreadPoolExecutor(max_workers = 4) as objPool:
+            lstResults = list(objPool.map(COBS_Coder.decode, lstSlices * 4))
+        self.assertListEqual(lstResults, self.lstDecoded * 4)
+
 #+ test suites
 
 TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_COBS_Coder)
+TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(
+                                                        Test_COBS_StreamDecoder)
+TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(
+                                                        Test_COBS_StreamEncoder)
+TestSuite4 = unittest.TestLoader().loadTestsFromTestCase(Test_COBS_Coder_Into)
+TestSuite5 = unittest.TestLoader().loadTestsFromTestCase(Test_COBS_Coder_Many)
+TestSuite6 = unittest.TestLoader().loadTestsFromTestCase(Test_COBS_Coder_Python)
+TestSuite7 = unittest.TestLoader().loadTestsFromTestCase(
+                                                    Test_COBS_Coder_Many_Python)
+TestSuite8 = unittest.TestLoader().loadTestsFromTestCase(Test_COBS_Extension)
+TestSuite9 = unittest.TestLoader().loadTestsFromTestCase(
+                                                        Test_COBS_Coder_Backend)
+TestSuite10 = unittest.TestLoader().loadTestsFromTestCase(Test_COBS_Coder_Mode)
+TestSuite11 = unittest.TestLoader().loadTestsFromTestCase(
+                                                        Test_COBS_FrameReader)
+TestSuite12 = unittest.TestLoader().loadTestsFromTestCase(
+                                                        Test_COBS_FrameWriter)
+TestSuite13 = unittest.TestLoader().loadTestsFromTestCase(
+                                                    Test_COBS_Coder_Capture)
+TestSuite14 = unittest.TestLoader().loadTestsFromTestCase(Test_COBS_Coder_File)
+TestSuite15 = unittest.TestLoader().loadTestsFromTestCase(
+                                                    Test_COBS_Coder_Validate)
+TestSuite16 = unittest.TestLoader().loadTestsFromTestCase(
+                                                    Test_COBS_Coder_Frames)
+TestSuite17 = unittest.TestLoader().loadTestsFromTestCase(
+                                                    Test_COBS_Coder_Threads)
 
 TestSuite = unittest.TestSuite()
-TestSuite.addTests([TestSuite1,])
+TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3, TestSuite4,
+                TestSuite5, TestSuite6, TestSuite7, TestSuite8, TestSuite9,
+                TestSuite10, TestSuite11, TestSuite12, TestSuite13,
+                TestSuite14, TestSuite15, TestSuite16, TestSuite17])
 
 if __name__ == "__main__":
     sys.stdout.write("Testing codecs_lib.cobs.COBS_Coder class...\n")
@@ -5,10 +5,11 @@ Unit tests for the module codecs_lib.vigenere
 Covered classes:
     CircularList
     VigenereCodec
+    VigenereTextReader
 """
 
-__version__ = "1.0.1.0"
-__date__ = "27-07-2021"
+__version__ = "1.2.0.0"
+__date__ = "18-10-2026"
 __status__ = "Testing"
 
 #imports
@@ -19,6 +20,10 @@ import os
 import sys
 import unittest
 import random
+import array
+import mmap
+import tempfile
+import io
 
 #+ modules to be tested
 
@@ -32,6 +37,7 @@ if not (ROOT_FOLDER in sys.path):
     sys.path.append(ROOT_FOLDER)
 
 from codecs_lib.vigenere import CircularList, VigenereCoder
+from codecs_lib.vigenere import VigenereTextReader
 
 #classes
 
@@ -182,18 +188,78 @@ class Test_CircularList(unittest.TestCase):
             gTest = objTest.getElement()
             self.assertEqual(gTest, seqItem[0])
         del objTest
+    
+    def test_shiftCounter(self):
+        """
+        Checks that the shiftCounter() method advances the internal index as
+        the same number of calls of the getElement() method, and that the
+        getCounter() method returns the current index.
+
+        Version 1.0.0.0
+        """
+        objTest = self.TestClass()
+        objCheck = self.TestClass()
+        for seqItem in self.TestCases:
+            objTest.setContent(seqItem)
+            objCheck.setContent(seqItem)
+            self.assertEqual(objTest.getCounter(), 0)
+            for iShift in [0, 1, 2, 5, 13, 100]:
+                objTest.shiftCounter(iShift)
+                for _ in range(iShift):
+                    objCheck.getElement()
+                self.assertEqual(objTest.getCounter(), objCheck.getCounter())
+                self.assertLess(objTest.getCounter(), len(seqItem))
+                self.assertEqual(objTest.getElement(), objCheck.getElement())
+        for gShift in [1.0, '1', True, None, [1]]:
+            with self.assertRaises(TypeError):
+                objTest.shiftCounter(gShift)
+        with self.assertRaises(ValueError):
+            objTest.shiftCounter(-1)
+        with self.assertRaises(Exception):
+            self.TestClass().shiftCounter(1)
+        del objTest
+        del objCheck
+    
+    def test_setCounter(self):
+        """
+        Checks that the setCounter() method sets the internal index directly
+        modulo the length of the stored sequence.
+
+        Version 1.0.0.0
+        """
+        objTest = self.TestClass()
+        for seqItem in self.TestCases:
+            iLength = len(seqItem)
+            objTest.setContent(seqItem)
+            for iIndex in [0, 1, 2, 5, 13, 100, 10**12 + 7]:
+                objTest.setCounter(iIndex)
+                self.assertEqual(objTest.getCounter(), iIndex % iLength)
+                self.assertEqual(objTest.getElement(),
+                                                    seqItem[iIndex % iLength])
+        for gIndex in [1.0, '1', True, None, [1]]:
+            with self.assertRaises(TypeError):
+                objTest.setCounter(gIndex)
+        with self.assertRaises(ValueError):
+            objTest.setCounter(-1)
+        with self.assertRaises(Exception):
+            self.TestClass().setCounter(1)
+        del objTest
 
 class Test_VigenereCoder(unittest.TestCase):
     """
     Test cases for the the codecs_lib.vigener.VigenereCoder class.
 
     Test ids TEST-T-200, TEST-T-201, TEST-T-202, TEST-T-203, TEST-T-204,
-    TEST-T-210, TEST-T-220 and TEST-T-230.
+    TEST-T-205, TEST-T-210, TEST-T-220, TEST-T-230, TEST-T-240, TEST-T-241,
+    TEST-T-242, TEST-T-243, TEST-T-250, TEST-T-251, TEST-T-260 and
+    TEST-T-261.
     Covers the requirements REQ-FUN-202, REQ-FUN-203, REQ-FUN-210,
     REQ-FUN-220, REQ-FUN-230, REQ-AWM-200, REQ-AWM-201, REQ-AWM-202,
-    REQ-AWM-203, REQ-AWM-210, REQ-AWM-220 and REQ-AWM-230.
+    REQ-AWM-203, REQ-AWM-210, REQ-AWM-220, REQ-AWM-230, REQ-FUN-240,
+    REQ-FUN-241, REQ-AWM-240, REQ-AWM-241, REQ-FUN-250, REQ-AWM-250,
+    REQ-FUN-260 and REQ-AWM-260.
     
-    Version 1.1.0.0
+    Version 1.4.0.0
     """
     
     @classmethod
@@ -366,6 +432,49 @@ class Test_VigenereCoder(unittest.TestCase):
             objTest.decode(bytes(InData, 'utf_8'))
         del objTest
     
+    def test_BulkData(self):
+        """
+        Tests that the encoding and decoding of the large data chunks of
+        arbitrary lengths give the same result as the per-byte application of
+        the pass-phrase in a continuous feed, for the pass-phrases of different
+        lengths, including the pass-phrases much longer than the chunks.
+
+        Test id: TEST-T-205.
+        Covers requirements: REQ-FUN-202 and REQ-FUN-203
+
+        Version 1.1.0.0
+        """
+        for PassLength in [1, 2, 7, 16, 32, 33, 300, 100000]:
+            Password = bytearray(random.randint(0, 255)
+                                                for _ in range(PassLength))
+            objTest = self.TestClass(Password)
+            objC_List = CircularList(Password)
+            InData = ''.join(chr(random.randint(0, 127))
+                                                    for _ in range(5000))
+            Encoded = bytearray()
+            Start = 0
+            for Length in [0, 1, 3, 250, 1, 4000, 745]:
+                Chunk = InData[Start : Start + Length]
+                Start += Length
+                OutData = objTest.encode(Chunk)
+                self.assertIsInstance(OutData, bytes)
+                self.assertEqual(OutData, bytes(
+                                    (ord(Char) + objC_List.getElement()) % 256
+                                                        for Char in Chunk))
+                Encoded.extend(OutData)
+            self.assertEqual(len(Encoded), len(InData))
+            objTest.resetIndex()
+            Start = 0
+            for Length, Type in [(2999, bytes), (1, bytearray),
+                                                        (2000, bytearray)]:
+                Chunk = Type(Encoded[Start : Start + Length])
+                NewData = objTest.decode(Chunk)
+                self.assertIsInstance(NewData, str)
+                self.assertEqual(NewData, InData[Start : Start + Length])
+                Start += Length
+            del objTest
+            del objC_List
+    
     def test_Encode_TypeError(self):
         """
         Tests that TypeError sub-class is raised if the data argument passed
@@ -415,14 +524,476 @@ class Test_VigenereCoder(unittest.TestCase):
                 objTest.setPassword(Password)
         del objTest
 
+    def test_Bytes(self):
+        """
+        Tests the encoding and decoding of the binary data of different buffer
+        types without the Unicode conversion, and that the internal index is
+        shared with the string oriented methods.
+
+        Test id: TEST-T-240.
+        Covers requirements: REQ-FUN-240
+
+        Version 1.0.0.0
+        """
+        Password = bytearray(random.randint(0, 255) for _ in range(11))
+        objTest = self.TestClass(Password)
+        objC_List = CircularList(Password)
+        InData = bytes(random.randint(0, 255) for _ in range(1000))
+        Inputs = [InData, bytearray(InData), memoryview(InData),
+                    array.array('B', InData), array.array('H', InData)]
+        for Input in Inputs:
+            objTest.resetIndex()
+            objC_List.resetCounter()
+            Raw = memoryview(Input).tobytes()
+            OutData = objTest.encodeBytes(Input)
+            self.assertIsInstance(OutData, bytes)
+            self.assertEqual(OutData, bytes(
+                                    (Item + objC_List.getElement()) % 256
+                                                        for Item in Raw))
+            objTest.resetIndex()
+            NewData = objTest.decodeBytes(memoryview(OutData))
+            self.assertIsInstance(NewData, bytes)
+            self.assertEqual(NewData, Raw)
+        #mixing with the string methods
+        objTest.resetIndex()
+        Text = 'anton\u2600антон'
+        OutData = objTest.encode(Text) + objTest.encodeBytes(InData)
+        objTest.resetIndex()
+        NewData = objTest.decodeBytes(OutData)
+        self.assertEqual(NewData, Text.encode('utf_8') + InData)
+        objTest.resetIndex()
+        Length = len(Text.encode('utf_8'))
+        self.assertEqual(objTest.decode(OutData[:Length]), Text)
+        self.assertEqual(objTest.decodeBytes(OutData[Length:]), InData)
+        self.assertEqual(objTest.encodeBytes(b''), b'')
+        del objTest
+        del objC_List
+    
+    def test_BytesInto(self):
+        """
+        Tests the encoding and decoding of the binary data into the preallocated
+        writable buffers, including the in-place processing.
+
+        Test id: TEST-T-241.
+        Covers requirements: REQ-FUN-241
+
+        Version 1.0.0.0
+        """
+        objTest = self.TestClass('pass-phrase')
+        InData = bytes(random.randint(0, 255) for _ in range(1000))
+        Encoded = objTest.encodeBytes(InData)
+        for Extra in [0, 1, 100]:
+            for Type in [bytearray, lambda Size: memoryview(bytearray(Size)),
+                            lambda Size: array.array('B', bytes(Size))]:
+                Output = Type(len(InData) + Extra)
+                objTest.resetIndex()
+                Written = objTest.encodeBytesInto(InData, Output)
+                self.assertEqual(Written, len(InData))
+                Result = memoryview(Output).tobytes()
+                self.assertEqual(Result[:Written], Encoded)
+                self.assertEqual(Result[Written:], bytes(Extra))
+                objTest.resetIndex()
+                Written = objTest.decodeBytesInto(Output[:Written], Output)
+                self.assertEqual(Written, len(InData))
+                self.assertEqual(memoryview(Output).tobytes()[:Written],
+                                                                        InData)
+        #in-place, continuous feed in chunks
+        Buffer = bytearray(InData)
+        objTest.resetIndex()
+        View = memoryview(Buffer)
+        for Start, End in [(0, 1), (1, 500), (500, 1000)]:
+            self.assertEqual(objTest.encodeBytesInto(View[Start:End],
+                                            View[Start:End]), End - Start)
+        self.assertEqual(bytes(Buffer), Encoded)
+        objTest.resetIndex()
+        self.assertEqual(objTest.decodeBytesInto(Buffer, Buffer), len(Buffer))
+        self.assertEqual(bytes(Buffer), InData)
+        del objTest
+    
+    def test_Bytes_TypeError(self):
+        """
+        Tests that TypeError sub-class is raised if the data passed into the
+        binary encoding or decoding methods is not a C-contiguous buffer, or
+        if the output is not a writable buffer; and that an exception is raised
+        if the pass-phrase is not set.
+
+        Test id: TEST-T-242.
+        Covers requirement: REQ-AWM-240.
+
+        Version 1.0.0.0
+        """
+        objTest = self.TestClass(b'\x01')
+        BadData = [1, 2.0, True, 'a', ['a'], (1, ), None, int, bytes,
+                                                    memoryview(b'abc')[::2]]
+        for Data in BadData:
+            for Method in [objTest.encodeBytes, objTest.decodeBytes]:
+                with self.assertRaises(TypeError):
+                    Method(Data)
+            for Method in [objTest.encodeBytesInto, objTest.decodeBytesInto]:
+                with self.assertRaises(TypeError):
+                    Method(Data, bytearray(10))
+        BadOutput = [b'abc', memoryview(b'abc'), 'abc', None, [0, 0, 0],
+                                            memoryview(bytearray(6))[::2]]
+        for Output in BadOutput:
+            for Method in [objTest.encodeBytesInto, objTest.decodeBytesInto]:
+                with self.assertRaises(TypeError):
+                    Method(b'abc', Output)
+        objTest = self.TestClass()
+        for Method in [objTest.encodeBytes, objTest.decodeBytes]:
+            with self.assertRaises(Exception):
+                Method(b'abc')
+        for Method in [objTest.encodeBytesInto, objTest.decodeBytesInto]:
+            with self.assertRaises(Exception):
+                Method(b'abc', bytearray(3))
+        del objTest
+    
+    def test_BytesInto_ValueError(self):
+        """
+        Tests that ValueError sub-class is raised if the output buffer is too
+        small, and that neither the output nor the internal index is modified.
+
+        Test id: TEST-T-243.
+        Covers requirement: REQ-AWM-241.
+
+        Version 1.0.0.0
+        """
+        objTest = self.TestClass(b'\x01\x02\x03')
+        Reference = self.TestClass(b'\x01\x02\x03')
+        objTest.encodeBytes(b'ab')
+        Reference.encodeBytes(b'ab')
+        for Method in [objTest.encodeBytesInto, objTest.decodeBytesInto]:
+            Output = bytearray(b'xyz')
+            with self.assertRaises(ValueError):
+                Method(b'abcd', Output)
+            self.assertEqual(Output, b'xyz')
+        self.assertEqual(objTest.encodeBytes(b'abcdef'),
+                                            Reference.encodeBytes(b'abcdef'))
+        del objTest
+        del Reference
+
+    def test_SeekTell(self):
+        """
+        Tests the random access decoding using the seek() method, and that the
+        tell() method returns the position within the continuous data feed.
+
+        Test id: TEST-T-250.
+        Covers requirements: REQ-FUN-250
+
+        Version 1.0.0.0
+        """
+        for PassLength in [1, 3, 16]:
+            Password = bytearray(random.randint(0, 255)
+                                                for _ in range(PassLength))
+            objTest = self.TestClass(Password)
+            self.assertEqual(objTest.tell(), 0)
+            InData = bytes(random.randint(0, 255) for _ in range(1000))
+            Encoded = objTest.encodeBytes(InData[:400])
+            self.assertEqual(objTest.tell(), 400)
+            Encoded += objTest.encode(InData[400:].decode('latin_1'),
+                                                        Codec = 'latin_1')
+            self.assertEqual(objTest.tell(), 1000)
+            for Start, End in [(0, 1000), (999, 1000), (17, 18), (123, 456),
+                                                        (400, 1000), (0, 0)]:
+                objTest.seek(Start)
+                self.assertEqual(objTest.tell(), Start)
+                self.assertEqual(objTest.decodeBytes(Encoded[Start:End]),
+                                                            InData[Start:End])
+                self.assertEqual(objTest.tell(), End)
+            #sequential decoding after seek
+            objTest.seek(100)
+            self.assertEqual(objTest.decodeBytes(Encoded[100:200])
+                                        + objTest.decodeBytes(Encoded[200:]),
+                                                                InData[100:])
+            #large offset - constant time
+            objTest.seek(10**15 + 5)
+            Chunk = objTest.encodeBytes(b'abc')
+            objTest.seek(10**15 + 5)
+            self.assertEqual(objTest.decodeBytes(Chunk), b'abc')
+            self.assertEqual(objTest.tell(), 10**15 + 8)
+            objTest.resetIndex()
+            self.assertEqual(objTest.tell(), 0)
+            objTest.encodeBytes(b'abc')
+            objTest.setPassword(Password)
+            self.assertEqual(objTest.tell(), 0)
+            del objTest
+    
+    def test_Seek_Errors(self):
+        """
+        Tests that the seek() method raises TypeError sub-class if the offset
+        is not an integer, ValueError sub-class if it is negative, and an
+        exception if the pass-phrase is not set.
+
+        Test id: TEST-T-251.
+        Covers requirement: REQ-AWM-250.
+
+        Version 1.0.0.0
+        """
+        objTest = self.TestClass(b'abc')
+        for Offset in [1.0, '1', True, None, [1], b'1']:
+            with self.assertRaises(TypeError):
+                objTest.seek(Offset)
+        with self.assertRaises(ValueError):
+            objTest.seek(-1)
+        self.assertEqual(objTest.tell(), 0)
+        objTest = self.TestClass()
+        self.assertEqual(objTest.tell(), 0)
+        with self.assertRaises(Exception):
+            objTest.seek(1)
+        del objTest
+
+    def test_DecodeRange(self):
+        """
+        Tests the random access decoding of the windows of a memory-mapped
+        ciphered file and of other buffers, and that the internal index and
+        position are not changed.
+
+        Test id: TEST-T-260.
+        Covers requirements: REQ-FUN-260
+
+        Version 1.0.0.0
+        """
+        Password = bytearray(random.randint(0, 255) for _ in range(13))
+        objTest = self.TestClass(Password)
+        InData = bytes(random.randint(0, 255) for _ in range(100000))
+        Encoded = objTest.encodeBytes(InData)
+        Windows = [(0, 0), (0, 1), (0, 100000), (99999, 1), (100000, 0),
+                    (12345, 678), (65536, 4096), (13, 13), (14, 26)]
+        objTest.resetIndex()
+        objTest.decodeBytes(Encoded[:7])
+        with tempfile.TemporaryFile() as File:
+            File.write(Encoded)
+            File.flush()
+            with mmap.mmap(File.fileno(), 0, access = mmap.ACCESS_READ) as Map:
+                for Data in [Map, Encoded, bytearray(Encoded),
+                                                        memoryview(Encoded)]:
+                    for Start, Length in Windows:
+                        Result = objTest.decodeRange(Data, Start, Length)
+                        self.assertIsInstance(Result, bytes)
+                        self.assertEqual(Result,
+                                                InData[Start : Start + Length])
+                        self.assertEqual(objTest.tell(), 7)
+        #the sequential decoding continues from the unchanged position
+        self.assertEqual(objTest.decodeBytes(Encoded[7:20]), InData[7:20])
+        del objTest
+    
+    def test_DecodeRange_Errors(self):
+        """
+        Tests that the decodeRange() method raises TypeError sub-class if the
+        data is not a buffer or the start or length is not an integer,
+        ValueError sub-class if the start or length is negative or the window
+        exceeds the data, and an exception if the pass-phrase is not set.
+
+        Test id: TEST-T-261.
+        Covers requirement: REQ-AWM-260.
+
+        Version 1.0.0.0
+        """
+        objTest = self.TestClass(b'abc')
+        Data = bytes(100)
+        for BadData in [1, 'a' * 100, [0] * 100, None]:
+            with self.assertRaises(TypeError):
+                objTest.decodeRange(BadData, 0, 10)
+        for Value in [1.0, '1', True, None, [1]]:
+            with self.assertRaises(TypeError):
+                objTest.decodeRange(Data, Value, 10)
+            with self.assertRaises(TypeError):
+                objTest.decodeRange(Data, 0, Value)
+        for Start, Length in [(-1, 10), (0, -1), (0, 101), (100, 1),
+                                                            (101, 0), (50, 51)]:
+            with self.assertRaises(ValueError):
+                objTest.decodeRange(Data, Start, Length)
+        objTest = self.TestClass()
+        with self.assertRaises(Exception):
+            objTest.decodeRange(Data, 0, 10)
+        del objTest
+
+class Test_VigenereTextReader(unittest.TestCase):
+    """
+    Test cases for the class codecs_lib.vigenere.VigenereTextReader.
+
+    Test ids: TEST-T-270 to TEST-T-272.
+    Covers requirements: REQ-FUN-270, REQ-AWM-270 and REQ-AWM-271.
+
+    Version 1.0.0.0
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+
+        Version: 1.0.0.0
+        """
+        cls.TestClass = VigenereTextReader
+        cls.Text = ''.join('anton\u2600антон {}\r\nline\n'.format(Index)
+                                                    for Index in range(200))
+    
+    def test_Read(self):
+        """
+        Tests that the ciphered text stream is decoded correctly by read(),
+        readline() and iteration for the chunk sizes splitting the multi-byte
+        characters, with the coder passed as an instance or a pass-phrase.
+
+        Test id: TEST-T-270.
+        Covers requirements: REQ-FUN-270
+
+        Version 1.0.0.0
+        """
+        Text = self.Text
+        Lines = [Line + '\n' for Line in Text.split('\n')[:-1]]
+        for Codec in [None, 'utf_8', 'utf_16', 'utf_32_le']:
+            Encoded = VigenereCoder(b'pass').encode(Text, Codec = Codec)
+            for ChunkSize in [1, 3, 7, 4096]:
+                objTest = self.TestClass(io.BytesIO(Encoded), b'pass',
+                                    Encoding = Codec, ChunkSize = ChunkSize)
+                self.assertTrue(objTest.readable())
+                self.assertEqual(objTest.encoding, Codec or 'utf_8')
+                self.assertEqual(objTest.errors, 'strict')
+                self.assertEqual(objTest.read(), Text)
+                self.assertEqual(objTest.read(), '')
+                objTest = self.TestClass(io.BytesIO(Encoded),
+                                            VigenereCoder('pass'),
+                                    Encoding = Codec, ChunkSize = ChunkSize)
+                self.assertEqual(list(objTest), Lines)
+                objTest = self.TestClass(io.BytesIO(Encoded), 'pass',
+                                    Encoding = Codec, ChunkSize = ChunkSize)
+                Parts = []
+                while True:
+                    Part = objTest.read(11)
+                    if not Part:
+                        break
+                    self.assertLessEqual(len(Part), 11)
+                    Parts.append(Part)
+                self.assertEqual(''.join(Parts), Text)
+                objTest = self.TestClass(io.BytesIO(Encoded), 'pass',
+                                    Encoding = Codec, ChunkSize = ChunkSize)
+                self.assertEqual(objTest.readline(5), Lines[0][:5])
+                self.assertEqual(objTest.readline(None), Lines[0][5:])
+                self.assertEqual(objTest.readline(), Lines[1])
+                self.assertEqual(objTest.read(None), ''.join(Lines[2:]))
+                self.assertEqual(objTest.readline(), '')
+        #continuation of the stream from the current position of the coder
+        objCoder = VigenereCoder(b'pass')
+        Encoded = objCoder.encode('abc') + objCoder.encode(Text)
+        objCoder.resetIndex()
+        Stream = io.BytesIO(Encoded)
+        self.assertEqual(objCoder.decode(Stream.read(3)), 'abc')
+        with self.TestClass(Stream, objCoder, ChunkSize = 5) as objTest:
+            self.assertEqual(objTest.read(), Text)
+            self.assertEqual(objCoder.tell(), len(Encoded))
+        self.assertTrue(objTest.closed)
+        self.assertTrue(Stream.closed)
+        with self.assertRaises(ValueError):
+            objTest.read()
+    
+    def test_Read_ValueError(self):
+        """
+        Tests that ValueError sub-class is raised if the deciphered data is not
+        valid for the Unicode codec, the position of the coder is restored and
+        the reading can be repeated; and that the errors handling scheme is
+        applied. Also checks that the decode() method of the coder restores
+        the position on error.
+
+        Test id: TEST-T-271.
+        Covers requirements: REQ-AWM-270
+
+        Version 1.0.0.0
+        """
+        Encoded = VigenereCoder('key').encodeBytes(b'abc\xffdef\xe2\x98')
+        objCoder = VigenereCoder('key')
+        objTest = self.TestClass(io.BytesIO(Encoded), objCoder, ChunkSize = 3)
+        self.assertEqual(objTest.read(3), 'abc')
+        for _ in range(2):
+            with self.assertRaises(ValueError) as Context:
+                objTest.read()
+            self.assertIn('offset 3', str(Context.exception))
+            self.assertEqual(objCoder.tell(), 3)
+        objTest = self.TestClass(io.BytesIO(Encoded), 'key',
+                                                        Errors = 'replace')
+        self.assertEqual(objTest.read(), 'abc\ufffddef\ufffd')
+        Truncated = VigenereCoder('key').encodeBytes(b'abcdef\xe2\x98')
+        objTest = self.TestClass(io.BytesIO(Truncated), 'key', ChunkSize = 2)
+        self.assertEqual(objTest.read(6), 'abcdef')
+        with self.assertRaises(ValueError) as Context:
+            objTest.read()
+        self.assertIn('offset 6', str(Context.exception))
+        #the text decoded before the error is not lost
+        Broken = VigenereCoder('key').encodeBytes(
+                                        b'abcdefghijklmnop\xffqr\nst\n')
+        objCoder = VigenereCoder('key')
+        objTest = self.TestClass(io.BytesIO(Broken), objCoder, ChunkSize = 4)
+        self.assertEqual(objTest.read(2), 'ab')
+        with self.assertRaises(ValueError):
+            objTest.read()
+        self.assertEqual(objCoder.tell(), 16)
+        with self.assertRaises(ValueError):
+            objTest.readline()
+        self.assertEqual(objCoder.tell(), 16)
+        self.assertEqual(objTest.read(14), 'cdefghijklmnop')
+        with self.assertRaises(ValueError):
+            objTest.read()
+        objCoder = VigenereCoder('key')
+        objCoder.decodeBytes(Encoded[:3])
+        with self.assertRaises(ValueError):
+            objCoder.decode(Encoded[3:5])
+        self.assertEqual(objCoder.tell(), 3)
+        self.assertEqual(objCoder.decodeBytes(Encoded[3:]),
+                                                    b'\xffdef\xe2\x98')
+    
+    def test_TypeError(self):
+        """
+        Tests that TypeError or ValueError sub-class is raised if the arguments
+        of the initializer or of the reading methods are of the wrong type or
+        value, and an exception if the pass-phrase of the coder is not set.
+
+        Test id: TEST-T-272.
+        Covers requirements: REQ-AWM-271
+
+        Version 1.0.0.0
+        """
+        Stream = io.BytesIO(b'abc')
+        for BadStream in [1, b'abc', 'abc', None]:
+            with self.assertRaises(TypeError):
+                self.TestClass(BadStream, 'key')
+        for BadCoder in [1, None, [1, 2], CircularList([1, 2])]:
+            with self.assertRaises(TypeError):
+                self.TestClass(Stream, BadCoder)
+        for Value in [1, b'utf_8']:
+            with self.assertRaises(TypeError):
+                self.TestClass(Stream, 'key', Encoding = Value)
+        for Value in [1, None, b'strict']:
+            with self.assertRaises(TypeError):
+                self.TestClass(Stream, 'key', Errors = Value)
+        for Value in [1.0, '1', True, None]:
+            with self.assertRaises(TypeError):
+                self.TestClass(Stream, 'key', ChunkSize = Value)
+        with self.assertRaises(ValueError):
+            self.TestClass(Stream, 'key', Encoding = 'whatever')
+        with self.assertRaises(ValueError):
+            self.TestClass(Stream, 'key', Errors = 'whatever')
+        for Value in [0, -1]:
+            with self.assertRaises(ValueError):
+                self.TestClass(Stream, 'key', ChunkSize = Value)
+        with self.assertRaises(Exception):
+            self.TestClass(Stream, VigenereCoder())
+        objTest = self.TestClass(Stream, 'key')
+        for Value in [1.0, '1', True]:
+            with self.assertRaises(TypeError):
+                objTest.read(Value)
+            with self.assertRaises(TypeError):
+                objTest.readline(Value)
+
 #+ test suites
 
 TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_CircularList)
 
 TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(Test_VigenereCoder)
 
+TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(
+                                                    Test_VigenereTextReader)
+
 TestSuite = unittest.TestSuite()
-TestSuite.addTests([TestSuite1, TestSuite2])
+TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3])
 
 if __name__ == "__main__":
     sys.stdout.write("Testing codecs_lib.vigenere module...\n")
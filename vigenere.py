@@ -12,10 +12,11 @@ References:
 Classes:
     CircularList
     VigenereCoder
+    VigenereTextReader
 """
 
-__version__ = "1.0.0.1"
-__date__ = "19-04-2023"
+__version__ = "1.2.0.0"
+__date__ = "18-10-2026"
 __status__ = "Production"
 
 #imports
@@ -24,12 +25,14 @@ __status__ = "Production"
 
 import os
 import sys
+import io
+import codecs
 
 from typing import Any, Union, Sequence, Optional
 import collections.abc as c_abc
 import copy
 
-#+ other DO libraries
+#+ other DO libraries (optional) - exceptions with the traceback analysis
 
 LIB_FOLDER = os.path.dirname(os.path.realpath(__file__))
 ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
@@ -37,8 +40,8 @@ ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
 if not (ROOT_FOLDER in sys.path):
     sys.path.append(ROOT_FOLDER)
 
-from introspection_lib.base_exceptions import UT_TypeError, UT_ValueError
-from introspection_lib.base_exceptions import UT_Exception
+from codecs_lib._exceptions import UT_TypeError, UT_ValueError
+from codecs_lib._exceptions import UT_Exception
 
 #+ types
 
@@ -46,6 +49,31 @@ T_BYTES = Union[bytes, bytearray]
 
 T_PASSWORD = Union[bytes, bytearray, str]
 
+T_BUFFER = Any #any object supporting the buffer protocol
+
+#globals
+
+#+ translation tables for bytes.translate(), the element I of the table K is
+#+ (I + K) mod 256, i.e. the table K shifts all bytes by K (mod 256)
+
+SHIFT_TABLES = tuple(bytes(range(Shift, 256)) + bytes(range(Shift))
+                                                    for Shift in range(256))
+
+#+ the shorter pass-phrases are applied per stride with the tables above, the
+#+ longer ones - as a keystream added to the data as a single integer
+
+STRIDE_MAX_PERIOD = 32
+
+#+ length of the data block added to the keystream at once, and the masks of
+#+ the 7 low bits and the high bit of each byte of such block, which allow the
+#+ addition of all bytes mod 256 without the carry into the next byte
+
+KEYSTREAM_BLOCK = 65536
+
+LOW_BITS_MASK = int.from_bytes(b'\x7f' * KEYSTREAM_BLOCK, 'little')
+
+HIGH_BIT_MASK = int.from_bytes(b'\x80' * KEYSTREAM_BLOCK, 'little')
+
 #classes
 
 class CircularList:
@@ -61,10 +89,16 @@ class CircularList:
             seq(type A) -> None
         resetCounter():
             None -> None
+        getCounter():
+            None -> int >= 0
+        setCounter(Index):
+            int >= 0 -> None
+        shiftCounter(Shift):
+            int >= 0 -> None
         getElement():
             None -> type A
     
-    Version 1.0.0.1
+    Version 1.1.0.0
     """
 
     #special methods
@@ -137,6 +171,73 @@ class CircularList:
         """
         self._Counter = 0
 
+    def getCounter(self) -> int:
+        """
+        Returns the current value of the internal counter, i.e. the index of
+        the element to be returned by the next call of the method getElement().
+
+        Signature:
+            None -> int >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._Counter
+
+    def setCounter(self, Index: int) -> None:
+        """
+        Sets the internal counter directly to the specified index taken modulo
+        the length of the stored content, i.e. as if the method getElement()
+        has been called Index times after the reset of the counter, but in a
+        constant time.
+
+        Signature:
+            int >= 0 -> None
+        
+        Args:
+            Index: int >= 0; the new value of the counter (before wrapping)
+        
+        Raises:
+            UT_TypeError: the argument is not an integer
+            UT_ValueError: the argument is a negative integer
+            UT_Exception: the stored content is not yet set
+        
+        Version 1.0.0.0
+        """
+        if (not isinstance(Index, int)) or isinstance(Index, bool):
+            raise UT_TypeError(Index, int, SkipFrames = 1)
+        if Index < 0:
+            raise UT_ValueError(Index, 'non-negative integer', SkipFrames = 1)
+        if self._Data is None:
+            raise UT_Exception('content is not yet set', SkipFrames = 1)
+        self._Counter = Index % len(self._Data)
+
+    def shiftCounter(self, Shift: int) -> None:
+        """
+        Advances the internal counter by the specified number of the elements
+        with the wrapping, i.e. as the same number of calls of the method
+        getElement() would do, but in a constant time.
+
+        Signature:
+            int >= 0 -> None
+        
+        Args:
+            Shift: int >= 0; number of the elements to skip
+        
+        Raises:
+            UT_TypeError: the argument is not an integer
+            UT_ValueError: the argument is a negative integer
+            UT_Exception: the stored content is not yet set
+        
+        Version 1.0.0.0
+        """
+        if (not isinstance(Shift, int)) or isinstance(Shift, bool):
+            raise UT_TypeError(Shift, int, SkipFrames = 1)
+        if Shift < 0:
+            raise UT_ValueError(Shift, 'non-negative integer', SkipFrames = 1)
+        if self._Data is None:
+            raise UT_Exception('content is not yet set', SkipFrames = 1)
+        self._Counter = (self._Counter + Shift) % len(self._Data)
+
     def getElement(self) -> Any:
         """
         Returns the current element of the stored content and increments the
@@ -173,17 +274,58 @@ class VigenereCoder:
     the internal index. With this approach the codec is appropriate for the
     continuous data feed, e.g. for an input stream.
 
+    The data is not processed byte by byte. With a short pass-phrase all
+    bytes, which are aligned with the same character of the pass-phrase, i.e.
+    each N-th byte with N being the pass-phrase length, are shifted at once by
+    bytes.translate() with a pre-computed table. With a long pass-phrase it is
+    tiled into a keystream, which is added to the data block-wise as a single
+    integer. The internal index is advanced by the data length in a constant
+    time.
+
+    The methods encode() and decode() convert between the Unicode strings and
+    the ciphered bytes. The methods encodeBytes(), decodeBytes() and their
+    variants encodeBytesInto(), decodeBytesInto() process any binary data
+    (buffer) directly, without the Unicode conversion, sharing the same
+    internal index with the former methods.
+
+    The position within the continuous data feed, i.e. the number of bytes
+    processed since the pass-phrase is set or the index is reset, is returned
+    by the method tell(). The method seek() jumps to an arbitrary position in
+    a constant time, thus any part of a large ciphered file or stream can be
+    decoded without processing the preceding data. The method decodeRange()
+    decodes a window of a ciphered buffer (e.g. memory-mapped file) directly,
+    without changing the current position.
+
+    The method decode() expects complete encoded characters; if it fails, the
+    internal index and position are restored. Use the class VigenereTextReader
+    to decode a ciphered text stream chunk by chunk, when a chunk boundary may
+    split a multi-byte character.
+
     Methods:
         setPassword(Password):
             str OR bytes OR bytearray -> None
         resetIndex():
             None -> None
+        tell():
+            None -> int >= 0
+        seek(Offset):
+            int >= 0 -> None
         encode(Data, *, Codec):
             str/, *, str OR None/ -> bytes
         decode(Data, *, Codec):
             bytes OR bytearray/, *, str OR None/ -> str
+        encodeBytes(Data):
+            buffer -> bytes
+        decodeBytes(Data):
+            buffer -> bytes
+        encodeBytesInto(Data, Output):
+            buffer, writable buffer -> int >= 0
+        decodeBytesInto(Data, Output):
+            buffer, writable buffer -> int >= 0
+        decodeRange(Data, Start, Length):
+            buffer, int >= 0, int >= 0 -> bytes
     
-    Version 1.0.0.1
+    Version 1.4.2.0
     """
     
     #special methods
@@ -209,6 +351,9 @@ class VigenereCoder:
         Version 1.0.0.1
         """
         self._Codec = None
+        self._Position = 0
+        self._EncodeKeys = None
+        self._DecodeKeys = None
         if not (Password is None):
             self._checkPassword(Password)
             self.setPassword(Password)
@@ -235,6 +380,191 @@ class VigenereCoder:
         if not isinstance(Password, (str, bytes, bytearray)):
             raise UT_TypeError(Password, (str, bytes, bytearray), SkipFrames= 2)
 
+    def _getBuffer(self, Data: Any, *, Writable: bool = False) -> T_BUFFER:
+        """
+        Helper method to check that the passed object supports the buffer
+        protocol (and is writable, if required) and is C-contiguous. The
+        byte-strings and bytes arrays (only bytes arrays, if writable) are
+        returned as they are, any other buffer - as an unsigned bytes view of
+        its content, thus the data is never copied.
+
+        Signature:
+            type A/, *, bool/ -> bytes OR bytearray OR memoryview
+        
+        Args:
+            Data: type A; the object to be checked
+            Writable: (keyword) bool; flag if the buffer must be writable,
+                defaults to False
+        
+        Returns:
+            bytes OR bytearray: the object itself
+            memoryview: 1D view of the content of any other buffer as unsigned
+                bytes
+        
+        Raises:
+            UT_TypeError: the object does not support the buffer protocol, is
+                not C-contiguous or is not writable when required
+        
+        Version 1.0.0.0
+        """
+        if isinstance(Data, bytearray) or (isinstance(Data, bytes)
+                                                        and not Writable):
+            return Data
+        try:
+            View = memoryview(Data)
+        except TypeError:
+            raise UT_TypeError(Data, (bytes, bytearray, memoryview),
+                                                    SkipFrames = 2) from None
+        if (not View.c_contiguous) or (Writable and View.readonly):
+            raise UT_TypeError(Data, (bytearray, memoryview), SkipFrames = 2)
+        if View.format != 'B' or View.ndim != 1:
+            View = View.cast('B')
+        return View
+
+    def _addKeystream(self, Data: T_BUFFER, Keys: bytes, Start: int,
+                                                Target: T_BUFFER) -> None:
+        """
+        Helper method to add the pass-phrase shifts to the data using the
+        keystream, i.e. the pass-phrase repeated from the given index to the
+        length of the data. Each block of the data and of the keystream is
+        converted into a single integer, and all bytes are added modulo 256
+        at once: the 7 low bits of the bytes are added without the carry into
+        the next byte, and the high bits are added modulo 2 by XOR. The cost
+        does not depend on the pass-phrase length.
+
+        Signature:
+            bytes OR bytearray OR memoryview, bytes, int >= 0,
+                bytearray OR memoryview -> None
+        
+        Args:
+            Data: bytes OR bytearray OR memoryview; data to be processed
+            Keys: bytes; the shifts, one per pass-phrase character
+            Start: int >= 0; the index within the pass-phrase to start from
+            Target: bytearray OR memoryview; writable destination not shorter
+                than the data, may be the data buffer itself
+        
+        Version 1.0.0.0
+        """
+        Length = len(Data)
+        Period = len(Keys)
+        for Begin in range(0, Length, KEYSTREAM_BLOCK):
+            Size = min(KEYSTREAM_BLOCK, Length - Begin)
+            Index = (Start + Begin) % Period
+            Stream = Keys[Index : Index + Size]
+            if len(Stream) < Size:
+                Rest = Size - len(Stream)
+                Stream += Keys * (Rest // Period) + Keys[:Rest % Period]
+            if Size == KEYSTREAM_BLOCK:
+                LowMask = LOW_BITS_MASK
+                HighMask = HIGH_BIT_MASK
+            else:
+                LowMask = int.from_bytes(b'\x7f' * Size, 'little')
+                HighMask = int.from_bytes(b'\x80' * Size, 'little')
+            Value = int.from_bytes(Data[Begin : Begin + Size], 'little')
+            Key = int.from_bytes(Stream, 'little')
+            Value = ((Value & LowMask) + (Key & LowMask)) ^ (
+                                                    (Value ^ Key) & HighMask)
+            Target[Begin : Begin + Size] = Value.to_bytes(Size, 'little')
+
+    def _shiftBytes(self, Data: T_BUFFER, Keys: bytes,
+                        Target: Optional[T_BUFFER] = None, *,
+                        Index: Optional[int] = None) -> T_BUFFER:
+        """
+        Helper method to apply the per-byte shifts defined by the pass-phrase
+        to the data starting from the current value of the internal index, and
+        to advance the index by the length of the data. Alternatively, the
+        starting index can be passed explicitly, in which case the internal
+        index and position are not changed. With a short pass-phrase the bytes
+        aligned with the same character of the pass-phrase are processed at
+        once using the extended slicing and bytes.translate(); otherwise the
+        keystream is added to the data, see _addKeystream(). The target may be
+        the data buffer itself (in-place processing), but not a partially
+        overlapping buffer.
+
+        Signature:
+            bytes OR bytearray OR memoryview, bytes
+                /, bytearray OR memoryview OR None, *, int >= 0 OR None/
+                    -> bytearray OR memoryview
+        
+        Args:
+            Data: bytes OR bytearray OR memoryview; data to be processed
+            Keys: bytes; the shifts, one per pass-phrase character
+            Target: (optional) bytearray OR memoryview OR None; writable
+                destination not shorter than the data, the result is placed at
+                its start, None (default) means a new bytes array
+            Index: (keyword) int >= 0 OR None; the index within the pass-phrase
+                to start from, None (default) means the internal index, which
+                is advanced afterwards
+        
+        Returns:
+            bytearray OR memoryview: the target with the processed data
+        
+        Version 1.4.0.0
+        """
+        Length = len(Data)
+        Period = len(Keys)
+        if Index is None:
+            Start = self._Codec.getCounter()
+        else:
+            Start = Index % Period
+        if Target is None:
+            Target = bytearray(Length)
+        if Period <= STRIDE_MAX_PERIOD and Length >= 8 * Period:
+            IsView = isinstance(Data, memoryview)
+            for Offset in range(Period):
+                Chunk = Data[Offset::Period]
+                if IsView:
+                    Chunk = Chunk.tobytes()
+                Target[Offset:Length:Period] = Chunk.translate(
+                                SHIFT_TABLES[Keys[(Start + Offset) % Period]])
+        else:
+            self._addKeystream(Data, Keys, Start, Target)
+        if Index is None:
+            self._Codec.shiftCounter(Length)
+            self._Position += Length
+        return Target
+
+    def _processBytes(self, Data: Any, Keys: bytes,
+                                            Output: Optional[Any]) -> T_BUFFER:
+        """
+        Helper method implementing the common part of the binary encoding and
+        decoding methods: the checks of the state and arguments and the
+        processing itself.
+
+        Signature:
+            type A, bytes, type B -> bytearray OR memoryview
+        
+        Args:
+            Data: type A; data to be processed, must be a buffer
+            Keys: bytes; the shifts, one per pass-phrase character
+            Output: type B; writable destination buffer not shorter than the
+                data, or None for a new bytes array
+        
+        Returns:
+            bytearray OR memoryview: the output with the processed data
+        
+        Raises:
+            UT_TypeError: the data is not a C-contiguous buffer, OR the output
+                is neither None nor a writable C-contiguous buffer
+            UT_ValueError: the output buffer is shorter than the data, in which
+                case neither the output nor the internal index is modified
+            UT_Exception: the pass-phrase is not set yet
+        
+        Version 1.1.0.0
+        """
+        if self._Codec is None:
+            raise UT_Exception('Pass-phrase is not set yet', SkipFrames = 2)
+        Buffer = self._getBuffer(Data)
+        if Output is None:
+            Target = None
+        else:
+            Target = self._getBuffer(Output, Writable = True)
+            if len(Target) < len(Buffer):
+                raise UT_ValueError(len(Target),
+                            'at least {} bytes output'.format(len(Buffer)),
+                                                                SkipFrames = 2)
+        return self._shiftBytes(Buffer, Keys, Target)
+
     #public API
 
     def setPassword(self, Password: T_PASSWORD) -> None:
@@ -252,7 +582,7 @@ class VigenereCoder:
             UT_TypeError: the passed argument is neither string, nor bytes
                 array, nor bytestring
         
-        Version 1.0.0.1
+        Version 1.3.0.0
         """
         self._checkPassword(Password)
         if isinstance(Password, bytearray):
@@ -265,6 +595,9 @@ class VigenereCoder:
             self._Codec = CircularList(PassPhrase)
         else:
             self._Codec.setContent(PassPhrase)
+        self._Position = 0
+        self._EncodeKeys = bytes(PassPhrase)
+        self._DecodeKeys = bytes((256 - Code) % 256 for Code in PassPhrase)
 
     def resetIndex(self) -> None:
         """
@@ -273,10 +606,54 @@ class VigenereCoder:
         Signature:
             None -> None
         
-        Version 1.0.0.1
+        Version 1.1.0.0
         """
         if not (self._Codec is None):
             self._Codec.resetCounter()
+        self._Position = 0
+
+    def tell(self) -> int:
+        """
+        Returns the current position within the continuous data feed, i.e. the
+        number of bytes encoded and / or decoded since the pass-phrase has been
+        set or the index has been reset, or the position set by seek().
+
+        Signature:
+            None -> int >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._Position
+
+    def seek(self, Offset: int) -> None:
+        """
+        Sets the current position within the continuous data feed, so the next
+        encoded or decoded byte is treated as the byte at this offset from the
+        start of the stream. The internal index within the pass-phrase is set
+        directly to the offset modulo the pass-phrase length, in a constant
+        time regardless of the offset value.
+
+        Signature:
+            int >= 0 -> None
+        
+        Args:
+            Offset: int >= 0; the position in the data stream (in bytes)
+        
+        Raises:
+            UT_TypeError: the argument is not an integer
+            UT_ValueError: the argument is a negative integer
+            UT_Exception: the pass-phrase is not set yet
+        
+        Version 1.0.0.0
+        """
+        if (not isinstance(Offset, int)) or isinstance(Offset, bool):
+            raise UT_TypeError(Offset, int, SkipFrames = 1)
+        if Offset < 0:
+            raise UT_ValueError(Offset, 'non-negative integer', SkipFrames = 1)
+        if self._Codec is None:
+            raise UT_Exception('Pass-phrase is not set yet', SkipFrames = 1)
+        self._Codec.setCounter(Offset)
+        self._Position = Offset
 
     def encode(self, Data: str, *, Codec: Optional[str] = None) -> bytes:
         """
@@ -303,7 +680,7 @@ class VigenereCoder:
                 incompatible with the passed data string
             UT_Exception: the pass-phrase is not set yet
         
-        Version 1.0.0.1
+        Version 1.1.0.0
         """
         if self._Codec is None:
             raise UT_Exception('Pass-phrase is not set yet', SkipFrames = 1)
@@ -316,15 +693,14 @@ class VigenereCoder:
                 raise UT_TypeError(Codec, str, SkipFrames = 1)
             _Codec = Codec
         try:
-            InputData = bytearray(Data, _Codec)
+            InputData = Data.encode(_Codec)
         except LookupError:
             raise UT_ValueError(_Codec,
                         'a registered Unicode codec', SkipFrames = 1) from None
         except ValueError:
             raise UT_ValueError(_Codec,
                         'a suitable Unicode codec', SkipFrames = 1) from None
-        OutputData = bytes(bytearray((NextByte + self._Codec.getElement()) % 256 
-                                                    for NextByte in InputData))
+        OutputData = bytes(self._shiftBytes(InputData, self._EncodeKeys))
         return OutputData
 
     def decode(self, Data: T_BYTES, *, Codec: Optional[str] = None) -> str:
@@ -349,10 +725,11 @@ class VigenereCoder:
             UT_TypeError: passed mandatory argument is not a bytestring or bytes
                 array, OR the passed keyword argument is not a string or None
             UT_ValueError: the requested Unicode codec is not registered or
-                incompatible with the Vigenere decoded bytestring
+                incompatible with the Vigenere decoded bytestring; in this
+                case the internal index and position are restored
             UT_Exception: the pass-phrase is not set yet
         
-        Version 1.0.0.1
+        Version 1.2.0.0
         """
         if self._Codec is None:
             raise UT_Exception('Pass-phrase is not set yet', SkipFrames = 1)
@@ -364,17 +741,535 @@ class VigenereCoder:
             if not isinstance(Codec, str):
                 raise UT_TypeError(Codec, str, SkipFrames = 1)
             _Codec = Codec
-        if isinstance(Data, bytearray):
-            InputData = Data
-        else:
-            InputData = bytearray(Data)
+        Position = self._Position
         try:
-         OutputData = bytearray((NextByte - self._Codec.getElement()) % 256 
-                                    for NextByte in InputData).decode(_Codec)
+            OutputData = self._shiftBytes(Data,
+                                        self._DecodeKeys).decode(_Codec)
         except LookupError:
+            self.seek(Position)
             raise UT_ValueError(_Codec,
                         'a registered Unicode codec', SkipFrames = 1) from None
         except ValueError:
+            self.seek(Position)
             raise UT_ValueError(_Codec,
                         'a suitable Unicode codec', SkipFrames = 1) from None
         return OutputData
+
+    def encodeBytes(self, Data: T_BUFFER) -> bytes:
+        """
+        Encodes arbitrary binary data using the already set pass-phrase, without
+        any Unicode conversion. Any C-contiguous object supporting the buffer
+        protocol is accepted, e.g. bytes, bytearray, memoryview, array or mmap.
+        The internal index is shared with the method encode().
+
+        Signature:
+            buffer -> bytes
+        
+        Args:
+            Data: buffer; data to be encoded
+        
+        Returns:
+            bytes: the Vigenere encoded data
+        
+        Raises:
+            UT_TypeError: passed argument is not a C-contiguous buffer
+            UT_Exception: the pass-phrase is not set yet
+        
+        Version 1.0.0.0
+        """
+        return bytes(self._processBytes(Data, self._EncodeKeys, None))
+
+    def decodeBytes(self, Data: T_BUFFER) -> bytes:
+        """
+        Decodes arbitrary binary data using the already set pass-phrase, without
+        any Unicode conversion. Any C-contiguous object supporting the buffer
+        protocol is accepted, e.g. bytes, bytearray, memoryview, array or mmap.
+        The internal index is shared with the method decode().
+
+        Signature:
+            buffer -> bytes
+        
+        Args:
+            Data: buffer; data to be decoded
+        
+        Returns:
+            bytes: the Vigenere decoded data
+        
+        Raises:
+            UT_TypeError: passed argument is not a C-contiguous buffer
+            UT_Exception: the pass-phrase is not set yet
+        
+        Version 1.0.0.0
+        """
+        return bytes(self._processBytes(Data, self._DecodeKeys, None))
+
+    def encodeBytesInto(self, Data: T_BUFFER, Output: T_BUFFER) -> int:
+        """
+        Encodes arbitrary binary data using the already set pass-phrase directly
+        into a preallocated writable buffer, without any Unicode conversion and
+        intermediate copies of the whole data. The output may be the input
+        buffer itself (in-place encoding), but not a partially overlapping one.
+
+        Signature:
+            buffer, writable buffer -> int >= 0
+        
+        Args:
+            Data: buffer; data to be encoded, e.g. bytes, bytearray, memoryview
+                or mmap
+            Output: writable buffer; the destination, e.g. bytearray, writable
+                memoryview or mmap, the encoded data is placed at its start
+        
+        Returns:
+            int >= 0: number of the encoded bytes written into the output
+        
+        Raises:
+            UT_TypeError: passed data is not a C-contiguous buffer, OR the
+                output is not a writable C-contiguous buffer
+            UT_ValueError: the output buffer is shorter than the data, in which
+                case neither the output nor the internal index is modified
+            UT_Exception: the pass-phrase is not set yet
+        
+        Version 1.0.0.0
+        """
+        if Output is None:
+            raise UT_TypeError(Output, (bytearray, memoryview), SkipFrames = 1)
+        self._processBytes(Data, self._EncodeKeys, Output)
+        return memoryview(Data).nbytes
+
+    def decodeBytesInto(self, Data: T_BUFFER, Output: T_BUFFER) -> int:
+        """
+        Decodes arbitrary binary data using the already set pass-phrase directly
+        into a preallocated writable buffer, without any Unicode conversion and
+        intermediate copies of the whole data. The output may be the input
+        buffer itself (in-place decoding), but not a partially overlapping one.
+
+        Signature:
+            buffer, writable buffer -> int >= 0
+        
+        Args:
+            Data: buffer; data to be decoded, e.g. bytes, bytearray, memoryview
+                or mmap
+            Output: writable buffer; the destination, e.g. bytearray, writable
+                memoryview or mmap, the decoded data is placed at its start
+        
+        Returns:
+            int >= 0: number of the decoded bytes written into the output
+        
+        Raises:
+            UT_TypeError: passed data is not a C-contiguous buffer, OR the
+                output is not a writable C-contiguous buffer
+            UT_ValueError: the output buffer is shorter than the data, in which
+                case neither the output nor the internal index is modified
+            UT_Exception: the pass-phrase is not set yet
+        
+        Version 1.0.0.0
+        """
+        if Output is None:
+            raise UT_TypeError(Output, (bytearray, memoryview), SkipFrames = 1)
+        self._processBytes(Data, self._DecodeKeys, Output)
+        return memoryview(Data).nbytes
+
+    def decodeRange(self, Data: T_BUFFER, Start: int, Length: int) -> bytes:
+        """
+        Decodes a window of the ciphered data (binary, without the Unicode
+        conversion) given by its offset from the start of the data stream and
+        its length, e.g. a part of a memory-mapped file, without processing
+        the preceding data. The pass-phrase index is calculated as the offset
+        modulo the pass-phrase length; the internal index and the position
+        within the continuous data feed (see tell()) are not changed. Only the
+        window itself is read and copied.
+
+        Signature:
+            buffer, int >= 0, int >= 0 -> bytes
+        
+        Args:
+            Data: buffer; the entire ciphered data starting from the beginning
+                of the stream, e.g. mmap, bytes, bytearray or memoryview
+            Start: int >= 0; offset of the window from the start of the data
+            Length: int >= 0; length of the window in bytes
+        
+        Returns:
+            bytes: the Vigenere decoded window
+        
+        Raises:
+            UT_TypeError: passed data is not a C-contiguous buffer, OR the
+                start or length is not an integer
+            UT_ValueError: the start or length is negative, OR the window
+                exceeds the data
+            UT_Exception: the pass-phrase is not set yet
+        
+        Version 1.0.0.0
+        """
+        if self._Codec is None:
+            raise UT_Exception('Pass-phrase is not set yet', SkipFrames = 1)
+        Buffer = self._getBuffer(Data)
+        for Value in (Start, Length):
+            if (not isinstance(Value, int)) or isinstance(Value, bool):
+                raise UT_TypeError(Value, int, SkipFrames = 1)
+            if Value < 0:
+                raise UT_ValueError(Value, 'non-negative integer',
+                                                                SkipFrames = 1)
+        if Start + Length > len(Buffer):
+            raise UT_ValueError(Start + Length,
+                    'window end not exceeding {}'.format(len(Buffer)),
+                                                                SkipFrames = 1)
+        Window = Buffer[Start : Start + Length]
+        Result = bytes(self._shiftBytes(Window, self._DecodeKeys,
+                                                                Index = Start))
+        if isinstance(Window, memoryview):
+            Window.release()
+        return Result
+
+class VigenereTextReader(io.TextIOBase):
+    """
+    Read-only text stream, which decodes a Vigenere ciphered binary stream
+    chunk by chunk. Each chunk is deciphered by a VigenereCoder instance and
+    then converted into a string by an incremental Unicode decoder (see the
+    standard library codecs.getincrementaldecoder()), so a multi-byte character
+    split by a chunk boundary is decoded correctly, and the memory usage is
+    bounded by the chunk size unless the entire content is requested.
+
+    If the deciphered data is not valid for the Unicode codec (and the errors
+    handling scheme is 'strict'), the internal index and position of the coder
+    as well as the state of the Unicode decoder are restored, the offending
+    chunk is kept for the next attempt, and a custom version of ValueError is
+    raised with the offset of the invalid data in the ciphered stream.
+
+    The coder can be passed as an instance, in this case its current position
+    is treated as the start of the stream, or as a pass-phrase, in this case a
+    new instance is created. The closing of the reader closes the wrapped
+    binary stream as well.
+
+    Properties:
+        encoding: str; the name of the Unicode codec, read-only
+        errors: str; the errors handling scheme, read-only
+
+    Methods:
+        readable():
+            None -> bool
+        read(size = -1):
+            /int OR None/ -> str
+        readline(size = -1):
+            /int OR None/ -> str
+        close():
+            None -> None
+    
+    Version 1.0.1.0
+    """
+    
+    #special methods
+
+    def __init__(self, Stream: io.IOBase,
+                        Coder: Union[VigenereCoder, T_PASSWORD], *,
+                        Encoding: Optional[str] = None,
+                        Errors: str = 'strict',
+                        ChunkSize: int = 65536) -> None:
+        """
+        Initializer.
+
+        Signature:
+            binary stream, VigenereCoder OR str OR bytes OR bytearray/, *,
+                str OR None, str, int > 0/ -> None
+        
+        Args:
+            Stream: binary stream; any object with the method read(size),
+                returning the ciphered data as bytes or another buffer, e.g.
+                a file opened in the binary mode or io.BytesIO
+            Coder: VigenereCoder OR str OR bytes OR bytearray; the coder
+                instance with the pass-phrase already set, OR the pass-phrase
+                for a new coder
+            Encoding: (keyword) str OR None; name of the Unicode codec, if None
+                or not indicated - the default UTF-8 is used
+            Errors: (keyword) str; name of the errors handling scheme of the
+                Unicode codec, defaults to 'strict'
+            ChunkSize: (keyword) int > 0; number of bytes read from the stream
+                at once, defaults to 65536
+        
+        Raises:
+            UT_TypeError: the stream has no method read(), OR the coder is
+                neither VigenereCoder instance nor a pass-phrase, OR any of the
+                keyword arguments is of the wrong type
+            UT_ValueError: the Unicode codec or the errors handling scheme is
+                not registered, OR the chunk size is not positive
+            UT_Exception: the pass-phrase of the coder instance is not set yet
+        
+        Version 1.0.0.0
+        """
+        if not callable(getattr(Stream, 'read', None)):
+            raise UT_TypeError(Stream, io.IOBase, SkipFrames = 1)
+        if isinstance(Coder, (str, bytes, bytearray)):
+            Coder = VigenereCoder(Coder)
+        elif not isinstance(Coder, VigenereCoder):
+            raise UT_TypeError(Coder,
+                        (VigenereCoder, str, bytes, bytearray), SkipFrames = 1)
+        elif Coder._Codec is None:
+            raise UT_Exception('Pass-phrase is not set yet', SkipFrames = 1)
+        if Encoding is None:
+            Encoding = 'utf_8'
+        elif not isinstance(Encoding, str):
+            raise UT_TypeError(Encoding, str, SkipFrames = 1)
+        if not isinstance(Errors, str):
+            raise UT_TypeError(Errors, str, SkipFrames = 1)
+        if (not isinstance(ChunkSize, int)) or isinstance(ChunkSize, bool):
+            raise UT_TypeError(ChunkSize, int, SkipFrames = 1)
+        if ChunkSize <= 0:
+            raise UT_ValueError(ChunkSize, 'positive integer', SkipFrames = 1)
+        try:
+            Decoder = codecs.getincrementaldecoder(Encoding)
+        except LookupError:
+            raise UT_ValueError(Encoding,
+                        'a registered Unicode codec', SkipFrames = 1) from None
+        try:
+            codecs.lookup_error(Errors)
+        except LookupError:
+            raise UT_ValueError(Errors,
+                    'a registered errors handling scheme', SkipFrames = 1
+                                                                    ) from None
+        super().__init__()
+        self._Stream = Stream
+        self._Coder = Coder
+        self._Encoding = Encoding
+        self._Errors = Errors
+        self._ChunkSize = ChunkSize
+        self._Decoder = Decoder(Errors)
+        self._Start = Coder.tell()
+        self._Text = ''
+        self._Offset = 0
+        self._Unread = b''
+        self._EOF = False
+
+    #private methods
+
+    def _readChunk(self) -> str:
+        """
+        Helper method to read the next chunk of the ciphered data (or to retry
+        the previously failed one) and to decode it. The empty string is
+        returned when the stream is exhausted; it may also be returned, when
+        the chunk contains only a part of a multi-byte character.
+
+        Signature:
+            None -> str
+        
+        Returns:
+            str: the decoded text of the chunk
+        
+        Raises:
+            UT_ValueError: the deciphered data is not valid for the Unicode
+                codec; the state of the coder and the decoder is restored
+        
+        Version 1.0.0.0
+        """
+        if self._EOF:
+            return ''
+        if len(self._Unread):
+            Chunk = self._Unread
+        else:
+            Chunk = self._Stream.read(self._ChunkSize)
+        self._Unread = b''
+        Final = not len(Chunk)
+        Position = self._Coder.tell()
+        State = self._Decoder.getstate()
+        try:
+            Result = self._Decoder.decode(self._Coder.decodeBytes(Chunk),
+                                                                        Final)
+        except UnicodeDecodeError as err:
+            self._Coder.seek(Position)
+            self._Decoder.setstate(State)
+            self._Unread = Chunk
+            Offset = Position - self._Start - len(State[0]) + err.start
+            raise UT_ValueError(self._Encoding,
+                'a Unicode codec suitable for the data at the offset {}'.format(
+                                            Offset), SkipFrames = 2) from None
+        self._EOF = Final
+        return Result
+
+    def _fillText(self) -> None:
+        """
+        Helper method to append the next decoded chunk to the text buffer. The
+        already returned part of the buffer is discarded only at this moment,
+        so the reading methods merely advance the offset within the buffer
+        instead of copying its remainder on each call. The buffer is not
+        changed, if the decoding fails.
+
+        Signature:
+            None -> None
+        
+        Raises:
+            UT_ValueError: the deciphered data is not valid for the Unicode
+                codec; the state of the coder and the decoder is restored
+        
+        Version 1.0.0.0
+        """
+        Text = self._readChunk()
+        self._Text = self._Text[self._Offset:] + Text
+        self._Offset = 0
+
+    def _checkSize(self, Size: Optional[int]) -> int:
+        """
+        Helper method to check the size argument of the reading methods and to
+        check that the reader is not closed.
+
+        Signature:
+            int OR None -> int
+        
+        Returns:
+            int: the size, -1 meaning no limit
+        
+        Raises:
+            UT_TypeError: the size is neither an integer nor None
+            ValueError: the reader is closed
+        
+        Version 1.0.0.0
+        """
+        if self.closed:
+            raise ValueError('I/O operation on closed file.')
+        if Size is None:
+            Size = -1
+        elif (not isinstance(Size, int)) or isinstance(Size, bool):
+            raise UT_TypeError(Size, (int, type(None)), SkipFrames = 2)
+        return Size if Size >= 0 else -1
+
+    #public API
+
+    @property
+    def encoding(self) -> str:
+        """
+        Getter property for the name of the Unicode codec.
+
+        Signature:
+            None -> str
+        
+        Version 1.0.0.0
+        """
+        return self._Encoding
+
+    @property
+    def errors(self) -> str:
+        """
+        Getter property for the name of the errors handling scheme.
+
+        Signature:
+            None -> str
+        
+        Version 1.0.0.0
+        """
+        return self._Errors
+
+    def readable(self) -> bool:
+        """
+        Returns True, the stream is always readable.
+
+        Signature:
+            None -> bool
+        
+        Version 1.0.0.0
+        """
+        return True
+
+    def read(self, size: Optional[int] = -1) -> str:
+        """
+        Reads and returns at most the specified number of characters. If the
+        size is negative or None, reads until the end of the stream. The empty
+        string is returned only at the end of the stream.
+
+        Signature:
+            /int OR None/ -> str
+        
+        Args:
+            size: (optional) int OR None; the maximum number of characters,
+                defaults to -1 (all)
+        
+        Returns:
+            str: the decoded text
+        
+        Raises:
+            UT_TypeError: the size is neither an integer nor None
+            UT_ValueError: the deciphered data is not valid for the Unicode
+                codec
+            ValueError: the reader is closed
+        
+        Version 1.0.1.0
+        """
+        Size = self._checkSize(size)
+        if Size < 0:
+            Parts = [self._Text[self._Offset:]]
+            self._Text = ''
+            self._Offset = 0
+            try:
+                while not self._EOF:
+                    Parts.append(self._readChunk())
+            except Exception:
+                #the already decoded text is kept for the next attempt
+                self._Text = ''.join(Parts)
+                raise
+            return ''.join(Parts)
+        while len(self._Text) - self._Offset < Size and not self._EOF:
+            self._fillText()
+        End = min(self._Offset + Size, len(self._Text))
+        Result = self._Text[self._Offset : End]
+        self._Offset = End
+        return Result
+
+    def readline(self, size: Optional[int] = -1) -> str:
+        """
+        Reads and returns the next line including the line feed character, but
+        at most the specified number of characters, if the size is not negative
+        or None. The line end characters are not translated, i.e. the line
+        ended by '\\r\\n' retains both characters. The empty string is
+        returned only at the end of the stream. The iteration over the reader
+        yields the lines.
+
+        Signature:
+            /int OR None/ -> str
+        
+        Args:
+            size: (optional) int OR None; the maximum number of characters,
+                defaults to -1 (no limit)
+        
+        Returns:
+            str: the decoded line
+        
+        Raises:
+            UT_TypeError: the size is neither an integer nor None
+            UT_ValueError: the deciphered data is not valid for the Unicode
+                codec
+            ValueError: the reader is closed
+        
+        Version 1.0.1.0
+        """
+        Size = self._checkSize(size)
+        Start = self._Offset
+        while True:
+            Index = self._Text.find('\n', Start)
+            if Index >= 0:
+                End = Index + 1
+                break
+            Length = len(self._Text) - self._Offset
+            if self._EOF or (0 <= Size <= Length):
+                End = len(self._Text)
+                break
+            self._fillText()
+            Start = Length
+        if 0 <= Size < End - self._Offset:
+            End = self._Offset + Size
+        Result = self._Text[self._Offset : End]
+        self._Offset = End
+        return Result
+
+    def close(self) -> None:
+        """
+        Closes the reader and the wrapped binary stream. Has no effect, if the
+        reader is already closed.
+
+        Signature:
+            None -> None
+        
+        Version 1.0.0.0
+        """
+        if not self.closed:
+            try:
+                Close = getattr(self._Stream, 'close', None)
+                if callable(Close):
+                    Close()
+            finally:
+                super().close()
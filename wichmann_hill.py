@@ -28,7 +28,7 @@ from typing import Union, Sequence, List, Any
 import collections.abc as c_abc
 #import copy
 
-#+ other DO libraries
+#+ other DO libraries (optional) - exceptions with the traceback analysis
 
 LIB_FOLDER = os.path.dirname(os.path.realpath(__file__))
 ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
@@ -36,7 +36,7 @@ ROOT_FOLDER = os.path.dirname(LIB_FOLDER)
 if not (ROOT_FOLDER in sys.path):
     sys.path.append(ROOT_FOLDER)
 
-from introspection_lib.base_exceptions import UT_TypeError, UT_ValueError
+from codecs_lib._exceptions import UT_TypeError, UT_ValueError
 
 #types
 